@@ -0,0 +1,76 @@
+import argparse
+import sys
+from src.controllers.system_controller import SystemController
+from utils.logger.logger import Logger
+
+
+def parse_args(argv=None):
+    """
+    Parses the batch run command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run FibriNet degradation experiments without a user interface.")
+    parser.add_argument("input", help="network file, or folder of network files")
+    parser.add_argument("--engine", help="degradation engine strategy, e.g. NoPhysics")
+    parser.add_argument("--script", help="file with one batch command per line")
+    parser.add_argument("--edges", help="comma separated edge ids to degrade in order")
+    parser.add_argument("--nodes", help="comma separated node ids to degrade in order")
+    parser.add_argument("--random-edges", type=int, help="number of random edges to degrade")
+    parser.add_argument("--random-nodes", type=int, help="number of random nodes to degrade")
+    parser.add_argument("--seed", help="seed for random degradations")
+    parser.add_argument("--export", action="append", nargs=2, metavar=("DATA_STRATEGY", "IMAGE_STRATEGY"),
+                        help="export strategies, e.g. excel_data_export_strategy png_image_export_strategy or fnet_data_export_strategy none")
+    parser.add_argument("--export-folder", help="folder that receives one export folder per network")
+    parser.add_argument("--report", help="CSV file for the per step timings")
+    parser.add_argument("--log", action="store_true", help="enable file logging")
+    return parser.parse_args(argv)
+
+
+def build_script(args):
+    """
+    Builds the batch script from the script file and the degradation arguments, in that order.
+    """
+    script = []
+    if args.script:
+        with open(args.script) as script_file:
+            script.extend(line.strip() for line in script_file
+                          if line.strip() and not line.lstrip().startswith("#"))
+    if args.edges:
+        script.extend(f"degrade_edge {edge_id.strip()}" for edge_id in args.edges.split(",") if edge_id.strip())
+    if args.nodes:
+        script.extend(f"degrade_node {node_id.strip()}" for node_id in args.nodes.split(",") if node_id.strip())
+    seed = f" {args.seed}" if args.seed is not None else ""
+    if args.random_edges:
+        script.append(f"random_edges {args.random_edges}{seed}")
+    if args.random_nodes:
+        script.append(f"random_nodes {args.random_nodes}{seed}")
+    return script
+
+
+def main(argv=None):
+    """
+    Entry point to the FibriNet batch runner.
+    """
+    args = parse_args(argv)
+
+    # CONFIGURES LOGGER WITH DEFAULT FILE STORAGE
+    Logger.initialize()
+    if not args.log:
+        Logger.disable_logging()
+
+    # INITIALIZE THE SCI
+    controller = SystemController()
+
+    # RUN THE BATCH VIEW
+    controller.initiate_view(
+        "batch",
+        input_path=args.input,
+        script=build_script(args),
+        engine=args.engine,
+        exports=args.export,
+        export_folder=args.export_folder,
+        report_path=args.report,
+    )
+    return 1 if controller.view_manager.view_strategy.failed_networks else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+import time
+import numpy as np
+from src.managers.network.degradation_engine.two_dimensional_spring_force_degradation_engine_without_biomechanics import TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+from utils.logger.logger import Logger
+
+
+def parse_args(argv=None):
+    """
+    Parses the benchmark command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Measure how the spring force kernel scales with the number of threads.")
+    parser.add_argument("--nodes", type=int, default=1_000_000, help="approximate node count of the square lattice")
+    parser.add_argument("--workers", help="comma separated thread counts, powers of two up to the CPU count by default")
+    parser.add_argument("--repeat", type=int, default=5, help="force evaluations timed per thread count")
+    parser.add_argument("--chunk-edges", type=int, help="edges per kernel chunk, the engine default if not given")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the node displacements")
+    return parser.parse_args(argv)
+
+
+def build_lattice(node_count, seed):
+    """
+    Builds the force kernel arrays of a square lattice with randomly displaced nodes,
+    about two springs per node.
+
+    Returns:
+        tuple: (positions, edge_from, edge_to, rest_lengths).
+    """
+    side = max(int(np.sqrt(node_count)), 2)
+    rows = np.arange(side * side).reshape(side, side)
+    edge_from = np.concatenate([rows[:, :-1].ravel(), rows[:-1, :].ravel()])
+    edge_to = np.concatenate([rows[:, 1:].ravel(), rows[1:, :].ravel()])
+    order = np.argsort(edge_from, kind="stable")
+    xs, ys = np.meshgrid(np.arange(side, dtype=np.float64), np.arange(side, dtype=np.float64))
+    positions = np.column_stack([xs.ravel(), ys.ravel()])
+    positions += np.random.default_rng(seed).normal(scale=0.05, size=positions.shape)
+    return positions, edge_from[order], edge_to[order], np.full(len(edge_from), 0.95)
+
+
+def main(argv=None):
+    """
+    Entry point to the force kernel scaling benchmark.
+    """
+    args = parse_args(argv)
+    Logger.disable_logging()
+
+    if args.workers:
+        worker_counts = [int(workers) for workers in args.workers.split(",") if workers.strip()]
+    else:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [1 << power for power in range(cpu_count.bit_length()) if 1 << power <= cpu_count]
+
+    positions, edge_from, edge_to, rest_lengths = build_lattice(args.nodes, args.seed)
+    print(f"{len(positions)} nodes, {len(edge_from)} edges, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'identical':>10}")
+
+    reference = None
+    baseline = None
+    for workers in worker_counts:
+        engine = TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics(force_workers=workers)
+        if args.chunk_edges:
+            engine.FORCE_CHUNK_EDGES = args.chunk_edges
+
+        # THE FIRST EVALUATION STARTS THE THREAD POOL AND IS NOT TIMED
+        forces = engine.compute_spring_forces(positions, edge_from, edge_to, rest_lengths, 1.0)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            engine.compute_spring_forces(positions, edge_from, edge_to, rest_lengths, 1.0)
+        seconds = (time.perf_counter() - start) / args.repeat
+
+        if reference is None:
+            reference, baseline = forces, seconds
+        print(f"{workers:>8} {seconds:>10.4f} {baseline / seconds:>8.2f} {str(np.array_equal(forces, reference)):>10}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
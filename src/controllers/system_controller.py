@@ -4,6 +4,7 @@ from src.managers.export.export_manager import ExportManager
 from src.managers.network.network_manager import NetworkManager
 from utils.logger.logger import Logger
 from utils.logger.local_file_strategy import LocalFileStrategy
+from utils.logger.queued_file_strategy import QueuedFileStrategy
 from src.models.system_state import SystemState
 from src.models.exceptions import StateTransitionError
 from src.managers.network.networks.base_network import BaseNetwork
@@ -67,7 +68,7 @@ class SystemController:
         if self.system_state.network_loaded:
             self.network_manager.add_node(node)
         else:
-            Logger.log("StateTransitionError: Cannot add node, network not loaded.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot add node, network not loaded.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end controller add_node(self, node)")
 
@@ -80,7 +81,7 @@ class SystemController:
         if self.system_state.network_loaded:
             self.network_manager.add_edge(edge)
         else:
-            Logger.log("StateTransitionError: Cannot add edge, network not loaded.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot add edge, network not loaded.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end controller add_edge(self, edge)")
 
@@ -98,7 +99,7 @@ class SystemController:
         if self.system_state.network_loaded:
             self.network_manager.degrade_edge(edge_id)
         else:
-            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end degrade_edge(self, {edge_id})")
 
@@ -115,10 +116,46 @@ class SystemController:
         if self.system_state.network_loaded:
             self.network_manager.degrade_node(node_id)
         else:
-            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end degrade_node(self, {node_id})")
 
+    # DEGRADES SEVERAL NETWORK EDGES IN ONE STEP IF STATE ALLOWS
+    def degrade_edges(self, edge_ids):
+        """
+        Degrades several network edges as one step if the network is loaded.
+        
+        :param edge_ids: The ids of the edges to be degraded.
+        :raises StateTransitionError: If the network is not loaded.
+        :raises EdgeNotFoundError: If any edge id is not in the network. Nothing is degraded.
+        """
+        
+        Logger.log("start degrade_edges(self, %s)", edge_ids)
+        if self.system_state.network_loaded:
+            self.network_manager.degrade_edges(edge_ids)
+        else:
+            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", priority=Logger.LogPriority.ERROR)
+            raise StateTransitionError()
+        Logger.log("end degrade_edges(self, edge_ids)")
+
+    # DEGRADES SEVERAL NETWORK NODES IN ONE STEP IF STATE ALLOWS
+    def degrade_nodes(self, node_ids):
+        """
+        Degrades several network nodes as one step if the network is loaded.
+        
+        :param node_ids: The ids of the nodes to be degraded.
+        :raises StateTransitionError: If the network is not loaded.
+        :raises NodeNotFoundError: If any node id is not in the network. Nothing is degraded.
+        """
+        
+        Logger.log("start degrade_nodes(self, %s)", node_ids)
+        if self.system_state.network_loaded:
+            self.network_manager.degrade_nodes(node_ids)
+        else:
+            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", priority=Logger.LogPriority.ERROR)
+            raise StateTransitionError()
+        Logger.log("end degrade_nodes(self, node_ids)")
+
     # UNDOES THE LAST NETWORK DEGRADATION IF STATE ALLOWS
     def undo_degradation(self):
         """
@@ -131,7 +168,7 @@ class SystemController:
         if self.system_state.network_loaded:
             self.network_manager.undo_degradation()
         else:
-            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end undo_degradation(self)")
 
@@ -148,7 +185,7 @@ class SystemController:
         if self.system_state.network_loaded:
             self.network_manager.redo_degradation()
         else:
-            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot modify network, network not loaded.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end redo_degradation(self)")
     
@@ -178,20 +215,21 @@ class SystemController:
             self.export_manager.handle_export_request(self.network_manager.state_manager.network_state_history, export_request)
             Logger.log("Export request processed successfully.")
         else:
-            Logger.log("StateTransitionError: Cannot export data, invalid state.", Logger.LogPriority.ERROR)
+            Logger.log("StateTransitionError: Cannot export data, invalid state.", priority=Logger.LogPriority.ERROR)
             raise StateTransitionError()
         Logger.log(f"end export_data(self, export_request)")
 
     # SUBMITS A VIEW REQUEST TO THE VIEW MANAGER
-    def initiate_view(self, view_strategy):
+    def initiate_view(self, view_strategy, **view_options):
         """
          Submits a view request to the view manager.
         
         :param view: Type of view requested (e.g., CLI, etc.).
+        :param view_options: Keyword arguments passed to the view (e.g., the batch configuration).
         """
         
         Logger.log(f"start initiate_view(self, {view_strategy})")
-        self.view_manager.initiate_view_strategy(view_strategy, self)
+        self.view_manager.initiate_view_strategy(view_strategy, self, **view_options)
         Logger.log(f"end initiate_view(self, view_strategy)")
 
     # CONFIGURES Logger BASED ON PROVIDED SETTINGS
@@ -207,6 +245,14 @@ class SystemController:
         Logger.log(f"start configure_Logger(self, {enabled}, {kwargs})")
         if enabled: Logger.enable_logging()
         else: Logger.disable_logging()
+        minimum_priority = kwargs.get("minimum_priority", None)
+        if minimum_priority is not None:
+            # ACCEPTS A LogPriority OR ITS NAME, E.G. "TRACE"
+            if isinstance(minimum_priority, str):
+                if minimum_priority.upper() not in Logger.LogPriority.__members__:
+                    raise ValueError(f"Invalid log priority: '{minimum_priority}'")
+                minimum_priority = Logger.LogPriority[minimum_priority.upper()]
+            Logger.set_minimum_priority(minimum_priority)
         storage_strategy = kwargs.get("storage_strategy", None)
         if storage_strategy is not None:
             if storage_strategy == "file":
@@ -217,6 +263,20 @@ class SystemController:
                 # SETS FILE-BASED LOGGING STRATEGY
                 Logger.set_log_storage_strategy(LocalFileStrategy(file_location))
                 Logger.log(f"Logger set to file storage at {file_location}.")
+            elif storage_strategy == "queued_file":
+                file_location = kwargs.get("file_location", None)
+                if not file_location:
+                    raise ValueError("file_location must be provided for 'queued_file' storage strategy.")
+
+                # SETS FILE-BASED LOGGING STRATEGY WRITTEN BY A BACKGROUND THREAD
+                Logger.set_log_storage_strategy(QueuedFileStrategy(
+                    file_location,
+                    max_queue_size=kwargs.get("max_queue_size", 100000),
+                    overflow_policy=kwargs.get("overflow_policy", QueuedFileStrategy.BLOCK),
+                ))
+                Logger.log(f"Logger set to queued file storage at {file_location}.")
+            else:
+                raise ValueError(f"Invalid storage strategy: '{storage_strategy}'")
         else:
             # DEFAULT ONLY ENABLES / DISABLES CURRENT LOGGING STRATEGY
             pass
@@ -2,6 +2,7 @@ from .data_export_strategy import DataExportStrategy
 import pandas as pd
 import io
 from ..network.networks.base_network import BaseNetwork
+from ..network.networks.network_arrays import NetworkArrays
 from io import BytesIO
 from utils.logger.logger import Logger
 import time
@@ -17,30 +18,16 @@ class ExcelExportStrategy(DataExportStrategy):
         for idx, network in enumerate(network_state_history):
             Logger.log(f"Processing network: {network}")
 
-            # Extract schema information for metadata, nodes, and edges
-            nodes_data = network.get_nodes()  # List of node objects
-            edges_data = network.get_edges()  # List of edge objects
-            meta_data = network.get_meta_data()  # Metadata dictionary
-
-            Logger.log(f"Number of nodes: {len(nodes_data)}")
-            Logger.log(f"Number of edges: {len(edges_data)}")
-            Logger.log(f"Metadata: {meta_data}")
-
-            # Clean the nodes and edges data to exclude the 'attributes' field
-            Logger.log("Cleaning nodes data (excluding 'attributes' field)")
-            nodes_df = pd.DataFrame(
-                [{key: value for key, value in node.get_attributes().items() if key != 'attributes'}
-                 for node in nodes_data]
-            )
-            Logger.log(f"Processed nodes dataframe with {len(nodes_df)} rows")
-
-            # Convert edges data to pandas DataFrame, excluding the 'attributes' field
-            Logger.log("Cleaning edges data (excluding 'attributes' field)")
-            edges_df = pd.DataFrame(
-                [{key: value for key, value in edge.get_attributes().items() if key != 'attributes'}
-                 for edge in edges_data]
-            )
-            Logger.log(f"Processed edges dataframe with {len(edges_df)} rows")
+            # Array backed networks already hold their tables as columns
+            if isinstance(network, NetworkArrays):
+                meta_data = network.get_meta_data()
+                Logger.log(f"Number of nodes: {network.get_node_count()}")
+                Logger.log(f"Number of edges: {network.get_edge_count()}")
+                Logger.log(f"Metadata: {meta_data}")
+                nodes_df = pd.DataFrame(network.get_node_columns())
+                edges_df = pd.DataFrame(network.get_edge_columns())
+            else:
+                nodes_df, edges_df, meta_data = self._get_object_tables(network)
 
             # Convert metadata to DataFrame
             Logger.log("Converting metadata to dataframe")
@@ -80,3 +67,32 @@ class ExcelExportStrategy(DataExportStrategy):
         Logger.log("Excel export generation completed")
 
         return files
+
+    def _get_object_tables(self, network: BaseNetwork):
+        """Builds the node and edge dataframes of an object based network."""
+        # Extract schema information for metadata, nodes, and edges
+        nodes_data = network.get_nodes()  # List of node objects
+        edges_data = network.get_edges()  # List of edge objects
+        meta_data = network.get_meta_data()  # Metadata dictionary
+
+        Logger.log(f"Number of nodes: {len(nodes_data)}")
+        Logger.log(f"Number of edges: {len(edges_data)}")
+        Logger.log(f"Metadata: {meta_data}")
+
+        # Clean the nodes and edges data to exclude the 'attributes' field
+        Logger.log("Cleaning nodes data (excluding 'attributes' field)")
+        nodes_df = pd.DataFrame(
+            [{key: value for key, value in node.get_attributes().items() if key != 'attributes'}
+             for node in nodes_data]
+        )
+        Logger.log(f"Processed nodes dataframe with {len(nodes_df)} rows")
+
+        # Convert edges data to pandas DataFrame, excluding the 'attributes' field
+        Logger.log("Cleaning edges data (excluding 'attributes' field)")
+        edges_df = pd.DataFrame(
+            [{key: value for key, value in edge.get_attributes().items() if key != 'attributes'}
+             for edge in edges_data]
+        )
+        Logger.log(f"Processed edges dataframe with {len(edges_df)} rows")
+
+        return nodes_df, edges_df, meta_data
@@ -1,4 +1,5 @@
 from .excel_export_strategy import ExcelExportStrategy
+from .fnet_export_strategy import FnetExportStrategy
 from .png_export_strategy import PngExportStrategy
 from utils.logger.logger import Logger
 
@@ -10,7 +11,8 @@ class ExportRequestInterpreter:
 
     # VALID DATA EXPORT STRATEGIES
     VALID_DATA_STRATEGIES = {
-        "excel_data_export_strategy": ExcelExportStrategy
+        "excel_data_export_strategy": ExcelExportStrategy,
+        "fnet_data_export_strategy": FnetExportStrategy,
     }
 
     # VALID IMAGE EXPORT STRATEGIES
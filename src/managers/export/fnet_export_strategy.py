@@ -0,0 +1,26 @@
+from .data_export_strategy import DataExportStrategy
+from ..network.networks.base_network import BaseNetwork
+from ..network.fnet_file import FnetFile
+from utils.logger.logger import Logger
+import time
+
+class FnetExportStrategy(DataExportStrategy):
+    def generate_export(self, network_state_history: list[BaseNetwork]):
+        """Generates one FibriNet binary network file (.fnet) per network, see FnetFile."""
+        files = []
+
+        Logger.log("Starting fnet export generation")
+
+        for idx, network in enumerate(network_state_history):
+            Logger.log(f"Processing network: {network}")
+
+            # Generate unique filename with a timestamp or index to prevent overwriting
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            unique_filename = f"network_data_{timestamp}_{idx+1}{FnetFile.FILE_EXTENSION}"
+            files.append((unique_filename, FnetFile.to_bytes(network)))
+
+            Logger.log(f"Fnet export generated successfully for this network. Saved as {unique_filename}")
+
+        Logger.log("Fnet export generation completed")
+
+        return files
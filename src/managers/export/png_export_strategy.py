@@ -1,5 +1,6 @@
 from PIL import Image, ImageDraw
 from ..network.networks.base_network import BaseNetwork
+from ..network.networks.network_arrays import NetworkArrays
 from .image_export_strategy import ImageExportStrategy
 import io
 
@@ -22,45 +23,57 @@ class PngExportStrategy(ImageExportStrategy):
 
     def _create_network_image(self, network: BaseNetwork, padding=50, scale=10):
         """Creates an image of a network state with dynamically adjusted width and height."""
-        if not network.nodes:
+        node_points, edge_segments = self._get_drawing_data(network)
+        if not node_points:
             return Image.new("RGB", (100, 100), "white")  # Return a blank image if no nodes exist
 
-        nodes = {node.n_id: node for node in network.nodes}
-        edges = {edge.e_id: edge for edge in network.edges}
-
         # Determine min and max coordinates
-        min_x = min(node.n_x for node in nodes.values())
-        max_x = max(node.n_x for node in nodes.values())
-        min_y = min(node.n_y for node in nodes.values())
-        max_y = max(node.n_y for node in nodes.values())
+        min_x = min(x for x, _ in node_points)
+        max_x = max(x for x, _ in node_points)
+        min_y = min(y for _, y in node_points)
+        max_y = max(y for _, y in node_points)
 
         # Compute image dimensions with padding
         width = (max_x - min_x) * scale + 2 * padding
         height = (max_y - min_y) * scale + 2 * padding
 
-        img = Image.new("RGB", (width, height), "white")
+        img = Image.new("RGB", (int(width), int(height)), "white")
         draw = ImageDraw.Draw(img)
 
         # Draw edges
-        for edge in edges.values():
-            node_from = nodes[edge.n_from]
-            node_to = nodes[edge.n_to]
-
-            x1 = (node_from.n_x - min_x) * scale + padding
-            y1 = height - ((node_from.n_y - min_y) * scale + padding)  # Invert Y-coordinate
-            x2 = (node_to.n_x - min_x) * scale + padding
-            y2 = height - ((node_to.n_y - min_y) * scale + padding)  # Invert Y-coordinate
+        for (from_x, from_y), (to_x, to_y) in edge_segments:
+            x1 = (from_x - min_x) * scale + padding
+            y1 = height - ((from_y - min_y) * scale + padding)  # Invert Y-coordinate
+            x2 = (to_x - min_x) * scale + padding
+            y2 = height - ((to_y - min_y) * scale + padding)  # Invert Y-coordinate
 
             draw.line((x1, y1, x2, y2), fill="black", width=3)
 
         # Draw nodes
-        for node in nodes.values():
-            x = (node.n_x - min_x) * scale + padding
-            y = height - ((node.n_y - min_y) * scale + padding)  # Invert Y-coordinate
+        for node_x, node_y in node_points:
+            x = (node_x - min_x) * scale + padding
+            y = height - ((node_y - min_y) * scale + padding)  # Invert Y-coordinate
 
             draw.ellipse([x-5, y-5, x+5, y+5], fill="black", outline="black")
 
         return img
+
+    def _get_drawing_data(self, network):
+        """Returns the node points and edge segments (pairs of points) of a network."""
+        # Array backed networks resolve every edge endpoint with one fancy index
+        if isinstance(network, NetworkArrays):
+            positions = network.positions
+            node_points = positions.tolist()
+            edge_segments = zip(positions[network.edge_from].tolist(), positions[network.edge_to].tolist())
+            return node_points, list(edge_segments)
+
+        nodes = {node.n_id: node for node in network.nodes}
+        node_points = [(node.n_x, node.n_y) for node in nodes.values()]
+        edge_segments = [
+            ((nodes[edge.n_from].n_x, nodes[edge.n_from].n_y), (nodes[edge.n_to].n_x, nodes[edge.n_to].n_y))
+            for edge in network.edges
+        ]
+        return node_points, edge_segments
     
     def _combine_images_vertically(self, image_list):
         """Combines multiple images into one vertically stacked image."""
@@ -0,0 +1,276 @@
+from utils.logger.logger import Logger
+from ...models.exceptions import InvalidInputDataError
+from ..network.network_factory import NetworkFactory
+from .data_processing_strategy import DataProcessingStrategy
+import csv
+import os
+import numpy as np
+import pandas as pd
+
+class GrowingColumn:
+    """
+    Typed column that chunks are appended to, doubling its capacity when full.
+
+    The dtype widens as chunks arrive, e.g. int64 to float64 when a chunk has blanks
+    and to object when it has text, so no chunk is kept around as text or DataFrame.
+    """
+
+    # CAPACITY OF A NEW COLUMN
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        """
+        Initializes an empty column.
+        """
+        self.values = None
+        self.size = 0
+
+    def append(self, values):
+        """
+        Appends a chunk of values.
+
+        Params:
+            values: 1D array of the chunk.
+        """
+        values = np.asarray(values)
+        if self.values is None:
+            self.values = np.empty(max(self.INITIAL_CAPACITY, len(values)), dtype=values.dtype)
+        dtype = np.result_type(self.values.dtype, values.dtype)
+        if dtype != self.values.dtype:
+            self.values = self.values.astype(dtype)
+
+        # DOUBLE THE CAPACITY UNTIL THE CHUNK FITS
+        end = self.size + len(values)
+        if end > len(self.values):
+            capacity = len(self.values)
+            while capacity < end:
+                capacity *= 2
+            grown = np.empty(capacity, dtype=self.values.dtype)
+            grown[:self.size] = self.values[:self.size]
+            self.values = grown
+        self.values[self.size:end] = values
+        self.size = end
+
+    def finish(self):
+        """Returns the column trimmed to its values."""
+        if self.values is None:
+            return np.empty(0)
+        if self.values.dtype == object:
+            return self.values[:self.size].copy()
+        self.values.resize(self.size, refcheck=False)
+        return self.values
+
+
+class CsvDataStrategy(DataProcessingStrategy):
+    """
+    Handles data from csv files, in one of two layouts:
+
+    - one sectioned file laid out like the excel sheet: the nodes, edges and meta_data
+      tables one below the other, each starting with a header row and separated by rows
+      whose first cell is blank.
+    - separate <name>.nodes.csv, <name>.edges.csv and <name>.meta.csv files, each with
+      a header row. Any of the three can be opened to load the network.
+
+    Node and edge rows are read CHUNK_ROWS at a time into GrowingColumns, so memory
+    stays proportional to the network rather than to the text of the file.
+    """
+    # ROWS PARSED AT A TIME
+    CHUNK_ROWS = 100_000
+
+    # FILE NAME SUFFIXES OF THE SEPARATE FILES LAYOUT, BY TABLE
+    TABLE_SUFFIXES = {"nodes": ".nodes.csv", "edges": ".edges.csv", "meta_data": ".meta.csv"}
+
+    # NAMES OF THE TABLES IN THE ORDER THEY APPEAR IN A SECTIONED FILE
+    TABLE_NAMES = ("nodes", "edges", "meta_data")
+
+    # INITIALIZES CSVDATASTRATEGY
+    def __init__(self):
+        """
+        Initializes the CsvDataStrategy.
+        """
+        Logger.log(f"start CsvDataStrategy __init__(self)")
+        Logger.log(f"end CsvDataStrategy __init__(self)")
+
+    # PROCESS INPUT DATA.
+    def process(self, input_data):
+        """
+        Process input data to extract network data. Returns network object.
+
+        Parameters:
+        input_data: csv file input by user containing network data.
+
+        Raises:
+        InvalidInputDataError: If the files cannot be parsed or do not describe a network.
+        """
+        Logger.log(f"start CsvDataStrategy process(self, {input_data})")
+
+        try:
+            file_paths = self.get_table_files(input_data)
+            if file_paths:
+                Logger.log(f"Reading separate table files {file_paths}")
+                tables = self.read_table_files(file_paths)
+            else:
+                Logger.log(f"Reading sectioned file {input_data}")
+                tables = self.read_sectioned_file(input_data)
+        except (ValueError, csv.Error, pd.errors.ParserError) as e:
+            Logger.log(f"Error reading csv data: {e}", priority=Logger.LogPriority.ERROR)
+            raise InvalidInputDataError(f"Invalid input data: {e}")
+
+        # CREATE AND RETURN NETWORK
+        try:
+            network = NetworkFactory.create_network(tables)
+            Logger.log(f"end CsvDataStrategy process(self, input_data)")
+            return network
+        except ValueError as e:
+            Logger.log(f"Error creating network: {e}", priority=Logger.LogPriority.ERROR)
+            raise InvalidInputDataError(f"Invalid input data: {e}")
+
+    def get_source_files(self, input_data):
+        """Returns the table files of the separate files layout, or the sectioned file."""
+        file_paths = self.get_table_files(input_data)
+        return list(file_paths.values()) if file_paths else [input_data]
+
+    @classmethod
+    def get_table_files(cls, input_data):
+        """
+        Returns the table name -> file path dict of a file of the separate files layout,
+        None for a sectioned file. Missing files are left out.
+        """
+        for suffix in cls.TABLE_SUFFIXES.values():
+            if input_data.lower().endswith(suffix):
+                stem = input_data[:-len(suffix)]
+                file_paths = {name: stem + table_suffix for name, table_suffix in cls.TABLE_SUFFIXES.items()}
+                return {name: path for name, path in file_paths.items() if os.path.exists(path)}
+        return None
+
+    @classmethod
+    def is_companion_file(cls, file_name):
+        """Returns True for the edges and meta files of the separate files layout, loaded with the nodes file."""
+        file_name = file_name.lower()
+        return file_name.endswith(cls.TABLE_SUFFIXES["edges"]) or file_name.endswith(cls.TABLE_SUFFIXES["meta_data"])
+
+    @classmethod
+    def read_table_files(cls, file_paths):
+        """
+        Reads the tables of the separate files layout.
+
+        Params:
+            file_paths (dict): table name -> file path, see get_table_files.
+
+        Returns:
+            dict: the tables, nodes and edges as header -> column array dicts.
+        """
+        tables = {}
+        for name, path in file_paths.items():
+            with open(path, newline="") as file:
+                headers = next(csv.reader(file), [])
+            if name == "meta_data":
+                tables[name] = cls.read_meta_data(path, 1)
+            else:
+                tables[name] = cls.read_columns(path, 1, None, headers)
+        return tables
+
+    @classmethod
+    def read_sectioned_file(cls, input_data):
+        """
+        Reads the tables of a sectioned file.
+
+        One pass over the lines finds where each table starts and ends, then every
+        table is parsed from its own line range.
+
+        Returns:
+            dict: the tables found, nodes and edges as header -> column array dicts.
+        """
+        # FIND THE HEADER LINE AND ROW COUNT OF EVERY TABLE
+        sections = []
+        with open(input_data, newline="") as file:
+            start = None
+            line_number = -1
+            for line_number, line in enumerate(file):
+                first_cell = line.split(",", 1)[0].strip().strip('"')
+                if not first_cell:
+                    if start is not None:
+                        sections.append((start, line_number - start - 1))
+                    start = None
+                elif start is None:
+                    start = line_number
+            if start is not None:
+                sections.append((start, line_number - start))
+
+        tables = {}
+        for name, (header_line, row_count) in zip(cls.TABLE_NAMES, sections):
+            with open(input_data, newline="") as file:
+                for _ in range(header_line):
+                    next(file)
+                headers = next(csv.reader(file))
+            if name == "meta_data":
+                tables[name] = cls.read_meta_data(input_data, header_line + 1, row_count)
+            else:
+                tables[name] = cls.read_columns(input_data, header_line + 1, row_count, headers)
+        return tables
+
+    @classmethod
+    def read_columns(cls, path, first_line, row_count, headers):
+        """
+        Reads the rows of one table into typed columns, CHUNK_ROWS rows at a time.
+
+        Params:
+            path (str): the csv file.
+            first_line (int): line number of the first row.
+            row_count (int): number of rows, until the end of the file if None.
+            headers (list): the header row. Columns with a blank header are skipped.
+
+        Returns:
+            dict: header -> column array.
+        """
+        usecols = [column for column, header in enumerate(headers) if header.strip()]
+        names = [headers[column].strip() for column in usecols]
+        columns = {name: GrowingColumn() for name in names}
+        if row_count == 0 or not usecols:
+            return {name: column.finish() for name, column in columns.items()}
+
+        chunks = pd.read_csv(path, header=None, skiprows=first_line, nrows=row_count, usecols=usecols,
+                             chunksize=cls.CHUNK_ROWS, skip_blank_lines=False, skipinitialspace=True)
+        for chunk in chunks:
+            for column, name in zip(usecols, names):
+                values = chunk[column].to_numpy()
+                # A COLUMN WITH TEXT IN IT COMES AS STRINGS, TYPE ITS CELLS LIKE EXCEL WOULD
+                if values.dtype == object:
+                    values = np.array([cls.parse_value(value) for value in values.tolist()], dtype=object)
+                columns[name].append(values)
+        return {name: column.finish() for name, column in columns.items()}
+
+    @classmethod
+    def read_meta_data(cls, path, first_line, row_count=None):
+        """
+        Reads a meta_data table, key in the first column and value in the second.
+        Values are typed with parse_value.
+
+        Returns:
+            dict: meta_data key -> value.
+        """
+        meta_data = {}
+        with open(path, newline="") as file:
+            for _ in range(first_line):
+                next(file)
+            for index, row in enumerate(csv.reader(file)):
+                if row_count is not None and index >= row_count:
+                    break
+                if len(row) < 2 or not row[0].strip():
+                    continue
+                meta_data[row[0].strip()] = cls.parse_value(row[1].strip())
+        return meta_data
+
+    @staticmethod
+    def parse_value(value):
+        """Returns a csv cell as a bool, int or float if it holds one, as text otherwise."""
+        if not isinstance(value, str):
+            return value
+        if value.strip().lower() in ("true", "false"):
+            return value.strip().lower() == "true"
+        for cast in (int, float):
+            try:
+                return cast(value)
+            except ValueError:
+                pass
+        return value
@@ -5,6 +5,8 @@ class DataProcessingStrategy():
     Abstract base class for data processing strategies.
     This class defines the interface for processing input data.
     """
+    # NETWORKS PARSED BY THIS STRATEGY ARE KEPT IN THE INPUTMANAGER PARSE CACHE
+    CACHEABLE = True
     
     # PROCESS INPUT DATA.
     def process(self, input_data):
@@ -19,3 +21,18 @@ class DataProcessingStrategy():
         """
         # MUST BE IMPLEMENTED IN A SUBCLASS TO PROCESS INPUT
         raise NotImplementedError()
+
+    @classmethod
+    def is_companion_file(cls, file_name):
+        """
+        Returns True if the file is only part of a network and is loaded together with
+        another file, so it must not be opened as a network of its own.
+        """
+        return False
+
+    def get_source_files(self, input_data):
+        """
+        Returns every file the network of input_data is read from, the files whose
+        changes invalidate a cached parse.
+        """
+        return [input_data]
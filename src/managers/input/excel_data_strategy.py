@@ -1,13 +1,20 @@
 from utils.logger.logger import Logger
 from ...models.exceptions import InvalidInputDataError
 from ..network.network_factory import NetworkFactory
+import numpy as np
 import pandas as pd
 from .data_processing_strategy import DataProcessingStrategy
 
 class ExcelDataStrategy(DataProcessingStrategy):
     """
     Handles data from an excel file.
+
+    The sheet holds the nodes, edges and meta_data tables one below the other, each
+    starting with a header row and separated by blank rows.
     """
+    # NAMES OF THE TABLES IN THE ORDER THEY APPEAR IN THE SHEET
+    TABLE_NAMES = ("nodes", "edges", "meta_data")
+
     # INITIALIZES EXCELDATASTRATEGY
     def __init__(self):
         """
@@ -33,60 +40,8 @@ class ExcelDataStrategy(DataProcessingStrategy):
         # THE DATAFRAME IS A TABLE THAT PANDAS WILL USE TO STORE THE EXCEL CONTENT
         df = pd.read_excel(input_data, header=None)
 
-        # VARIABLES TO STORE THE TABLES, TRACK THE CURRENT TABLE, TRACK NUMBER OF TABLES, AND TRACK IS NEW TABLE
-        tables = {}
-        current_table = {}
-        table_number = 0
-        is_new_table = True  
-
-        # HELPER FUNCITON
-        def add_current_table_to_tables():
-            if current_table:
-                if table_number == 0:
-                    tables['nodes'] = current_table
-                elif table_number == 1:
-                    tables['edges'] = current_table
-                elif table_number == 2:
-                    meta_data = {}
-                    for i in range(len(current_table.get(list(current_table.keys())[0]))):
-                        key = current_table.get(list(current_table.keys())[0])[i]
-                        value = current_table.get(list(current_table.keys())[1])[i]
-                        meta_data[key] = value
-                    tables['meta_data'] = meta_data
-
-        # FOR EACH ROW IN DF
-        for index, row in df.iterrows():
-            # IF ITS NaN THEN ITS THE DIVIDOR BETWEEN ROWS
-            if pd.isna(row[0]): 
-                # ADD CURRENT TABLE TO TABLES 
-                add_current_table_to_tables()
-                # SET IS NEW TABLE TO TRUE 
-                is_new_table = True
-                # SET CURRENT TABLE TO EMPTY
-                current_table = {}
-                # INCREMENT TABLE NUMBER
-                table_number += 1
-            else:
-                # IF is_new_table IS TRUE THEN THE CURRENT ROW ARE THE HEADERS
-                if is_new_table:  
-                    # GET NON NAN VALUES AS HEADERS
-                    headers = row.dropna().tolist()  
-
-                    # FOR EACH CELL IN THE CURRENT ROW 
-                    for header in headers:
-                        # CREATE A NEW KEY IN CURRENT_TABLE AND MAKE THE DEFAULT VALUE A NEW EMPTY LIST
-                        current_table[header] = []
-                    # SET IS NEW TABLE TO FALSE
-                    is_new_table = False
-
-                # IF is_new_table IS NOT TRUE THEN THE CURRENT ROW ARE THE VALUES
-                else:  
-                    # LOOP THROUGHT THE ROW AND FOR EACH VALUE ADD IT TO ITS CORRESPONDING HEADER KEY
-                    for i, value in enumerate(row.dropna()):
-                        current_table[headers[i]].append(value)
-
-        # ADD LAST TABLE
-        add_current_table_to_tables()
+        # SPLIT THE SHEET INTO ITS NODES, EDGES AND META_DATA TABLES
+        tables = self.split_tables(df)
 
         # CREATE AND RETURN NETWORK
         try:
@@ -94,6 +49,45 @@ class ExcelDataStrategy(DataProcessingStrategy):
             Logger.log(f"end Process __init__(self, input_data)")
             return network
         except ValueError as e:
-            Logger.log(f"Error creating network: {e}", Logger.LogPriority.ERROR)
+            Logger.log(f"Error creating network: {e}", priority=Logger.LogPriority.ERROR)
             raise InvalidInputDataError(f"Invalid input data: {e}")
-    
\ No newline at end of file
+    
+
+    @classmethod
+    def split_tables(cls, df):
+        """
+        Splits a sheet read without header into its tables.
+
+        A row whose first cell is blank separates two tables. The first row of each table
+        holds its headers, columns without a header are ignored. Nodes and edges become
+        header -> column array dicts, meta_data a dict from the first column to the second.
+        Blank cells stay in place as NaN, so every column keeps the length of its table.
+
+        Params:
+            df (DataFrame): the sheet, as read by pd.read_excel(input_data, header=None).
+
+        Returns:
+            dict: the tables found, keyed by TABLE_NAMES.
+        """
+        if df.empty:
+            return {}
+
+        # NUMBER EVERY ROW WITH ITS TABLE, THE COUNT OF SEPARATOR ROWS ABOVE IT
+        separators = df[0].isna().to_numpy()
+        table_numbers = np.cumsum(separators)
+        values = df.to_numpy(dtype=object)
+
+        tables = {}
+        for table_number, name in enumerate(cls.TABLE_NAMES):
+            rows = values[(table_numbers == table_number) & ~separators]
+            if len(rows) == 0:
+                continue
+
+            # THE FIRST ROW HOLDS THE HEADERS
+            header_columns = [column for column, header in enumerate(rows[0]) if not pd.isna(header)]
+            body = rows[1:]
+            if name == "meta_data":
+                tables[name] = dict(zip(body[:, header_columns[0]].tolist(), body[:, header_columns[1]].tolist()))
+            else:
+                tables[name] = {rows[0, column]: body[:, column] for column in header_columns}
+        return tables
@@ -0,0 +1,42 @@
+from utils.logger.logger import Logger
+from ...models.exceptions import InvalidInputDataError
+from ..network.fnet_file import FnetFile
+from .data_processing_strategy import DataProcessingStrategy
+
+class FnetDataStrategy(DataProcessingStrategy):
+    """
+    Handles data from a FibriNet binary network file (.fnet).
+
+    The network is returned as a NetworkArrays whose columns are memory-mapped from
+    the file, so opening it costs the same whatever its size, see FnetFile.
+    """
+    # THE FILE IS ALREADY IN THE FORM THE PARSE CACHE STORES
+    CACHEABLE = False
+
+    # INITIALIZES FNETDATASTRATEGY
+    def __init__(self):
+        """
+        Initializes the FnetDataStrategy.
+        """
+        Logger.log(f"start FnetDataStrategy __init__(self)")
+        Logger.log(f"end FnetDataStrategy __init__(self)")
+
+    # PROCESS INPUT DATA.
+    def process(self, input_data):
+        """
+        Process input data to extract network data. Returns network object.
+
+        Parameters:
+        input_data: .fnet file input by user containing network data.
+
+        Raises:
+        InvalidInputDataError: If the file is not a valid .fnet file.
+        """
+        Logger.log(f"start FnetDataStrategy process(self, {input_data})")
+        try:
+            network = FnetFile.read(input_data)
+        except (ValueError, UnicodeDecodeError) as e:
+            Logger.log(f"Error reading network file: {e}", priority=Logger.LogPriority.ERROR)
+            raise InvalidInputDataError(f"Invalid input data: {e}")
+        Logger.log(f"end FnetDataStrategy process(self, input_data)")
+        return network
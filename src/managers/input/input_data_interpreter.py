@@ -1,12 +1,25 @@
 from utils.logger.logger import Logger
 from ...models.exceptions import UnsupportedFileTypeError
 from .excel_data_strategy import ExcelDataStrategy
+from .csv_data_strategy import CsvDataStrategy
+from .fnet_data_strategy import FnetDataStrategy
 import os
 
 class InputDataInterpreter:
     """
     Interprets input data and provides a DataProcessingStrategy.
     """
+
+    # DATA PROCESSING STRATEGY CLASS OF EACH FILE EXTENSION
+    _data_processing_strategies = {
+        ".xlsx": ExcelDataStrategy,
+        ".csv": CsvDataStrategy,
+        ".fnet": FnetDataStrategy,
+    }
+
+    # FILE EXTENSIONS THAT HAVE A DATA PROCESSING STRATEGY
+    SUPPORTED_FILE_EXTENSIONS = tuple(_data_processing_strategies)
+
     # INITIALIZES DATAINTERPRETER
     def __init__(self):
         """
@@ -15,6 +28,30 @@ class InputDataInterpreter:
         Logger.log(f"start DataInterpreter __init__(self)")
         Logger.log(f"end DataInterpreter __init__(self)")
     
+    @classmethod
+    def register_data_processing_strategy(cls, file_extension, strategy_class):
+        """
+        Registers the data processing strategy class of a file extension.
+
+        Args:
+            file_extension (str): The extension, with its leading dot (e.g. ".csv").
+            strategy_class: The DataProcessingStrategy subclass that reads such files.
+        """
+        Logger.log(f"Registering data processing strategy {strategy_class} for '{file_extension}'")
+        cls._data_processing_strategies[file_extension.lower()] = strategy_class
+        cls.SUPPORTED_FILE_EXTENSIONS = tuple(cls._data_processing_strategies)
+
+    @classmethod
+    def is_network_file(cls, file_name):
+        """
+        Returns True if the file holds a network that can be loaded on its own, i.e. it has a
+        supported extension and is not a companion file that is loaded with another one.
+        """
+        if os.path.basename(file_name).startswith("~$"):
+            return False
+        strategy_class = cls._data_processing_strategies.get(os.path.splitext(file_name)[1].lower())
+        return strategy_class is not None and not strategy_class.is_companion_file(file_name)
+
     # GET DATA PROCESSING STRATEGY
     def get_data_processing_strategy(self, input_data):
         """
@@ -29,7 +66,7 @@ class InputDataInterpreter:
         Logger.log(f"start get_data_processing_strategy __init__(self, {input_data})")
         # CHECK DOES FILE EXIST
         if not os.path.exists(input_data):
-            Logger.log(f"File ({input_data}) Not Found", Logger.LogPriority.ERROR)
+            Logger.log(f"File ({input_data}) Not Found", priority=Logger.LogPriority.ERROR)
             raise FileNotFoundError(f"File ({input_data}) Not Found")
 
         file_size = os.path.getsize(input_data)
@@ -38,15 +75,11 @@ class InputDataInterpreter:
         Logger.log(f"File details - Name: {file_name}, Size: {file_size} bytes, Extension: {file_extension}")
 
         # DETERMINE THE TYPE OF FILE INPUT DATA IS AND RETURN DATA PROCESSING STRATEGY
-        if file_extension == '.xlsx':
-            Logger.log("This is an Excel file.")
-            Logger.log(f"end DataInterpreter __init__(self, input_data)")
-            return ExcelDataStrategy()
-
-        else:
+        strategy_class = self._data_processing_strategies.get(file_extension.lower())
+        if strategy_class is None:
             Logger.log(f"Unsupported file type: {file_extension}")
             raise UnsupportedFileTypeError()
 
-
-        
-            
+        Logger.log(f"Using {strategy_class.__name__} for {file_extension} files.")
+        Logger.log(f"end DataInterpreter __init__(self, input_data)")
+        return strategy_class()
@@ -1,18 +1,27 @@
 from utils.logger.logger import Logger
 from .input_data_interpreter import InputDataInterpreter
+from .network_parse_cache import NetworkParseCache
 from ...models.exceptions import InvalidInputDataError, UnsupportedFileTypeError
 
 class InputManager:
     """
     Handles input management for the system.
+
+    Parsed networks are kept in a NetworkParseCache, so loading a file that did not
+    change since it was last loaded skips parsing and the NetworkFactory.
     """
     # INITIALIZES INPUTMANAGER
-    def __init__(self):
+    def __init__(self, parse_cache=None, use_parse_cache=True):
         """
         Initializes the InputManager.
+
+        Args:
+            parse_cache (NetworkParseCache): Cache of parsed networks, one in the default folder if None.
+            use_parse_cache (bool): Parse every file on every load if False.
         """
         Logger.log(f"start InputManager __init__(self)")
         self.data_interpreter = InputDataInterpreter()
+        self.parse_cache = (parse_cache or NetworkParseCache()) if use_parse_cache else None
         Logger.log(f"end InputManager __init__(self)")
 
     # GET NETWORK FROM INPUT DATA
@@ -34,14 +43,35 @@ class InputManager:
         except UnsupportedFileTypeError:
             raise
         except FileNotFoundError as ex:
-            Logger.log(ex, Logger.LogPriority.ERROR)
+            Logger.log(ex, priority=Logger.LogPriority.ERROR)
             raise
 
+        # RETURN THE CACHED NETWORK IF THE FILES DID NOT CHANGE, HASHING THEM ONCE PER LOAD
+        source_files = cache_key = None
+        if self.parse_cache is not None and data_processing_strategy.CACHEABLE:
+            try:
+                source_files = data_processing_strategy.get_source_files(input_data)
+                cache_key = self.parse_cache.get_key(source_files)
+                network = self.parse_cache.get(source_files, cache_key)
+            except OSError as ex:
+                Logger.log(f"Parse cache unavailable: {ex}", priority=Logger.LogPriority.ERROR)
+                source_files = network = None
+            if network is not None:
+                Logger.log(f"end get_network __init__(self, input_data)")
+                return network
 
         try:
-            Logger.log(f"end get_network __init__(self, input_data)")
-            # PROCESS DATA AND RETURN NETWORK
-            return data_processing_strategy.process(input_data)
+            # PROCESS DATA
+            network = data_processing_strategy.process(input_data)
         except InvalidInputDataError:
             raise
-        
+
+        # CACHE THE VALIDATED NETWORK, A CACHE FAILURE NEVER FAILS THE LOAD
+        if source_files is not None:
+            try:
+                self.parse_cache.put(source_files, network, cache_key)
+            except OSError as ex:
+                Logger.log(f"Network could not be cached: {ex}", priority=Logger.LogPriority.ERROR)
+
+        Logger.log(f"end get_network __init__(self, input_data)")
+        return network
@@ -0,0 +1,237 @@
+from utils.logger.logger import Logger
+from ..network.fnet_file import FnetFile
+from ..network.network_factory import NetworkFactory
+from ..network.networks.network_arrays import NetworkArrays
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+class NetworkParseCache:
+    """
+    On-disk cache of parsed networks, so an input file that did not change is never
+    parsed twice.
+
+    An entry is keyed on the path, size, mtime and content hash of every file the
+    network was read from, and on NetworkFactory.get_schema_fingerprint, so editing a
+    file or changing a registered class or schema misses the cache. Networks are
+    stored as .fnet files (see FnetFile) and converted back to the type the parser
+    returned. index.json records every entry with its size and last use, and the
+    least recently used entries are evicted once the total exceeds max_bytes.
+
+    Several runs can share the cache folder. Every read-modify-write of the index
+    holds index.lock, a file created exclusively, so no update is lost.
+    """
+
+    # VERSION OF THE CACHE LAYOUT, PART OF EVERY KEY
+    VERSION = 1
+    # DEFAULT FOLDER OF THE CACHE
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".fibrinet", "parse_cache")
+    # DEFAULT BOUND OF THE TOTAL SIZE OF THE CACHED NETWORKS, IN BYTES
+    DEFAULT_MAX_BYTES = 1 << 30
+    # BYTES READ AT A TIME WHEN HASHING A FILE
+    HASH_BLOCK_SIZE = 1 << 20
+    # NAME OF THE INDEX FILE
+    INDEX_FILE_NAME = "index.json"
+    # NAME OF THE LOCK FILE GUARDING INDEX UPDATES
+    LOCK_FILE_NAME = "index.lock"
+    # SECONDS TO WAIT FOR THE LOCK, AN OLDER LOCK FILE WAS LEFT BY A RUN THAT DIED
+    LOCK_TIMEOUT = 10.0
+    # SECONDS BETWEEN ATTEMPTS TO TAKE THE LOCK
+    LOCK_RETRY_INTERVAL = 0.01
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initializes the cache.
+
+        Params:
+            directory (str): Folder of the cache, DEFAULT_DIRECTORY if None. Created on first write.
+            max_bytes (int): Bound of the total size of the cached networks.
+        """
+        self.directory = directory or self.DEFAULT_DIRECTORY
+        self.max_bytes = max_bytes
+
+    def get(self, source_files, key=None):
+        """
+        Returns the cached network read from the files, None on a miss.
+
+        Params:
+            source_files (list): paths of every file the network is read from.
+            key (str): get_key of the files, computed if None. Pass the same key to put
+                       after a miss so the files are hashed once.
+        """
+        key = key or self.get_key(source_files)
+        entry = self._read_index().get(key)
+        if entry is None:
+            Logger.log(f"Parse cache miss for {source_files}")
+            return None
+
+        try:
+            network = FnetFile.read(self._get_entry_path(key), as_arrays=entry["layout"] == "arrays")
+        except (OSError, ValueError) as ex:
+            Logger.log(f"Parse cache entry for {source_files} cannot be read, dropping it: {ex}")
+            with self._lock_index():
+                index = self._read_index()
+                self._remove_entry(index, key)
+                self._write_index(index)
+            return None
+
+        with self._lock_index():
+            index = self._read_index()
+            if key in index:
+                index[key]["last_used"] = time.time()
+                self._write_index(index)
+        Logger.log(f"Parse cache hit for {source_files}")
+        return network
+
+    def put(self, source_files, network, key=None):
+        """
+        Caches the network read from the files, replacing older entries of the same files.
+
+        Networks that cannot be stored as a .fnet file or that are larger than max_bytes
+        are not cached.
+
+        Params:
+            source_files (list): paths of every file the network was read from.
+            network: the parsed Network2D or NetworkArrays.
+            key (str): get_key of the files, computed if None.
+        """
+        key = key or self.get_key(source_files)
+        try:
+            content = FnetFile.to_bytes(network)
+        except (AttributeError, TypeError, ValueError) as ex:
+            Logger.log(f"Network read from {source_files} cannot be cached: {ex}")
+            return
+        if len(content) > self.max_bytes:
+            Logger.log(f"Network read from {source_files} is larger than the parse cache, not caching it.")
+            return
+
+        # WRITE TO A TEMPORARY FILE FIRST SO READERS NEVER SEE A PARTIAL ENTRY
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file:
+            file.write(content)
+        os.replace(file.name, self._get_entry_path(key))
+
+        paths = self._get_paths(source_files)
+        with self._lock_index():
+            index = self._read_index()
+            for old_key in [old_key for old_key, entry in index.items() if entry["paths"] == paths and old_key != key]:
+                self._remove_entry(index, old_key)
+            index[key] = {
+                "paths": paths, "bytes": len(content), "last_used": time.time(),
+                "layout": "arrays" if isinstance(network, NetworkArrays) else "objects",
+            }
+            self._evict(index)
+            self._write_index(index)
+        Logger.log(f"Cached network read from {source_files} ({len(content)} bytes)")
+
+    def clear(self):
+        """Removes every entry."""
+        with self._lock_index():
+            index = self._read_index()
+            for key in list(index):
+                self._remove_entry(index, key)
+            self._write_index(index)
+
+    def get_key(self, source_files):
+        """
+        Returns the cache key of the files in their current state.
+
+        Raises:
+            OSError: If a file cannot be read.
+        """
+        files = []
+        for path in self._get_paths(source_files):
+            stat = os.stat(path)
+            files.append([path, stat.st_size, stat.st_mtime_ns, self.get_content_hash(path)])
+        key = [self.VERSION, FnetFile.VERSION, NetworkFactory.get_schema_fingerprint(), files]
+        return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_content_hash(cls, path):
+        """Returns the SHA-256 hex digest of a file, read HASH_BLOCK_SIZE bytes at a time."""
+        content_hash = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(cls.HASH_BLOCK_SIZE), b""):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+
+    @contextmanager
+    def _lock_index(self):
+        """
+        Holds the index lock file for the duration of the with block.
+
+        Raises:
+            OSError: If the lock cannot be taken within LOCK_TIMEOUT seconds.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        lock_path = os.path.join(self.directory, self.LOCK_FILE_NAME)
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                pass
+            # BREAK A LOCK LEFT BY A RUN THAT DIED WHILE HOLDING IT
+            try:
+                if time.time() - os.path.getmtime(lock_path) > self.LOCK_TIMEOUT:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise OSError(f"Timed out waiting for the parse cache lock {lock_path}")
+            time.sleep(self.LOCK_RETRY_INTERVAL)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+    def _evict(self, index):
+        """Removes the least recently used entries until the total size fits in max_bytes."""
+        total_bytes = sum(entry["bytes"] for entry in index.values())
+        for key in sorted(index, key=lambda key: index[key]["last_used"]):
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= index[key]["bytes"]
+            Logger.log(f"Evicting parse cache entry of {index[key]['paths']}")
+            self._remove_entry(index, key)
+
+    def _remove_entry(self, index, key):
+        """Removes an entry from the index and deletes its file."""
+        index.pop(key, None)
+        try:
+            os.remove(self._get_entry_path(key))
+        except OSError:
+            # ALREADY GONE, OR STILL MEMORY-MAPPED ON PLATFORMS THAT LOCK MAPPED FILES
+            pass
+
+    def _read_index(self):
+        """Returns the index, empty if it does not exist or cannot be read."""
+        try:
+            with open(os.path.join(self.directory, self.INDEX_FILE_NAME)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        """Writes the index atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as file:
+            json.dump(index, file)
+        os.replace(file.name, os.path.join(self.directory, self.INDEX_FILE_NAME))
+
+    def _get_entry_path(self, key):
+        """Returns the path of the .fnet file of an entry."""
+        return os.path.join(self.directory, f"{key}{FnetFile.FILE_EXTENSION}")
+
+    @staticmethod
+    def _get_paths(source_files):
+        """Returns the absolute, sorted paths of the source files."""
+        return sorted(os.path.abspath(path) for path in source_files)
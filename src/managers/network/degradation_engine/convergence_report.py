@@ -0,0 +1,39 @@
+class ConvergenceReport:
+    """
+    Summary of one relaxation: the method used, how many iterations it ran, the largest
+    net force left on a free node and how long it took.
+    """
+
+    def __init__(self, method, iterations, max_force, converged, seconds, details=None):
+        """
+        Initializes the report.
+
+        Params:
+            method (str): name of the relaxation method.
+            iterations (int): number of iterations run.
+            max_force (float): largest net force on a free node after relaxing.
+            converged (bool): True if max_force dropped below the tolerance.
+            seconds (float): wall time of the relaxation.
+            details (dict): method specific values, e.g. inner solver iterations.
+        """
+        self.method = method
+        self.iterations = iterations
+        self.max_force = max_force
+        self.converged = converged
+        self.seconds = seconds
+        self.details = details or {}
+
+    def to_dict(self):
+        """Returns the report as a flat dictionary."""
+        return {
+            "method": self.method,
+            "iterations": self.iterations,
+            "max_force": self.max_force,
+            "converged": self.converged,
+            "seconds": self.seconds,
+            **self.details,
+        }
+
+    def __repr__(self):
+        return (f"ConvergenceReport(method={self.method}, iterations={self.iterations}, "
+                f"max_force={self.max_force:.3e}, converged={self.converged}, seconds={self.seconds:.4f})")
@@ -1,4 +1,6 @@
 from utils.logger.logger import Logger
+from ....models.exceptions import NodeNotFoundError, EdgeNotFoundError
+from ..networks.network_arrays import NetworkArrays
 
 class DegradationEngineStrategy():
     """
@@ -38,6 +40,30 @@ class DegradationEngineStrategy():
         # MUST BE IMPLEMENTED IN A SUBCLASS TO DEGRADE NODE
         raise NotImplementedError()
     
+    # DEGRADE EDGES
+    def degrade_edges(self, network, edge_ids):
+        """
+        Degrades several network edges in one step with a single relaxation.
+
+        Params:
+            network: network object to be degraded.
+            edge_ids: ids of the edges to be degraded.
+        """
+        # MUST BE IMPLEMENTED IN A SUBCLASS TO DEGRADE EDGES
+        raise NotImplementedError()
+
+    # DEGRADE NODES
+    def degrade_nodes(self, network, node_ids):
+        """
+        Degrades several network nodes in one step with a single relaxation.
+
+        Params:
+            network: network object to be degraded.
+            node_ids: ids of the nodes to be degraded.
+        """
+        # MUST BE IMPLEMENTED IN A SUBCLASS TO DEGRADE NODES
+        raise NotImplementedError()
+
     # RELAX NETWORK
     def relax_network(self, network):
         """
@@ -48,3 +74,51 @@ class DegradationEngineStrategy():
         """
         # MUST BE IMPLEMENTED IN A SUBCLASS TO RELAX NETWORK
         raise NotImplementedError()
+
+    # VALIDATE EDGE IDS
+    def validate_edge_ids(self, network, edge_ids):
+        """
+        Checks that every edge id is in the network before anything is removed.
+
+        Params:
+            network: network object to be degraded.
+            edge_ids: ids of the edges to be degraded.
+
+        Returns:
+            list: The edge ids without duplicates, in their original order.
+
+        Raises:
+            EdgeNotFoundError: Listing every edge id that is not in the network.
+        """
+        edge_ids = list(dict.fromkeys(edge_ids))
+        if isinstance(network, NetworkArrays):
+            missing = [edge_id for edge_id in edge_ids if network.get_edge_row(edge_id) is None]
+        else:
+            missing = [edge_id for edge_id in edge_ids if network.get_edge_by_id(edge_id) is None]
+        if missing:
+            raise EdgeNotFoundError(f"Edge IDs {missing} not found in network.")
+        return edge_ids
+
+    # VALIDATE NODE IDS
+    def validate_node_ids(self, network, node_ids):
+        """
+        Checks that every node id is in the network before anything is removed.
+
+        Params:
+            network: network object to be degraded.
+            node_ids: ids of the nodes to be degraded.
+
+        Returns:
+            list: The node ids without duplicates, in their original order.
+
+        Raises:
+            NodeNotFoundError: Listing every node id that is not in the network.
+        """
+        node_ids = list(dict.fromkeys(node_ids))
+        if isinstance(network, NetworkArrays):
+            missing = [node_id for node_id in node_ids if network.get_node_row(node_id) is None]
+        else:
+            missing = [node_id for node_id in node_ids if network.get_node_by_id(node_id) is None]
+        if missing:
+            raise NodeNotFoundError(f"Node IDs {missing} not found in network.")
+        return node_ids
@@ -0,0 +1,40 @@
+from .relaxation_minimizer import RelaxationMinimizer
+
+class BacktrackingGradientDescentMinimizer(RelaxationMinimizer):
+    """
+    Moves every node along its net force with a step chosen by a backtracking (Armijo)
+    line search on the elastic energy. The accepted step is doubled for the next
+    iteration so the step adapts to stiff and soft networks.
+    """
+
+    DEFAULT_STEP = 1.0
+
+    # SUFFICIENT DECREASE CONSTANT AND SMALLEST STEP TRIED
+    ARMIJO = 1e-4
+    MIN_STEP = 1e-12
+
+    def minimize(self, positions, moving, compute_forces, compute_energy, max_iterations, tolerance, step):
+        max_force = 0.0
+        energy = compute_energy(positions)
+        for iteration in range(1, max_iterations + 1):
+            moving_forces = compute_forces(positions)[moving]
+            max_force = self.get_max_force(moving_forces)
+            if max_force < tolerance:
+                return iteration - 1, max_force, True
+
+            # SHRINK THE STEP UNTIL THE ENERGY DECREASES ENOUGH
+            force_norm_squared = float((moving_forces * moving_forces).sum())
+            start = positions[moving].copy()
+            while step >= self.MIN_STEP:
+                positions[moving] = start + step * moving_forces
+                trial_energy = compute_energy(positions)
+                if trial_energy <= energy - self.ARMIJO * step * force_norm_squared:
+                    break
+                step *= 0.5
+            else:
+                positions[moving] = start
+                return iteration, max_force, False
+
+            energy = trial_energy
+            step *= 2.0
+        return max_iterations, max_force, False
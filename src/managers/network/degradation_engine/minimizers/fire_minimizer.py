@@ -0,0 +1,53 @@
+from .relaxation_minimizer import RelaxationMinimizer
+import numpy as np
+
+class FireMinimizer(RelaxationMinimizer):
+    """
+    Fast Inertial Relaxation Engine (Bitzek et al. 2006). Nodes carry a velocity that is
+    steered towards the force direction. The time step grows while the motion runs
+    downhill and the velocity is reset whenever it turns uphill.
+    """
+
+    DEFAULT_STEP = 0.01
+
+    # FIRE PARAMETERS FROM THE ORIGINAL PAPER
+    MAX_STEP_FACTOR = 10.0
+    MIN_DOWNHILL_STEPS = 5
+    STEP_INCREASE = 1.1
+    STEP_DECREASE = 0.5
+    ALPHA_START = 0.1
+    ALPHA_DECREASE = 0.99
+
+    def minimize(self, positions, moving, compute_forces, compute_energy, max_iterations, tolerance, step):
+        max_step = step * self.MAX_STEP_FACTOR
+        alpha = self.ALPHA_START
+        downhill_steps = 0
+        velocity = np.zeros((int(moving.sum()), 2))
+        max_force = 0.0
+
+        for iteration in range(1, max_iterations + 1):
+            moving_forces = compute_forces(positions)[moving]
+            max_force = self.get_max_force(moving_forces)
+            if max_force < tolerance:
+                return iteration - 1, max_force, True
+
+            # STEER THE VELOCITY TOWARDS THE FORCE WHILE MOVING DOWNHILL, STOP WHEN GOING UPHILL
+            power = float((moving_forces * velocity).sum())
+            if power > 0:
+                force_norm = np.sqrt((moving_forces * moving_forces).sum())
+                velocity_norm = np.sqrt((velocity * velocity).sum())
+                velocity = (1.0 - alpha) * velocity + alpha * velocity_norm * moving_forces / force_norm
+                downhill_steps += 1
+                if downhill_steps > self.MIN_DOWNHILL_STEPS:
+                    step = min(step * self.STEP_INCREASE, max_step)
+                    alpha *= self.ALPHA_DECREASE
+            else:
+                velocity[:] = 0.0
+                step *= self.STEP_DECREASE
+                alpha = self.ALPHA_START
+                downhill_steps = 0
+
+            # SEMI-IMPLICIT EULER STEP WITH UNIT MASS
+            velocity += step * moving_forces
+            positions[moving] += step * velocity
+        return max_iterations, max_force, False
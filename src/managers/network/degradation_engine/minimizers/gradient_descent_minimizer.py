@@ -0,0 +1,26 @@
+from .relaxation_minimizer import RelaxationMinimizer
+
+class GradientDescentMinimizer(RelaxationMinimizer):
+    """
+    Moves every node along its net force by a fixed step each iteration.
+    """
+
+    DEFAULT_STEP = 0.01
+
+    def minimize(self, positions, moving, compute_forces, compute_energy, max_iterations, tolerance, step):
+        max_force = 0.0
+        # LOOP FOR A MAXIMUM NUMBER OF ITERATIONS TO RELAX THE NETWORK
+        for iteration in range(1, max_iterations + 1):
+            # COMPUTE THE FORCES ON EACH NODE USING HOOKE'S LAW
+            moving_forces = compute_forces(positions)[moving]
+
+            # ONLY NODES THAT ARE NOT FIXED IN PLACE MOVE OR COUNT TOWARDS THE MAX FORCE
+            max_force = self.get_max_force(moving_forces)
+
+            # UPDATE NODE POSITIONS IN THE DIRECTION OF THE FORCE (GRADIENT DESCENT STYLE)
+            positions[moving] += step * moving_forces
+
+            # IF MAXIMUM FORCE IS BELOW THE TOLERANCE, STOP EARLY (CONVERGENCE REACHED)
+            if max_force < tolerance:
+                return iteration, max_force, True
+        return max_iterations, max_force, False
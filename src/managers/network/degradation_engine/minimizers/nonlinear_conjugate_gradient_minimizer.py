@@ -0,0 +1,53 @@
+from .relaxation_minimizer import RelaxationMinimizer
+
+class NonlinearConjugateGradientMinimizer(RelaxationMinimizer):
+    """
+    Polak-Ribiere nonlinear conjugate gradient with a backtracking line search on the
+    elastic energy. The search direction restarts along the force whenever it stops
+    pointing downhill.
+    """
+
+    DEFAULT_STEP = 1.0
+
+    # SUFFICIENT DECREASE CONSTANT AND SMALLEST STEP TRIED
+    ARMIJO = 1e-4
+    MIN_STEP = 1e-12
+
+    def minimize(self, positions, moving, compute_forces, compute_energy, max_iterations, tolerance, step):
+        energy = compute_energy(positions)
+        moving_forces = compute_forces(positions)[moving]
+        direction = moving_forces.copy()
+        max_force = self.get_max_force(moving_forces)
+
+        for iteration in range(1, max_iterations + 1):
+            if max_force < tolerance:
+                return iteration - 1, max_force, True
+
+            # RESTART ALONG THE FORCE IF THE DIRECTION IS NOT A DESCENT DIRECTION
+            slope = float((moving_forces * direction).sum())
+            if slope <= 0:
+                direction = moving_forces.copy()
+                slope = float((moving_forces * moving_forces).sum())
+
+            # SHRINK THE STEP UNTIL THE ENERGY DECREASES ENOUGH
+            start = positions[moving].copy()
+            while step >= self.MIN_STEP:
+                positions[moving] = start + step * direction
+                trial_energy = compute_energy(positions)
+                if trial_energy <= energy - self.ARMIJO * step * slope:
+                    break
+                step *= 0.5
+            else:
+                positions[moving] = start
+                return iteration, max_force, False
+            energy = trial_energy
+
+            # POLAK-RIBIERE+ UPDATE OF THE SEARCH DIRECTION
+            next_forces = compute_forces(positions)[moving]
+            beta = max(0.0, float((next_forces * (next_forces - moving_forces)).sum())
+                       / float((moving_forces * moving_forces).sum()))
+            direction = next_forces + beta * direction
+            moving_forces = next_forces
+            max_force = self.get_max_force(moving_forces)
+            step *= 2.0
+        return max_iterations, max_force, max_force < tolerance
@@ -0,0 +1,40 @@
+import numpy as np
+
+class RelaxationMinimizer:
+    """
+    Base class for the methods that move free nodes towards a spring network equilibrium.
+    Subclasses implement minimize.
+    """
+
+    # STEP USED WHEN NONE IS CONFIGURED
+    DEFAULT_STEP = 0.01
+
+    def minimize(self, positions, moving, compute_forces, compute_energy, max_iterations, tolerance, step):
+        """
+        Moves the rows of positions selected by moving, in place, until the largest net
+        force on them drops below tolerance or max_iterations is reached.
+
+        Params:
+            positions: (N, 2) array of node coordinates, updated in place.
+            moving: boolean mask of the rows that move and count towards the max force.
+            compute_forces: callable(positions) returning the (N, 2) net force on every node.
+            compute_energy: callable(positions) returning the elastic energy.
+            max_iterations (int): iteration limit.
+            tolerance (float): max force below which the minimization stops.
+            step (float): initial step size of the method.
+
+        Returns:
+            tuple: (iterations, max_force, converged).
+
+        Raises:
+            NotImplementedError: If this method is not overridden in a subclass.
+        """
+        # MUST BE IMPLEMENTED IN A SUBCLASS TO DEFINE THE MINIMIZATION
+        raise NotImplementedError()
+
+    @staticmethod
+    def get_max_force(moving_forces):
+        """Returns the largest norm of the rows of moving_forces, 0.0 if there are none."""
+        if not len(moving_forces):
+            return 0.0
+        return float(np.sqrt((moving_forces * moving_forces).sum(axis=1)).max())
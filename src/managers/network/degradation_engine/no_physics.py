@@ -1,7 +1,7 @@
 from utils.logger.logger import Logger
 from .degradation_engine_strategy import DegradationEngineStrategy
 from ....models.exceptions import NodeNotFoundError, EdgeNotFoundError
-import copy
+from ..networks.network_arrays import NetworkArrays
 
 class NoPhysics(DegradationEngineStrategy):
     """
@@ -21,20 +21,27 @@ class NoPhysics(DegradationEngineStrategy):
         """
         Logger.log(f"start degrade_edge(self, network, {edge_id})")
 
-        # CREATE A COPY OF THE NETWORK
-        new_network = copy.deepcopy(network)
+        # TAKE A COPY-ON-WRITE SNAPSHOT OF THE NETWORK
+        new_network = network.snapshot()
 
-        if edge_id not in [edge.get_id() for edge in new_network.get_edges()]:
-            raise Exception(f"Edge ID '{edge_id}' not found in network.")
+        # ARRAY BACKED NETWORKS PRUNE ORPHANED NODES WITH ONE VECTORIZED DEGREE COUNT
+        if isinstance(new_network, NetworkArrays):
+            if new_network.get_edge_row(edge_id) is None:
+                raise EdgeNotFoundError(f"Edge ID '{edge_id}' not found in network.")
+            new_network.remove_edge(edge_id)
+            new_network.remove_orphan_nodes()
+            Logger.log(f"end degrade_edge(self, network, {edge_id})")
+            return new_network
+
+        edge = new_network.get_edge_by_id(edge_id)
+        if edge is None:
+            raise EdgeNotFoundError(f"Edge ID '{edge_id}' not found in network.")
 
         # REMOVE THE EDGE WITH THE SPECIFIED ID
         new_network.remove_edge(edge_id)
 
         # REMOVE NODES THAT NO LONGER HAVE ANY EDGES CONNECTED TO THEM
-        connected_node_ids = {edge.get_attribute("n_to") for edge in new_network.get_edges()}.union(
-            {edge.get_attribute("n_from") for edge in new_network.get_edges()})
-        new_nodes = [node for node in new_network.get_nodes() if node.get_id() in connected_node_ids]
-        new_network.nodes = new_nodes
+        self._remove_orphan_nodes(new_network, (edge.n_from, edge.n_to))
 
         Logger.log(f"end degrade_edge(self, network, {edge_id})")
         return new_network
@@ -52,30 +59,112 @@ class NoPhysics(DegradationEngineStrategy):
         """
         Logger.log(f"start degrade_node(self, network, {node_id})")
 
-        # CREATE A COPY OF THE NETWORK
-        new_network = copy.deepcopy(network)
+        # TAKE A COPY-ON-WRITE SNAPSHOT OF THE NETWORK
+        new_network = network.snapshot()
 
-        if node_id not in [node.get_id() for node in new_network.get_nodes()]:
-            raise (f"Node ID '{node_id}' not found in network.")
+        # ARRAY BACKED NETWORKS DROP CONNECTED EDGES AS PART OF remove_node
+        if isinstance(new_network, NetworkArrays):
+            if new_network.get_node_row(node_id) is None:
+                raise NodeNotFoundError(f"Node ID '{node_id}' not found in network.")
+            new_network.remove_node(node_id)
+            new_network.remove_orphan_nodes()
+            Logger.log(f"end degrade_node(self, network, {node_id})")
+            return new_network
 
+        if new_network.get_node_by_id(node_id) is None:
+            raise NodeNotFoundError(f"Node ID '{node_id}' not found in network.")
 
         # REMOVE THE NODE WITH THE SPECIFIED ID
         new_network.remove_node(node_id)
 
         # REMOVE EDGES CONNECTED TO THE REMOVED NODE
-        new_edges = [edge for edge in new_network.get_edges()
-                     if edge.get_attribute("n_to") != node_id and edge.get_attribute("n_from") != node_id]
-        new_network.edges = new_edges
+        endpoint_ids = set()
+        for edge in new_network.get_edges_by_node_id(node_id):
+            endpoint_ids.update((edge.n_from, edge.n_to))
+            new_network.remove_edge(edge.get_id())
 
         # REMOVE NODES THAT NO LONGER HAVE ANY EDGES CONNECTED TO THEM
-        connected_node_ids = {edge.get_attribute("n_to") for edge in new_network.get_edges()}.union(
-            {edge.get_attribute("n_from") for edge in new_network.get_edges()})
-        new_nodes = [node for node in new_network.get_nodes() if node.get_id() in connected_node_ids]
-        new_network.nodes = new_nodes
+        self._remove_orphan_nodes(new_network, endpoint_ids)
 
         Logger.log(f"end degrade_node(self, network, {node_id})")
         return new_network
     
+    def degrade_edges(self, network, edge_ids):
+        """
+        Creates a degraded version of the network without any of the specified edges.
+
+        Params:
+            network: network object to be degraded.
+            edge_ids: ids of edges to be removed.
+
+        Returns:
+            A new Network object with the specified edges removed.
+
+        Raises:
+            EdgeNotFoundError: Listing every edge id that is not in the network.
+        """
+        Logger.log("start degrade_edges(self, network, edge_ids)")
+
+        # CHECK EVERY ID BEFORE ANYTHING IS REMOVED
+        edge_ids = self.validate_edge_ids(network, edge_ids)
+
+        # TAKE A COPY-ON-WRITE SNAPSHOT OF THE NETWORK
+        new_network = network.snapshot()
+
+        # REMOVE THE EDGES, THEN NODES THAT NO LONGER HAVE ANY EDGES CONNECTED TO THEM
+        if isinstance(new_network, NetworkArrays):
+            new_network.remove_edges(edge_ids)
+            new_network.remove_orphan_nodes()
+        else:
+            endpoint_ids = set()
+            for edge_id in edge_ids:
+                edge = new_network.get_edge_by_id(edge_id)
+                if edge is not None:
+                    endpoint_ids.update((edge.n_from, edge.n_to))
+                new_network.remove_edge(edge_id)
+            self._remove_orphan_nodes(new_network, endpoint_ids)
+
+        Logger.log("end degrade_edges(self, network, edge_ids)")
+        return new_network
+
+    def degrade_nodes(self, network, node_ids):
+        """
+        Creates a degraded version of the network without any of the specified nodes and their associated edges.
+
+        Params:
+            network: network object to be degraded.
+            node_ids: ids of nodes to be removed.
+
+        Returns:
+            A new Network object with the specified nodes and their edges removed.
+
+        Raises:
+            NodeNotFoundError: Listing every node id that is not in the network.
+        """
+        Logger.log("start degrade_nodes(self, network, node_ids)")
+
+        # CHECK EVERY ID BEFORE ANYTHING IS REMOVED
+        node_ids = self.validate_node_ids(network, node_ids)
+
+        # TAKE A COPY-ON-WRITE SNAPSHOT OF THE NETWORK
+        new_network = network.snapshot()
+
+        # REMOVE THE NODES AND THEIR EDGES, THEN NODES THAT NO LONGER HAVE ANY EDGES CONNECTED TO THEM
+        if isinstance(new_network, NetworkArrays):
+            new_network.remove_nodes(node_ids)
+            new_network.remove_orphan_nodes()
+        else:
+            endpoint_ids = set()
+            for node_id in node_ids:
+                new_network.remove_node(node_id)
+                for edge in new_network.get_edges_by_node_id(node_id):
+                    endpoint_ids.update((edge.n_from, edge.n_to))
+                    new_network.remove_edge(edge.get_id())
+            self._remove_orphan_nodes(new_network, endpoint_ids)
+
+        Logger.log("end degrade_nodes(self, network, node_ids)")
+        return new_network
+
     def relax_network(self, network):
         """
         NoPhysics relaxes the network by creating a copy of the network.
@@ -88,8 +177,31 @@ class NoPhysics(DegradationEngineStrategy):
         """
         Logger.log("start relax_network(self, network)")
 
-        # CREATE A COPY OF THE NETWORK
-        new_network = copy.deepcopy(network)
+        # TAKE A COPY-ON-WRITE SNAPSHOT OF THE NETWORK
+        new_network = network.snapshot()
 
         Logger.log("end relax_network(self, network)")
         return new_network
+
+    def _remove_orphan_nodes(self, network, node_ids):
+        """
+        Removes the nodes among node_ids that no longer have any edges connected to them.
+
+        Only the endpoints of the removed edges can have become orphans, and their degrees
+        are O(1) lookups. Nodes that had no edges before the degradation, e.g. in a freshly
+        loaded network, are caught by the isolated node count and removed in one full sweep,
+        after which the count stays zero.
+
+        Params:
+            network: network object to prune.
+            node_ids: ids of the endpoints of the removed edges.
+        """
+        for node_id in node_ids:
+            if network.get_node_by_id(node_id) is not None and network.get_node_degree(node_id) == 0:
+                network.remove_node(node_id)
+
+        # SWEEP NODES THAT WERE ALREADY ISOLATED, ONCE PER NETWORK
+        if network.get_isolated_node_count() > 0:
+            orphan_node_ids = [node.get_id() for node in network.get_nodes() if network.get_node_degree(node.get_id()) == 0]
+            for orphan_node_id in orphan_node_ids:
+                network.remove_node(orphan_node_id)
@@ -0,0 +1,107 @@
+from ..networks.network_arrays import NetworkArrays
+import copy
+import numpy as np
+
+class SolverContext:
+    """
+    Everything the spring force kernel needs from a network except the node coordinates:
+    node and edge ids, endpoint rows, rest lengths, the stiffness, the fixed node mask
+    and the rows of the free nodes.
+
+    A context belongs to one topology_version of a network. Engines cache contexts by
+    version, so repeated relaxations of an unchanged topology skip all setup, and derive
+    the context of a degraded network with patch instead of reading every edge again.
+    The arrays are read only because they are shared between relaxations.
+    """
+
+    def __init__(self, topology_version, node_ids, edge_ids, edge_from, edge_to, rest_lengths, is_fixed, k):
+        """
+        Initializes the context.
+
+        Params:
+            topology_version: topology_version of the network the context describes.
+            node_ids: id of every node row.
+            edge_ids: id of every edge row.
+            edge_from, edge_to: node rows of the edge endpoints.
+            rest_lengths: rest length of every edge, NaN for edges without one.
+            is_fixed: boolean fixed flag of every node row.
+            k (float): spring stiffness constant.
+        """
+        self.topology_version = topology_version
+        self.node_ids = node_ids
+        self.edge_ids = edge_ids
+        self.edge_from = edge_from
+        self.edge_to = edge_to
+        self.rest_lengths = rest_lengths
+        self.is_fixed = is_fixed
+        self.k = k
+        self.free = ~is_fixed
+        self.free_rows = np.flatnonzero(self.free)
+        for array in (node_ids, edge_ids, edge_from, edge_to, rest_lengths, is_fixed, self.free, self.free_rows):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_network(cls, network):
+        """
+        Builds the context of a Network2D or NetworkArrays, reading every node and edge once.
+        """
+        k = network.meta_data.get("spring_stiffness_constant", 1.0)
+
+        # ARRAY BACKED NETWORKS ALREADY STORE THESE COLUMNS, AND NEVER CHANGE THEM IN PLACE
+        if isinstance(network, NetworkArrays):
+            return cls(network.topology_version, network.node_ids, network.edge_ids, network.edge_from,
+                       network.edge_to, network.rest_length, network.is_fixed, k)
+
+        nodes = network.get_nodes()
+        edges = network.get_edges()
+
+        # MAP NODE IDS TO ROW INDICES ONCE INSTEAD OF SEARCHING PER EDGE
+        node_index = {node.get_id(): i for i, node in enumerate(nodes)}
+        is_fixed = np.fromiter((bool(getattr(node, "is_fixed", False)) for node in nodes), dtype=bool, count=len(nodes))
+        edge_from = np.fromiter((node_index[edge.n_from] for edge in edges), dtype=np.intp, count=len(edges))
+        edge_to = np.fromiter((node_index[edge.n_to] for edge in edges), dtype=np.intp, count=len(edges))
+        rest_lengths = np.fromiter((getattr(edge, "rest_length", np.nan) for edge in edges), dtype=np.float64, count=len(edges))
+
+        return cls(network.topology_version, np.array(list(node_index)), np.array([edge.get_id() for edge in edges]),
+                   edge_from, edge_to, rest_lengths, is_fixed, k)
+
+    def with_stiffness(self, k):
+        """Returns the context with another spring stiffness constant, sharing every array."""
+        context = copy.copy(self)
+        context.k = k
+        return context
+
+    def get_node_rows(self, node_ids):
+        """Returns the rows of the given node ids, skipping unknown ids."""
+        node_ids = list(node_ids)
+        if not node_ids:
+            return np.array([], dtype=np.intp)
+        return np.flatnonzero(np.isin(self.node_ids, np.array(node_ids)))
+
+    def patch(self, topology_version, removed_node_ids=(), removed_edge_ids=()):
+        """
+        Returns the context of the network left after removing nodes and edges.
+
+        Rows keep their order, as in the networks: removed rows are dropped, the edges of
+        removed nodes go with them and the endpoints of the other edges are remapped.
+
+        Params:
+            topology_version: topology_version of the network after the removals.
+            removed_node_ids: ids of the removed nodes.
+            removed_edge_ids: ids of the removed edges.
+        """
+        edge_keep = np.ones(len(self.edge_ids), dtype=bool)
+        removed_edge_ids = list(removed_edge_ids)
+        if removed_edge_ids:
+            edge_keep &= ~np.isin(self.edge_ids, np.array(removed_edge_ids))
+        node_keep = np.ones(len(self.node_ids), dtype=bool)
+        node_keep[self.get_node_rows(removed_node_ids)] = False
+        edge_keep &= node_keep[self.edge_from] & node_keep[self.edge_to]
+
+        # MAP OLD NODE ROWS TO NEW NODE ROWS
+        new_rows = np.cumsum(node_keep, dtype=np.intp) - 1
+        return SolverContext(
+            topology_version, self.node_ids[node_keep], self.edge_ids[edge_keep],
+            new_rows[self.edge_from[edge_keep]], new_rows[self.edge_to[edge_keep]],
+            self.rest_lengths[edge_keep], self.is_fixed[node_keep], self.k,
+        )
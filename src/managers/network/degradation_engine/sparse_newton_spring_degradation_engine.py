@@ -0,0 +1,204 @@
+from utils.logger.logger import Logger
+from .two_dimensional_spring_force_degradation_engine_without_biomechanics import TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+from .convergence_report import ConvergenceReport
+from ..networks.network_2d import Network2D
+import time
+import numpy as np
+
+class SparseNewtonSpringDegradationEngine(TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics):
+    """
+    Degrades a 2D spring network like TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+    but finds the equilibrium with Newton iterations instead of fixed step gradient descent.
+
+    The stiffness matrix is assembled as one 2x2 block per edge. Fixed nodes are Dirichlet
+    constraints: their rows and columns are eliminated. Each Newton step is solved with
+    conjugate gradient preconditioned by the inverse 2x2 diagonal block of every node, and
+    followed by a backtracking line search on the elastic energy. Compressed springs make
+    the matrix indefinite; conjugate gradient then stops at the first direction of negative
+    curvature (truncated Newton), which still gives a descent direction.
+    """
+
+    # NEWTON SETTINGS, TOLERANCE IS INHERITED
+    NEWTON_ITERATIONS = 500
+    CG_ITERATIONS = 2000
+    CG_TOLERANCE = 1e-10
+    MIN_STEP = 1e-6
+
+    def __init__(self, force_workers=1):
+        """
+        Initializes the engine. Relaxation is always global.
+
+        Params:
+            force_workers (int): see TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics.
+        """
+        super().__init__(self.GLOBAL_RELAXATION, force_workers=force_workers)
+
+    def relax_network(self, network: Network2D, **relaxation_settings):
+        """
+        Moves the free nodes to the equilibrium of the spring network with Newton iterations.
+        The iterations, residual and solver work are stored in last_convergence_report.
+
+        Params:
+            network: the network to relax.
+            relaxation_settings: max_iterations or tolerance overriding the network metadata
+                                 and the NEWTON_ITERATIONS and TOLERANCE defaults.
+        """
+        Logger.log(f"start sparse newton relax_network(self, network={network})")
+        start = time.perf_counter()
+        max_iterations = int(self.resolve_relaxation_setting(
+            network, relaxation_settings.get("max_iterations"), "relaxation_max_iterations", self.NEWTON_ITERATIONS))
+        tolerance = float(self.resolve_relaxation_setting(
+            network, relaxation_settings.get("tolerance"), "relaxation_tolerance", self.TOLERANCE))
+        force_workers = self.get_force_workers(network)
+        context = self.get_solver_context(network)
+        positions = self.get_positions(network)
+        edge_from, edge_to, rest_lengths, k = context.edge_from, context.edge_to, context.rest_lengths, context.k
+        is_fixed, free = context.is_fixed, context.free
+
+        # EDGES WITHOUT A REST LENGTH ALWAYS REST AT THEIR CURRENT LENGTH AND NEVER PULL
+        springs = ~np.isnan(rest_lengths)
+        edge_from, edge_to, rest_lengths = edge_from[springs], edge_to[springs], rest_lengths[springs]
+
+        max_force = self.get_max_force(positions, edge_from, edge_to, rest_lengths, k, free, force_workers)
+        iterations = 0
+        cg_iterations = 0
+        while max_force >= tolerance and iterations < max_iterations:
+            iterations += 1
+            forces = self.compute_spring_forces(positions, edge_from, edge_to, rest_lengths, k, force_workers)
+            forces[is_fixed] = 0.0
+
+            # SOLVE K dx = F FOR THE FREE NODES
+            blocks = self.get_stiffness_blocks(positions, edge_from, edge_to, rest_lengths, k)
+            step, solver_iterations = self.solve_newton_step(blocks, edge_from, edge_to, forces, is_fixed)
+            cg_iterations += solver_iterations
+
+            # BACKTRACK UNTIL THE ENERGY DROPS
+            energy = self.get_elastic_energy(positions, edge_from, edge_to, rest_lengths, k)
+            scale = 1.0
+            while scale >= self.MIN_STEP:
+                trial = positions + scale * step
+                if self.get_elastic_energy(trial, edge_from, edge_to, rest_lengths, k) <= energy:
+                    break
+                scale *= 0.5
+            else:
+                Logger.log("Line search could not reduce the energy, stopping Newton iterations")
+                break
+
+            positions = trial
+            max_force = self.get_max_force(positions, edge_from, edge_to, rest_lengths, k, free, force_workers)
+
+        self.set_node_positions(network, positions, free)
+        self.last_convergence_report = ConvergenceReport(
+            "sparse_newton", iterations, float(max_force), bool(max_force < tolerance),
+            time.perf_counter() - start, {"cg_iterations": cg_iterations},
+        )
+        Logger.log(f"Sparse newton relaxation: {self.last_convergence_report}")
+        Logger.log(f"end sparse newton relax_network(self, network={network})")
+
+    def relax_after_removal(self, network: Network2D, seed_node_ids):
+        """Relaxes the whole network after a degradation, whatever relaxation_mode the metadata sets."""
+        self.relax_network(network)
+
+    def get_stiffness_blocks(self, positions, edge_from, edge_to, rest_lengths, k):
+        """
+        Returns the (E, 2, 2) tangent stiffness block of every spring.
+
+        Each block is k (u u^T + (1 - L0 / L) (I - u u^T)) where u is the unit vector along
+        the spring. The block couples its two nodes with +block on the diagonal and -block
+        off the diagonal.
+        """
+        vectors = positions[edge_to] - positions[edge_from]
+        lengths = np.sqrt(vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1])
+        units = np.zeros_like(vectors)
+        np.divide(vectors, lengths[:, None], out=units, where=lengths[:, None] != 0)
+
+        # THE GEOMETRIC STIFFNESS IS NEGATIVE FOR COMPRESSED SPRINGS
+        geometric = np.zeros_like(lengths)
+        np.divide(rest_lengths, lengths, out=geometric, where=lengths != 0)
+        geometric = 1.0 - geometric
+
+        outer = units[:, :, None] * units[:, None, :]
+        identity = np.eye(2)[None, :, :]
+        return k * (outer + geometric[:, None, None] * (identity - outer))
+
+    def solve_newton_step(self, blocks, edge_from, edge_to, forces, is_fixed):
+        """
+        Solves K dx = forces for the free nodes with block Jacobi preconditioned conjugate gradient.
+
+        Returns:
+            tuple: ((N, 2) displacement with zero rows for fixed nodes, iterations run).
+        """
+        node_count = len(forces)
+
+        def multiply(vector):
+            # y = K v, ASSEMBLED EDGE BY EDGE
+            edge_forces = np.einsum("eij,ej->ei", blocks, vector[edge_to] - vector[edge_from])
+            result = np.empty_like(vector)
+            for axis in range(2):
+                result[:, axis] = (
+                    np.bincount(edge_to, weights=edge_forces[:, axis], minlength=node_count)
+                    - np.bincount(edge_from, weights=edge_forces[:, axis], minlength=node_count)
+                )
+            result[is_fixed] = 0.0
+            return result + shift * vector
+
+        # POSITIVE DEFINITE DIAGONAL 2x2 BLOCK OF EVERY NODE FOR THE PRECONDITIONER,
+        # WITHOUT NEGATIVE GEOMETRIC STIFFNESS AND SHIFTED SO FLOATING NODES STAY SOLVABLE
+        definite_blocks = self.get_definite_blocks(blocks)
+        diagonal = np.zeros((node_count, 2, 2))
+        np.add.at(diagonal, edge_from, definite_blocks)
+        np.add.at(diagonal, edge_to, definite_blocks)
+        shift = 1e-12 * max(float(np.abs(diagonal).max()) if len(diagonal) else 0.0, 1.0)
+        diagonal[:, 0, 0] += shift
+        diagonal[:, 1, 1] += shift
+        determinant = diagonal[:, 0, 0] * diagonal[:, 1, 1] - diagonal[:, 0, 1] * diagonal[:, 1, 0]
+        inverse = np.empty_like(diagonal)
+        inverse[:, 0, 0] = diagonal[:, 1, 1]
+        inverse[:, 1, 1] = diagonal[:, 0, 0]
+        inverse[:, 0, 1] = -diagonal[:, 0, 1]
+        inverse[:, 1, 0] = -diagonal[:, 1, 0]
+        inverse /= determinant[:, None, None]
+
+        def precondition(vector):
+            result = np.einsum("nij,nj->ni", inverse, vector)
+            result[is_fixed] = 0.0
+            return result
+
+        # PRECONDITIONED CONJUGATE GRADIENT
+        solution = np.zeros_like(forces)
+        residual = forces.copy()
+        target = self.CG_TOLERANCE * np.sqrt((residual * residual).sum())
+        preconditioned = precondition(residual)
+        direction = preconditioned.copy()
+        residual_dot = (residual * preconditioned).sum()
+        iterations = 0
+        for iterations in range(1, self.CG_ITERATIONS + 1):
+            product = multiply(direction)
+            curvature = (direction * product).sum()
+            if curvature <= 0:
+                # NEGATIVE CURVATURE: KEEP THE STEP SO FAR, OR THE PRECONDITIONED FORCE IF THERE IS NONE
+                if iterations == 1:
+                    solution = direction
+                break
+            step = residual_dot / curvature
+            solution += step * direction
+            residual -= step * product
+            if np.sqrt((residual * residual).sum()) <= target:
+                break
+            preconditioned = precondition(residual)
+            next_residual_dot = (residual * preconditioned).sum()
+            direction = preconditioned + (next_residual_dot / residual_dot) * direction
+            residual_dot = next_residual_dot
+        return solution, iterations
+
+    @staticmethod
+    def get_definite_blocks(blocks):
+        """Returns the stiffness blocks with negative eigenvalues clipped to zero."""
+        eigenvalues, eigenvectors = np.linalg.eigh(blocks)
+        eigenvalues = np.maximum(eigenvalues, 0.0)
+        return np.einsum("eij,ej,ekj->eik", eigenvectors, eigenvalues, eigenvectors)
+
+    def get_max_force(self, positions, edge_from, edge_to, rest_lengths, k, free, force_workers=None):
+        """Returns the largest net force on a free node, see compute_spring_forces for force_workers."""
+        free_forces = self.compute_spring_forces(positions, edge_from, edge_to, rest_lengths, k, force_workers)[free]
+        return np.sqrt((free_forces * free_forces).sum(axis=1)).max() if len(free_forces) else 0.0
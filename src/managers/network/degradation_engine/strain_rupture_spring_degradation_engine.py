@@ -0,0 +1,123 @@
+from utils.logger.logger import Logger
+from .two_dimensional_spring_force_degradation_engine_without_biomechanics import TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+from .convergence_report import ConvergenceReport
+from ..networks.network_2d import Network2D
+from ..networks.network_arrays import NetworkArrays
+import time
+import numpy as np
+
+class StrainRuptureSpringDegradationEngine(TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics):
+    """
+    Degrades a 2D spring network like TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+    and then lets overloaded fibers break on their own.
+
+    After the relaxation that follows a degradation, every edge whose strain
+    (length - rest_length) / rest_length is above the rupture strain is removed and the
+    network is relaxed again, until no edge exceeds it. The cascade runs on the force
+    arrays: ruptured edges are masked out and, after the first pass, only edges touching
+    a node that moved are checked again. The network is updated once at the end.
+
+    The rupture strain can be set on the engine, or through the network metadata key
+    rupture_strain, which takes precedence. The steps of the last cascade are stored in
+    last_cascade.
+    """
+
+    # DEFAULT STRAIN ABOVE WHICH AN EDGE RUPTURES
+    RUPTURE_STRAIN = 1.0
+
+    def __init__(self, rupture_strain=RUPTURE_STRAIN, relaxation_mode=TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics.GLOBAL_RELAXATION,
+                 active_hops=2, minimizer="gradient_descent", force_workers=1):
+        """
+        Initializes the engine.
+
+        Params:
+            rupture_strain (float): strain above which an edge ruptures.
+            relaxation_mode, active_hops, minimizer, force_workers: see TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics.
+        """
+        super().__init__(relaxation_mode, active_hops, minimizer, force_workers)
+        self.rupture_strain = rupture_strain
+        self.last_cascade = []
+
+    def relax_after_removal(self, network: Network2D, seed_node_ids):
+        """
+        Relaxes the network after a degradation and ruptures overloaded edges until none is left.
+
+        Each entry of last_cascade is a dict with the step number, the ids of the edges
+        that ruptured, their largest strain and the ConvergenceReport of the relaxation
+        that followed.
+
+        Params:
+            network: the degraded network, changed in place.
+            seed_node_ids: ids of the nodes that were attached to the removed elements.
+        """
+        Logger.log(f"start strain rupture relax_after_removal(self, network={network})")
+        start = time.perf_counter()
+        rupture_strain = float(network.meta_data.get("rupture_strain", self.rupture_strain))
+        settings = self.get_relaxation_settings(network)
+        context = self.get_solver_context(network)
+        positions = self.get_positions(network)
+        edge_from, edge_to, rest_lengths, k, free = (context.edge_from, context.edge_to, context.rest_lengths,
+                                                     context.k, context.free)
+
+        # FIRST RELAXATION, THEN EVERY EDGE IS A RUPTURE CANDIDATE
+        intact = np.ones(len(edge_from), dtype=bool)
+        candidates = intact.copy()
+        report = self.relax_arrays(positions, edge_from, edge_to, rest_lengths, k, free,
+                                   context.get_node_rows(seed_node_ids), settings)
+        iterations = report.iterations
+        self.last_cascade = []
+
+        while True:
+            # STRAIN OF THE CANDIDATE EDGES IN ONE VECTORIZED PASS
+            rows = np.flatnonzero(candidates)
+            strains = self.get_edge_strains(positions, edge_from[rows], edge_to[rows], rest_lengths[rows])
+            overloaded = strains > rupture_strain
+            if not overloaded.any():
+                break
+            ruptured = rows[overloaded]
+            intact[ruptured] = False
+
+            # RELAX WITHOUT THE RUPTURED EDGES, FROM THE NODES THEY WERE ATTACHED TO
+            previous_positions = positions.copy()
+            report = self.relax_arrays(positions, edge_from[intact], edge_to[intact], rest_lengths[intact], k, free,
+                                       np.unique(np.concatenate([edge_from[ruptured], edge_to[ruptured]])), settings)
+            iterations += report.iterations
+            self.last_cascade.append({
+                "step": len(self.last_cascade) + 1,
+                "ruptured_edge_ids": ruptured,
+                "max_strain": float(strains[overloaded].max()),
+                "relaxation": report,
+            })
+
+            # ONLY EDGES TOUCHING A NODE THAT MOVED CAN HAVE BECOME OVERLOADED
+            moved = (positions != previous_positions).any(axis=1)
+            candidates = intact & (moved[edge_from] | moved[edge_to])
+
+        # APPLY THE CASCADE TO THE NETWORK ONCE
+        ruptured_rows = np.flatnonzero(~intact)
+        if len(ruptured_rows):
+            edge_ids = context.edge_ids.tolist()
+            for step in self.last_cascade:
+                step["ruptured_edge_ids"] = [edge_ids[row] for row in step["ruptured_edge_ids"].tolist()]
+            ruptured_edge_ids = [edge_ids[row] for row in ruptured_rows.tolist()]
+            if isinstance(network, NetworkArrays):
+                network.remove_edges(ruptured_edge_ids)
+            else:
+                for edge_id in ruptured_edge_ids:
+                    network.remove_edge(edge_id)
+            self.patch_solver_context(context, network, removed_edge_ids=ruptured_edge_ids)
+        self.set_node_positions(network, positions, free)
+
+        self.last_convergence_report = ConvergenceReport(
+            f"rupture_cascade_{report.method}", iterations, report.max_force, report.converged,
+            time.perf_counter() - start,
+            {"cascade_steps": len(self.last_cascade), "ruptured_edges": int(len(ruptured_rows))},
+        )
+        Logger.log(f"Rupture cascade: {self.last_convergence_report}")
+        Logger.log(f"end strain rupture relax_after_removal(self, network={network})")
+
+    def relax_arrays(self, positions, edge_from, edge_to, rest_lengths, k, free, seed_rows, settings):
+        """Relaxes positions in place with the relaxation mode of the settings and returns the ConvergenceReport."""
+        if settings["relaxation_mode"] == self.INCREMENTAL_RELAXATION:
+            return self.relax_positions_incremental(positions, edge_from, edge_to, rest_lengths, k, free, seed_rows, settings)
+        return self.relax_positions(positions, edge_from, edge_to, rest_lengths, k, free, settings)
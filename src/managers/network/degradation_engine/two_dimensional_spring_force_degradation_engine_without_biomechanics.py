@@ -1,26 +1,111 @@
 from utils.logger.logger import Logger
 from .degradation_engine_strategy import DegradationEngineStrategy
 from ..networks.network_2d import Network2D
-import copy
+from ..networks.network_arrays import NetworkArrays
+from .convergence_report import ConvergenceReport
+from .solver_context import SolverContext
+from .minimizers.gradient_descent_minimizer import GradientDescentMinimizer
+from .minimizers.backtracking_gradient_descent_minimizer import BacktrackingGradientDescentMinimizer
+from .minimizers.fire_minimizer import FireMinimizer
+from .minimizers.nonlinear_conjugate_gradient_minimizer import NonlinearConjugateGradientMinimizer
+from concurrent.futures import ThreadPoolExecutor
+import time
 import numpy as np
 
 class TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics(DegradationEngineStrategy):
     """
     Degrades a 2D spring network by removing edges or nodes and recalculating equilibrium
     based on Hooke's Law, without considering biological forces.
+
+    In "incremental" relaxation mode a degradation first relaxes only the nodes within
+    active_hops hops of the removed element, starting from the previous equilibrium, and
+    grows that set until the residual force on every free node is below the tolerance.
+
+    The minimizer, iteration limit, tolerance and step can be set per relax_network call,
+    through the network metadata keys relaxation_minimizer, relaxation_max_iterations,
+    relaxation_tolerance and relaxation_step, or on the engine, in that order of precedence.
+    The relaxation mode, active hops and force workers are read from the relaxation_mode,
+    relaxation_active_hops and relaxation_force_workers metadata keys, falling back to
+    the engine.
+
+    The endpoint rows, rest lengths, stiffness and fixed mask of a network are kept in a
+    SolverContext cached by topology_version. Degradations patch the context of the
+    network they start from, so a run only reads node coordinates before each relaxation.
+
+    Networks with more than FORCE_CHUNK_EDGES edges have their spring forces computed in
+    fixed size edge chunks, on force_workers threads when more than one is configured.
+    NumPy releases the GIL inside the chunk kernels, so the chunks run in parallel. Each
+    chunk accumulates into its own force array, and the arrays are added in chunk order,
+    so the forces are bit for bit the same for any number of workers.
     """
 
+    GLOBAL_RELAXATION = "global"
+    INCREMENTAL_RELAXATION = "incremental"
+
+    # RELAXATION MINIMIZERS BY NAME
+    RELAXATION_MINIMIZERS = {
+        "gradient_descent": GradientDescentMinimizer,
+        "backtracking": BacktrackingGradientDescentMinimizer,
+        "fire": FireMinimizer,
+        "nonlinear_cg": NonlinearConjugateGradientMinimizer,
+    }
+
+    # DEFAULT RELAXATION SETTINGS
+    ITERATIONS = 1000
+    ALPHA = 0.01
+    TOLERANCE = 1e-5
+
+    # NUMBER OF SOLVER CONTEXTS KEPT, THE OLDEST IS DROPPED FIRST
+    SOLVER_CONTEXT_CACHE_SIZE = 8
+
+    # EDGES PER FORCE KERNEL CHUNK, INDEPENDENT OF THE WORKER COUNT SO RESULTS ARE TOO
+    FORCE_CHUNK_EDGES = 1 << 20
+
+    def __init__(self, relaxation_mode=GLOBAL_RELAXATION, active_hops=2, minimizer="gradient_descent", force_workers=1):
+        """
+        Initializes the engine.
+
+        Params:
+            relaxation_mode (str): "global" relaxes every free node after a degradation,
+                                   "incremental" starts from the neighbourhood of the removed element.
+            active_hops (int): hops around the removed element in the first active set of
+                               incremental mode.
+            minimizer (str): default relaxation minimizer, a key of RELAXATION_MINIMIZERS.
+            force_workers (int): threads computing the force chunks of large networks.
+
+        Raises:
+            ValueError: If relaxation_mode or minimizer is unknown, or force_workers is below 1.
+        """
+        super().__init__()
+        if relaxation_mode not in (self.GLOBAL_RELAXATION, self.INCREMENTAL_RELAXATION):
+            raise ValueError(f"Invalid relaxation mode: '{relaxation_mode}'")
+        if minimizer not in self.RELAXATION_MINIMIZERS:
+            raise ValueError(f"Invalid relaxation minimizer: '{minimizer}'")
+        if force_workers < 1:
+            raise ValueError(f"Invalid force worker count: {force_workers}")
+        self.relaxation_mode = relaxation_mode
+        self.active_hops = active_hops
+        self.minimizer = minimizer
+        self.last_convergence_report = None
+        self._solver_contexts = {}
+        self.force_workers = force_workers
+        self._force_executor = None
+        self._force_executor_workers = None
+
     def degrade_edge(self, network: Network2D, edge_id):
         Logger.log(f"start degrade_edge(self, network, {edge_id})")
 
-        # Step 1: Copy the network to avoid in-place changes
-        degraded_network = copy.deepcopy(network)
+        # Step 1: Take a copy-on-write snapshot of the network to avoid in-place changes
+        context = self.get_solver_context(network)
+        degraded_network = network.snapshot()
 
         # Step 2: Remove the specified edge
+        seed_node_ids = self.get_edge_node_ids(degraded_network, edge_id)
         degraded_network.remove_edge(edge_id)
+        self.patch_solver_context(context, degraded_network, removed_edge_ids=[edge_id])
 
         # Step 3: Relax the network to restore equilibrium
-        self.relax_network(degraded_network)
+        self.relax_after_removal(degraded_network, seed_node_ids)
 
         Logger.log(f"end degrade_edge(self, network, {edge_id})")
         return degraded_network
@@ -28,103 +113,559 @@ class TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics(DegradationE
     def degrade_node(self, network: Network2D, node_id):
         Logger.log(f"start degrade_node(self, network, {node_id})")
 
-        # Step 1: Deep copy the network
-        degraded_network = copy.deepcopy(network)
+        # Step 1: Take a copy-on-write snapshot of the network
+        context = self.get_solver_context(network)
+        degraded_network = network.snapshot()
 
         # Step 2: Remove the node
+        seed_node_ids = self.get_neighbor_node_ids(degraded_network, node_id)
         degraded_network.remove_node(node_id)
 
         # Step 3: Remove all edges connected to that node
-        connected_edges = [
-            edge.get_id() for edge in degraded_network.get_edges()
-            if edge.n_from == node_id or edge.n_to == node_id
-        ]
-        for eid in connected_edges:
-            degraded_network.remove_edge(eid)
+        # (NetworkArrays.remove_node already drops the connected edges)
+        if not isinstance(degraded_network, NetworkArrays):
+            connected_edges = [edge.get_id() for edge in degraded_network.get_edges_by_node_id(node_id)]
+            for eid in connected_edges:
+                degraded_network.remove_edge(eid)
+        self.patch_solver_context(context, degraded_network, removed_node_ids=[node_id])
 
         # Step 4: Relax the network to find new equilibrium
-        self.relax_network(degraded_network)
+        self.relax_after_removal(degraded_network, seed_node_ids)
 
         Logger.log(f"end degrade_node(self, network, {node_id})")
         return degraded_network
 
-    def relax_network(self, network: Network2D):
+    def degrade_edges(self, network: Network2D, edge_ids):
+        """
+        Removes several edges and relaxes the network once.
+
+        Raises:
+            EdgeNotFoundError: Listing every edge id that is not in the network.
+        """
+        Logger.log("start degrade_edges(self, network, edge_ids)")
+
+        # Step 1: Check every id, then take a copy-on-write snapshot of the network
+        edge_ids = self.validate_edge_ids(network, edge_ids)
+        context = self.get_solver_context(network)
+        degraded_network = network.snapshot()
+
+        # Step 2: Remove every edge, remembering the nodes they were attached to
+        seed_node_ids = set()
+        for edge_id in edge_ids:
+            seed_node_ids.update(self.get_edge_node_ids(degraded_network, edge_id))
+        if isinstance(degraded_network, NetworkArrays):
+            degraded_network.remove_edges(edge_ids)
+        else:
+            for edge_id in edge_ids:
+                degraded_network.remove_edge(edge_id)
+        self.patch_solver_context(context, degraded_network, removed_edge_ids=edge_ids)
+
+        # Step 3: Relax the network once to restore equilibrium
+        self.relax_after_removal(degraded_network, seed_node_ids)
+
+        Logger.log("end degrade_edges(self, network, edge_ids)")
+        return degraded_network
+
+    def degrade_nodes(self, network: Network2D, node_ids):
+        """
+        Removes several nodes with their edges and relaxes the network once.
+
+        Raises:
+            NodeNotFoundError: Listing every node id that is not in the network.
+        """
+        Logger.log("start degrade_nodes(self, network, node_ids)")
+
+        # Step 1: Check every id, then take a copy-on-write snapshot of the network
+        node_ids = self.validate_node_ids(network, node_ids)
+        context = self.get_solver_context(network)
+        degraded_network = network.snapshot()
+
+        # Step 2: Remember the surviving neighbours of the removed nodes
+        seed_node_ids = set()
+        for node_id in node_ids:
+            seed_node_ids.update(self.get_neighbor_node_ids(degraded_network, node_id))
+        seed_node_ids.difference_update(node_ids)
+
+        # Step 3: Remove the nodes and all edges connected to them
+        # (NetworkArrays.remove_nodes already drops the connected edges)
+        if isinstance(degraded_network, NetworkArrays):
+            degraded_network.remove_nodes(node_ids)
+        else:
+            for node_id in node_ids:
+                degraded_network.remove_node(node_id)
+                for edge in degraded_network.get_edges_by_node_id(node_id):
+                    degraded_network.remove_edge(edge.get_id())
+        self.patch_solver_context(context, degraded_network, removed_node_ids=node_ids)
+
+        # Step 4: Relax the network once to find the new equilibrium
+        self.relax_after_removal(degraded_network, seed_node_ids)
+
+        Logger.log("end degrade_nodes(self, network, node_ids)")
+        return degraded_network
+
+    def relax_network(self, network: Network2D, **relaxation_settings):
         """
         Applies a physics-based relaxation method using Hooke's Law to update node positions.
+        The convergence report is stored in last_convergence_report.
+
+        Params:
+            network: the network to relax.
+            relaxation_settings: minimizer, max_iterations, tolerance or step overriding the
+                                 network metadata and engine defaults.
         """
         Logger.log(f"start 2dwithoutbio relax_network(self, network={network})")
-        iterations = 1000
-        alpha = 0.01
-        tolerance = 1e-5
-        # LOOP FOR A MAXIMUM NUMBER OF ITERATIONS TO RELAX THE NETWORK
-        for _ in range(iterations):
-            # COMPUTE THE FORCES ON EACH NODE USING HOOKE'S LAW
-            forces = self.compute_node_forces(network)
-            max_force = 0.0  # INITIALIZE THE MAX FORCE TO ZERO
-
-            # ITERATE OVER ALL NODES IN THE NETWORK
-            for node in network.get_nodes():
-                # SKIP NODES THAT ARE FIXED IN PLACE
-                if getattr(node, 'is_fixed', False):
-                    continue
-
-                # GET THE FORCE VECTOR FOR THE CURRENT NODE
-                force = forces[node.get_id()]
-                # UPDATE THE MAXIMUM FORCE VALUE
-                max_force = max(max_force, np.linalg.norm(force))
-
-                # UPDATE NODE POSITION IN THE DIRECTION OF THE FORCE (GRADIENT DESCENT STYLE)
-                node.n_x += alpha * force[0]
-                node.n_y += alpha * force[1]
-
-            # IF MAXIMUM FORCE IS BELOW THE TOLERANCE, STOP EARLY (CONVERGENCE REACHED)
-            if max_force < tolerance:
-                break
+        settings = self.get_relaxation_settings(network, **relaxation_settings)
+
+        # THE CACHED CONTEXT HOLDS THE TOPOLOGY, ONLY THE COORDINATES ARE READ
+        context = self.get_solver_context(network)
+        positions = self.get_positions(network)
+        free = context.free
+
+        self.last_convergence_report = self.relax_positions(
+            positions, context.edge_from, context.edge_to, context.rest_lengths, context.k, free, settings)
+
+        # WRITE THE RELAXED POSITIONS BACK ONTO THE FREE NODES
+        self.set_node_positions(network, positions, free)
+        Logger.log(f"Relaxation: {self.last_convergence_report}")
         Logger.log(f"end 2dwithoutbio relax_network(self, network={network})")
 
+    def get_relaxation_settings(self, network: Network2D, minimizer=None, max_iterations=None, tolerance=None, step=None,
+                                relaxation_mode=None, active_hops=None, force_workers=None):
+        """
+        Resolves the relaxation settings from the arguments, the network metadata and the
+        engine defaults, in that order.
+
+        Returns:
+            dict: minimizer (RelaxationMinimizer instance), minimizer_name, max_iterations, tolerance,
+                  step, relaxation_mode, active_hops and force_workers.
+
+        Raises:
+            ValueError: If the minimizer or relaxation mode is unknown, active_hops is negative
+                        or force_workers is below 1.
+        """
+        minimizer_name = minimizer or network.meta_data.get("relaxation_minimizer") or self.minimizer
+        if minimizer_name not in self.RELAXATION_MINIMIZERS:
+            raise ValueError(f"Invalid relaxation minimizer: '{minimizer_name}'")
+        minimizer_class = self.RELAXATION_MINIMIZERS[minimizer_name]
+
+        def resolve(value, meta_key, default):
+            return self.resolve_relaxation_setting(network, value, meta_key, default)
+
+        relaxation_mode = resolve(relaxation_mode, "relaxation_mode", self.relaxation_mode)
+        if relaxation_mode not in (self.GLOBAL_RELAXATION, self.INCREMENTAL_RELAXATION):
+            raise ValueError(f"Invalid relaxation mode: '{relaxation_mode}'")
+        active_hops = int(resolve(active_hops, "relaxation_active_hops", self.active_hops))
+        if active_hops < 0:
+            raise ValueError(f"Invalid active hop count: {active_hops}")
+
+        # THE FIXED STEP OF GRADIENT DESCENT DEFAULTS TO THE ENGINE ALPHA
+        default_step = self.ALPHA if minimizer_class is GradientDescentMinimizer else minimizer_class.DEFAULT_STEP
+        return {
+            "minimizer": minimizer_class(),
+            "minimizer_name": minimizer_name,
+            "max_iterations": int(resolve(max_iterations, "relaxation_max_iterations", self.ITERATIONS)),
+            "tolerance": float(resolve(tolerance, "relaxation_tolerance", self.TOLERANCE)),
+            "step": float(resolve(step, "relaxation_step", default_step)),
+            "relaxation_mode": relaxation_mode,
+            "active_hops": active_hops,
+            "force_workers": self.get_force_workers(network, force_workers),
+        }
+
+    @staticmethod
+    def resolve_relaxation_setting(network: Network2D, value, meta_key, default):
+        """
+        Returns value, else the meta_key network metadata value, else default.
+        Only None counts as unset, so an explicit 0 is kept.
+        """
+        if value is None:
+            value = network.meta_data.get(meta_key)
+        return default if value is None else value
+
+    def get_force_workers(self, network: Network2D, force_workers=None):
+        """
+        Resolves the force kernel thread count from the argument, the relaxation_force_workers
+        network metadata key and the engine force_workers, in that order.
+
+        Raises:
+            ValueError: If the count is below 1.
+        """
+        force_workers = int(self.resolve_relaxation_setting(network, force_workers, "relaxation_force_workers",
+                                                            self.force_workers))
+        if force_workers < 1:
+            raise ValueError(f"Invalid force worker count: {force_workers}")
+        return force_workers
+
+    def relax_after_removal(self, network: Network2D, seed_node_ids):
+        """
+        Relaxes the network after a degradation using the relaxation mode of get_relaxation_settings.
+
+        Params:
+            network: the degraded network.
+            seed_node_ids: ids of the nodes that were attached to the removed element.
+        """
+        if self.get_relaxation_settings(network)["relaxation_mode"] == self.INCREMENTAL_RELAXATION:
+            self.relax_network_incremental(network, seed_node_ids)
+        else:
+            self.relax_network(network)
+
+    def relax_network_incremental(self, network: Network2D, seed_node_ids):
+        """
+        Relaxes the network starting from the nodes around a local perturbation, see
+        relax_positions_incremental.
+
+        Params:
+            network: the network to relax, starting from its current coordinates.
+            seed_node_ids: ids of the nodes next to the perturbation. Unknown ids are ignored.
+        """
+        Logger.log(f"start 2dwithoutbio relax_network_incremental(self, network={network})")
+        settings = self.get_relaxation_settings(network)
+        context = self.get_solver_context(network)
+        positions = self.get_positions(network)
+        free = context.free
+        seed_rows = context.get_node_rows(seed_node_ids)
+
+        self.last_convergence_report = self.relax_positions_incremental(
+            positions, context.edge_from, context.edge_to, context.rest_lengths, context.k, free, seed_rows, settings)
+
+        self.set_node_positions(network, positions, free)
+        Logger.log(f"Relaxation: {self.last_convergence_report}")
+        Logger.log(f"end 2dwithoutbio relax_network_incremental(self, network={network})")
+
+    def relax_positions_incremental(self, positions, edge_from, edge_to, rest_lengths, k, free, seed_rows, settings):
+        """
+        Relaxes positions in place starting from the rows around a local perturbation.
+
+        The free nodes within settings["active_hops"] hops of the seed rows are relaxed with every
+        other node held in place. If the residual force on any free node is still above
+        the tolerance, the active set grows around itself and every unbalanced node, by
+        twice as many hops as the previous growth, until the whole network is balanced or
+        every node is active.
+
+        Params:
+            positions: (N, 2) array of node coordinates, updated in place.
+            edge_from, edge_to, rest_lengths, k: see compute_spring_forces.
+            free: boolean mask of the rows that are not fixed.
+            seed_rows: node rows next to the perturbation.
+            settings (dict): relaxation settings from get_relaxation_settings.
+
+        Returns:
+            ConvergenceReport: total iterations, final max force, phases and active node count.
+        """
+        start = time.perf_counter()
+        active = np.zeros(len(positions), dtype=bool)
+        active[seed_rows] = True
+        hops = settings["active_hops"]
+        active = self.expand_node_mask(active, edge_from, edge_to, hops)
+        iterations = 0
+        phases = 0
+
+        while True:
+            phases += 1
+            moving = active & free
+            all_active = moving.sum() == free.sum()
+            if all_active:
+                report = self.relax_positions(positions, edge_from, edge_to, rest_lengths, k, free, settings)
+                iterations += report.iterations
+                max_force = report.max_force
+                break
+
+            # RELAX ONLY THE ACTIVE NODES, ON THE EDGES THAT TOUCH THEM
+            local_edges = moving[edge_from] | moving[edge_to]
+            local_rows = np.flatnonzero(moving | self.expand_node_mask(moving, edge_from, edge_to, 1))
+            row_map = np.full(len(positions), -1, dtype=np.intp)
+            row_map[local_rows] = np.arange(len(local_rows))
+            local_positions = positions[local_rows]
+            report = self.relax_positions(local_positions, row_map[edge_from[local_edges]], row_map[edge_to[local_edges]],
+                                          rest_lengths[local_edges], k, moving[local_rows], settings)
+            iterations += report.iterations
+            positions[local_rows] = local_positions
+
+            # CHECK THE GLOBAL TOLERANCE, GROWING THE ACTIVE SET AROUND UNBALANCED NODES
+            forces = self.compute_spring_forces(positions, edge_from, edge_to, rest_lengths, k, settings["force_workers"])
+            residual = np.sqrt((forces * forces).sum(axis=1))
+            unbalanced = free & (residual >= settings["tolerance"])
+            max_force = float(residual[free].max()) if free.any() else 0.0
+            if not unbalanced.any():
+                break
+            Logger.log(f"Growing active set of {int(moving.sum())} nodes around {int(unbalanced.sum())} unbalanced nodes")
+            hops *= 2
+            active = self.expand_node_mask(active | unbalanced, edge_from, edge_to, hops)
+
+        return ConvergenceReport(
+            f"incremental_{settings['minimizer_name']}", iterations, max_force, max_force < settings["tolerance"],
+            time.perf_counter() - start, {"phases": phases, "active_nodes": int((active & free).sum())},
+        )
+
+    def get_node_rows(self, network: Network2D, node_ids):
+        """Returns the rows of the given node ids in the get_force_arrays node order, skipping unknown ids."""
+        return self.get_solver_context(network).get_node_rows(node_ids)
+
+    def relax_positions(self, positions, edge_from, edge_to, rest_lengths, k, moving, settings):
+        """
+        Runs the configured minimizer on the rows of positions selected by moving, in place.
+
+        Params:
+            positions: (N, 2) array of node coordinates, updated in place.
+            edge_from, edge_to, rest_lengths, k: see compute_spring_forces.
+            moving: boolean mask of the rows that move and count towards the max force.
+            settings (dict): relaxation settings from get_relaxation_settings.
+
+        Returns:
+            ConvergenceReport: iterations, final max force and wall time.
+        """
+        start = time.perf_counter()
+        iterations, max_force, converged = settings["minimizer"].minimize(
+            positions, moving,
+            lambda trial: self.compute_spring_forces(trial, edge_from, edge_to, rest_lengths, k, settings["force_workers"]),
+            lambda trial: self.get_elastic_energy(trial, edge_from, edge_to, rest_lengths, k),
+            settings["max_iterations"], settings["tolerance"], settings["step"],
+        )
+        return ConvergenceReport(settings["minimizer_name"], iterations, float(max_force), bool(converged),
+                                 time.perf_counter() - start)
+
+    def get_elastic_energy(self, positions, edge_from, edge_to, rest_lengths, k):
+        """
+        Returns the elastic energy k/2 (L - L0)^2 summed over the edges. Edges without a
+        rest length always rest at their current length and store no energy.
+        """
+        vectors = positions[edge_to] - positions[edge_from]
+        extension = np.sqrt(vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1]) - rest_lengths
+        extension = extension[~np.isnan(extension)]
+        return 0.5 * k * (extension * extension).sum()
+
+    def get_edge_strains(self, positions, edge_from, edge_to, rest_lengths):
+        """
+        Returns the strain (L - L0) / L0 of every edge in one vectorized pass. Edges
+        without a positive rest length have a strain of 0.
+        """
+        vectors = positions[edge_to] - positions[edge_from]
+        lengths = np.sqrt(vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1])
+        strains = np.zeros_like(lengths)
+        np.divide(lengths - rest_lengths, rest_lengths, out=strains, where=rest_lengths > 0)
+        return strains
+
+    @staticmethod
+    def expand_node_mask(mask, edge_from, edge_to, hops):
+        """
+        Returns mask grown by every node reachable within hops edges.
+
+        Params:
+            mask: boolean mask over the node rows.
+            edge_from, edge_to: row indices of the edge endpoints.
+            hops (int): number of edges to walk.
+        """
+        mask = mask.copy()
+        for _ in range(hops):
+            touched = mask[edge_from] | mask[edge_to]
+            grown = mask.copy()
+            grown[edge_from[touched]] = True
+            grown[edge_to[touched]] = True
+            if (grown == mask).all():
+                break
+            mask = grown
+        return mask
+
+    def get_edge_node_ids(self, network: Network2D, edge_id):
+        """Returns the ids of the two nodes of an edge, or an empty list if the edge does not exist."""
+        if isinstance(network, NetworkArrays):
+            row = network.get_edge_row(edge_id)
+            if row is None:
+                return []
+            return [network.node_ids[network.edge_from[row]].item(), network.node_ids[network.edge_to[row]].item()]
+        edge = network.get_edge_by_id(edge_id)
+        return [] if edge is None else [edge.n_from, edge.n_to]
+
+    def get_neighbor_node_ids(self, network: Network2D, node_id):
+        """Returns the ids of the nodes that share an edge with a node."""
+        if isinstance(network, NetworkArrays):
+            row = network.get_node_row(node_id)
+            if row is None:
+                return []
+            touching = (network.edge_from == row) | (network.edge_to == row)
+            rows = np.concatenate([network.edge_from[touching], network.edge_to[touching]])
+            return network.node_ids[rows[rows != row]].tolist()
+        neighbor_ids = []
+        for edge in network.get_edges_by_node_id(node_id):
+            neighbor_ids.extend(n_id for n_id in (edge.n_from, edge.n_to) if n_id != node_id)
+        return neighbor_ids
+
     def compute_node_forces(self, network: Network2D):
         """
         Computes net spring force on each node using Hooke's law.
         """
-        # INITIALIZE ZERO FORCE VECTORS FOR ALL NODES
-        forces = {node.get_id(): np.array([0.0, 0.0]) for node in network.get_nodes()}
-        # GET SPRING STIFFNESS CONSTANT (DEFAULT TO 1.0 IF NOT SPECIFIED)
+        # THE CONTEXT HOLDS THE SPRING STIFFNESS CONSTANT (1.0 IF NOT SPECIFIED)
+        context = self.get_solver_context(network)
+        forces = self.compute_spring_forces(self.get_positions(network), context.edge_from, context.edge_to,
+                                            context.rest_lengths, context.k, self.get_force_workers(network))
+
+        # RETURN DICTIONARY OF FORCE VECTORS FOR EACH NODE
+        return {node_id: forces[i] for i, node_id in enumerate(context.node_ids.tolist())}
+
+    def get_force_arrays(self, network: Network2D):
+        """
+        Flattens the network into the contiguous arrays used by the force kernel.
+
+        Returns:
+            tuple: (positions, edge_from, edge_to, rest_lengths, is_fixed) where
+            positions is an (N, 2) float array in node order, edge_from/edge_to are row
+            indices into positions, rest_lengths is NaN for edges without a rest length
+            and is_fixed is a boolean mask over the node rows.
+        """
+        context = self.get_solver_context(network)
+        return self.get_positions(network), context.edge_from, context.edge_to, context.rest_lengths, context.is_fixed
+
+    def get_positions(self, network: Network2D):
+        """Returns a new (N, 2) array of the node coordinates in node order."""
+        if isinstance(network, NetworkArrays):
+            return network.positions.copy()
+        nodes = network.get_nodes()
+        positions = np.empty((len(nodes), 2), dtype=np.float64)
+        for i, node in enumerate(nodes):
+            positions[i, 0] = node.n_x
+            positions[i, 1] = node.n_y
+        return positions
+
+    def get_solver_context(self, network: Network2D):
+        """
+        Returns the SolverContext of the network topology, from the cache when the
+        topology_version was seen before.
+        """
+        context = self._solver_contexts.get(network.topology_version)
+        if context is None:
+            context = SolverContext.from_network(network)
+            self._store_solver_context(context)
         k = network.meta_data.get("spring_stiffness_constant", 1.0)
+        if context.k != k:
+            context = context.with_stiffness(k)
+            self._store_solver_context(context)
+        return context
+
+    def patch_solver_context(self, context, network: Network2D, removed_node_ids=(), removed_edge_ids=()):
+        """
+        Caches the context of a network derived by removing nodes and edges from the
+        network that context belongs to, instead of reading the whole network again.
+        Array backed networks share their columns with the context, so nothing is patched.
+
+        Params:
+            context (SolverContext): context of the network before the removals.
+            network: the network after the removals.
+            removed_node_ids: ids of the removed nodes, their edges are removed with them.
+            removed_edge_ids: ids of the removed edges.
+        """
+        if isinstance(network, NetworkArrays) or network.topology_version in self._solver_contexts:
+            return
+        self._store_solver_context(context.patch(network.topology_version, removed_node_ids, removed_edge_ids))
 
-        # LOOP OVER ALL EDGES TO COMPUTE SPRING FORCES
-        for edge in network.get_edges():
-            # GET NODE OBJECTS FOR BOTH ENDS OF THE EDGE
-            n_from = network.get_node_by_id(edge.n_from)
-            n_to = network.get_node_by_id(edge.n_to)
+    def _store_solver_context(self, context):
+        """Caches a context by topology_version, dropping the oldest beyond SOLVER_CONTEXT_CACHE_SIZE."""
+        self._solver_contexts.pop(context.topology_version, None)
+        self._solver_contexts[context.topology_version] = context
+        while len(self._solver_contexts) > self.SOLVER_CONTEXT_CACHE_SIZE:
+            del self._solver_contexts[next(iter(self._solver_contexts))]
 
-            # GET POSITION VECTORS FOR BOTH NODES
-            p_from = np.array([n_from.n_x, n_from.n_y])
-            p_to = np.array([n_to.n_x, n_to.n_y])
+    def set_node_positions(self, network: Network2D, positions, mask):
+        """
+        Writes node coordinates produced by the force kernel back onto the network.
+
+        Params:
+            network: network the positions were built from by get_force_arrays.
+            positions: (N, 2) array of node coordinates in node order.
+            mask: boolean mask of the node rows to update.
+        """
+        if isinstance(network, NetworkArrays):
+            network.get_writable_positions()[mask] = positions[mask]
+            return
+
+        # ONLY NODES THAT MOVED ARE WRITTEN, SO UNMOVED NODES STAY SHARED WITH SNAPSHOTS
+        nodes = network.get_nodes()
+        for i in np.flatnonzero(mask):
+            x, y = float(positions[i, 0]), float(positions[i, 1])
+            if nodes[i].n_x != x or nodes[i].n_y != y:
+                node = network.get_writable_node(nodes[i].get_id())
+                node.n_x = x
+                node.n_y = y
 
-            # COMPUTE VECTOR AND LENGTH BETWEEN NODES
-            vector = p_to - p_from
-            length = np.linalg.norm(vector)
+    def compute_spring_forces(self, positions, edge_from, edge_to, rest_lengths, k, force_workers=None):
+        """
+        Computes the net Hooke's law force on every node, in one vectorized pass per edge chunk.
 
-            # SKIP ZERO-LENGTH EDGES TO AVOID DIVISION BY ZERO
-            if length == 0:
-                continue
+        Params:
+            positions: (N, 2) array of node coordinates.
+            edge_from: row index of the n_from node of each edge.
+            edge_to: row index of the n_to node of each edge.
+            rest_lengths: rest length of each edge (NaN means the current length is used).
+            k: spring stiffness constant.
+            force_workers (int): threads computing the chunks, the engine force_workers if None.
 
-            # COMPUTE UNIT VECTOR FROM n_from TO n_to
-            unit_vector = vector / length
-            # GET REST LENGTH OF SPRING (DEFAULT TO CURRENT LENGTH IF NOT PROVIDED)
-            rest_length = getattr(edge, "rest_length", length)
+        Returns:
+            (N, 2) array of net force vectors, one row per node.
+        """
+        node_count = len(positions)
+        edge_count = len(edge_from)
+        if edge_count <= self.FORCE_CHUNK_EDGES:
+            return self.compute_chunk_forces(positions, edge_from, edge_to, rest_lengths, k, 0, node_count)
 
-            # COMPUTE SPRING FORCE USING HOOKE’S LAW: F = -k * (x - x₀)
-            force_magnitude = k * (length - rest_length)
-            force = force_magnitude * unit_vector
+        # FIXED CHUNKS, EACH SCATTERED ONTO THE ROW RANGE ITS EDGES TOUCH
+        def compute_chunk(start):
+            chunk = slice(start, start + self.FORCE_CHUNK_EDGES)
+            chunk_from, chunk_to = edge_from[chunk], edge_to[chunk]
+            first_row = int(min(chunk_from.min(), chunk_to.min()))
+            row_count = int(max(chunk_from.max(), chunk_to.max())) + 1 - first_row
+            return first_row, self.compute_chunk_forces(positions, chunk_from, chunk_to, rest_lengths[chunk], k,
+                                                        first_row, row_count)
 
-            # APPLY EQUAL AND OPPOSITE FORCES TO THE TWO CONNECTED NODES
-            forces[n_from.get_id()] += force
-            forces[n_to.get_id()] -= force
+        starts = range(0, edge_count, self.FORCE_CHUNK_EDGES)
+        force_workers = self.force_workers if force_workers is None else force_workers
+        if force_workers > 1:
+            partials = self._get_force_executor(force_workers).map(compute_chunk, starts)
+        else:
+            partials = map(compute_chunk, starts)
 
-        # RETURN DICTIONARY OF FORCE VECTORS FOR EACH NODE
+        # ADD THE CHUNKS IN ORDER WHATEVER THREAD COMPUTED THEM
+        forces = np.zeros((node_count, 2), dtype=np.float64)
+        for first_row, partial in partials:
+            forces[first_row:first_row + len(partial)] += partial
+        return forces
+
+    def compute_chunk_forces(self, positions, edge_from, edge_to, rest_lengths, k, first_row, row_count):
+        """
+        Computes the net Hooke's law force of a set of edges on the node rows
+        first_row to first_row + row_count - 1, see compute_spring_forces.
+
+        Returns:
+            (row_count, 2) array of net force vectors.
+        """
+        # COMPUTE VECTOR AND LENGTH BETWEEN NODES FOR EVERY EDGE
+        vectors = positions[edge_to] - positions[edge_from]
+        lengths = np.sqrt(vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1])
+
+        # EDGES WITHOUT A REST LENGTH ARE TREATED AS RESTING AT THEIR CURRENT LENGTH
+        rest_lengths = np.where(np.isnan(rest_lengths), lengths, rest_lengths)
+
+        # COMPUTE F = k * (x - x0) ALONG THE UNIT VECTOR, SKIPPING ZERO-LENGTH EDGES
+        scale = np.zeros_like(lengths)
+        np.divide(k * (lengths - rest_lengths), lengths, out=scale, where=lengths != 0)
+        edge_forces = vectors * scale[:, None]
+
+        # SCATTER EQUAL AND OPPOSITE FORCES ONTO THE TWO CONNECTED NODES
+        if first_row:
+            edge_from, edge_to = edge_from - first_row, edge_to - first_row
+        forces = np.empty((row_count, 2), dtype=np.float64)
+        for axis in range(2):
+            forces[:, axis] = (
+                np.bincount(edge_from, weights=edge_forces[:, axis], minlength=row_count)
+                - np.bincount(edge_to, weights=edge_forces[:, axis], minlength=row_count)
+            )
         return forces
 
+    def _get_force_executor(self, force_workers):
+        """Returns the thread pool of the force kernel, created on first use or when the thread count changes."""
+        if self._force_executor is None or self._force_executor_workers != force_workers:
+            if self._force_executor is not None:
+                self._force_executor.shutdown(wait=False)
+            self._force_executor = ThreadPoolExecutor(max_workers=force_workers, thread_name_prefix="spring-force")
+            self._force_executor_workers = force_workers
+        return self._force_executor
 
     def get_edge_rest_lengths(self, network: Network2D):
         """
@@ -0,0 +1,245 @@
+from utils.logger.logger import Logger
+from .network_manager import NetworkManager
+from .networks.network_arrays import NetworkArrays
+from .percolation_detector import PercolationDetector
+from .degradation_engine.two_dimensional_spring_force_degradation_engine_without_biomechanics import TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pickle
+import time
+import numpy as np
+
+# PER WORKER PROCESS STATE, SET ONCE BY _initialize_worker
+_worker_state = {}
+
+def _initialize_worker(network_payload, degradation_engine_strategy, element_type):
+    """Unpickles the base network once per worker process and creates its engine."""
+    # WORKERS DO NOT SHARE THE PARENT LOG FILE
+    Logger.disable_logging()
+    _worker_state["network"] = pickle.loads(network_payload)
+    _worker_state["engine"] = NetworkManager.get_degradation_engine_strategy_class(degradation_engine_strategy)()
+    _worker_state["element_type"] = element_type
+    _worker_state["detector"] = PercolationDetector(_worker_state["network"])
+
+def _run_worker_sequence(seed, steps):
+    """Runs one sequence in a worker process on its copy of the base network."""
+    return DegradationEnsemble.run_sequence(
+        _worker_state["network"], _worker_state["engine"], _worker_state["element_type"], seed, steps,
+        _worker_state["detector"])
+
+
+class DegradationEnsembleResult:
+    """
+    Aggregated per-step metrics of a degradation ensemble.
+
+    Every metric is a (sequences, steps + 1) float array whose first column holds the
+    metric of the base network. Sequences that ran out of elements early are padded
+    with NaN.
+
+    rupture_steps holds the step at which each sequence stopped spanning between its
+    fixed boundaries (-1 if it never did) and remaining_fractions the fraction of the
+    initial fibers left at that step (NaN if it never did).
+    """
+
+    def __init__(self, seeds, metrics, removed_ids, step_counts, rupture_steps, remaining_fractions):
+        """
+        Initializes the result.
+
+        Params:
+            seeds: (sequences,) array of the seed of each sequence.
+            metrics (dict): metric name -> (sequences, steps + 1) float array.
+            removed_ids: (sequences, steps) array of the degraded element ids.
+            step_counts: (sequences,) array of the number of degradations each sequence ran.
+            rupture_steps: (sequences,) int array of the step the load path broke at, -1 if it did not.
+            remaining_fractions: (sequences,) array of the fiber fraction left at the rupture step.
+        """
+        self.seeds = seeds
+        self.metrics = metrics
+        self.removed_ids = removed_ids
+        self.step_counts = step_counts
+        self.rupture_steps = rupture_steps
+        self.remaining_fractions = remaining_fractions
+
+    def mean(self, metric):
+        """Returns the per-step mean of a metric across sequences, ignoring padding."""
+        return np.nanmean(self.metrics[metric], axis=0)
+
+    def std(self, metric):
+        """Returns the per-step standard deviation of a metric across sequences, ignoring padding."""
+        return np.nanstd(self.metrics[metric], axis=0)
+
+
+class DegradationEnsemble:
+    """
+    Runs many independent random degradation sequences of the same network in parallel.
+
+    The base network is converted to NetworkArrays and pickled once. Each worker process
+    unpickles it a single time and then runs whole sequences, sending back only the
+    per-step metrics, never networks. A PercolationDetector follows every sequence to
+    record when the network stops spanning between its fixed boundaries.
+    """
+
+    # METRICS RECORDED AFTER EVERY DEGRADATION
+    METRICS = ("node_count", "edge_count", "max_force", "elastic_energy", "max_strain", "seconds")
+
+    # EVALUATES SPRING FORCES FOR THE METRICS WHATEVER ENGINE DEGRADES THE NETWORK
+    _force_kernel = None
+
+    def __init__(self, degradation_engine_strategy="twodimensionalspringforcedegradationenginewithoutbiomechanics",
+                 element_type="edge", max_workers=None, mp_context=None):
+        """
+        Initializes the ensemble.
+
+        Params:
+            degradation_engine_strategy (str): engine name accepted by NetworkManager.set_degradation_engine_strategy.
+            element_type (str): "edge" or "node", the elements degraded at random.
+            max_workers (int): number of worker processes, the CPU count if None. 0 runs in this process.
+            mp_context: multiprocessing context passed to the ProcessPoolExecutor.
+
+        Raises:
+            ValueError: If element_type is not "edge" or "node".
+        """
+        if element_type not in ("edge", "node"):
+            raise ValueError(f"Invalid element type: '{element_type}'")
+        # FAIL EARLY ON AN UNKNOWN ENGINE RATHER THAN IN EVERY WORKER
+        NetworkManager.get_degradation_engine_strategy_class(degradation_engine_strategy)
+        self.degradation_engine_strategy = degradation_engine_strategy
+        self.element_type = element_type
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+
+    def run(self, network, seeds, steps=None, on_sequence_complete=None):
+        """
+        Runs one random degradation sequence per seed.
+
+        Params:
+            network: base Network2D or NetworkArrays. It is not modified.
+            seeds: number of sequences (seeded 0..n-1) or an iterable of integer seeds.
+            steps (int): degradations per sequence, until no element is left if None.
+            on_sequence_complete: optional callable(sequence_index, seed, metrics) called in
+                                  this process as each sequence finishes.
+
+        Returns:
+            DegradationEnsembleResult: the aggregated metrics.
+        """
+        Logger.log(f"start DegradationEnsemble run(self, network, {seeds}, {steps})")
+        seeds = np.arange(seeds) if isinstance(seeds, (int, np.integer)) else np.asarray(list(seeds))
+        base_network = network if isinstance(network, NetworkArrays) else NetworkArrays.from_network(network)
+
+        sequences = [None] * len(seeds)
+        if self.max_workers == 0:
+            engine = NetworkManager.get_degradation_engine_strategy_class(self.degradation_engine_strategy)()
+            detector = PercolationDetector(base_network)
+            for index, seed in enumerate(seeds.tolist()):
+                sequences[index] = self.run_sequence(base_network, engine, self.element_type, seed, steps, detector)
+                if on_sequence_complete:
+                    on_sequence_complete(index, seed, sequences[index][1])
+        else:
+            # THE BASE NETWORK IS SERIALIZED ONCE AND SENT TO EACH WORKER ONLY AT STARTUP
+            network_payload = pickle.dumps(base_network, protocol=pickle.HIGHEST_PROTOCOL)
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=self.mp_context, initializer=_initialize_worker,
+                initargs=(network_payload, self.degradation_engine_strategy, self.element_type),
+            ) as executor:
+                futures = {executor.submit(_run_worker_sequence, seed, steps): index
+                           for index, seed in enumerate(seeds.tolist())}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    sequences[index] = future.result()
+                    if on_sequence_complete:
+                        on_sequence_complete(index, int(seeds[index]), sequences[index][1])
+
+        result = self._aggregate(seeds, sequences)
+        Logger.log(f"end DegradationEnsemble run(self, network, seeds, steps)")
+        return result
+
+    @classmethod
+    def run_sequence(cls, base_network, engine, element_type, seed, steps=None, detector=None):
+        """
+        Degrades a copy of the base network one random element at a time.
+
+        Params:
+            base_network (NetworkArrays): the network to start from. It is not modified.
+            engine: DegradationEngineStrategy used for every degradation.
+            element_type (str): "edge" or "node".
+            seed (int): seed of the random element choice.
+            steps (int): number of degradations, until no element is left if None.
+            detector (PercolationDetector): detector on the base network, copied for this
+                                            sequence. A new one is built if None.
+
+        Returns:
+            tuple: (removed_ids, metrics, rupture) where metrics is a (degradations + 1, len(METRICS))
+            array and rupture the (rupture_step, remaining_fraction) of the sequence.
+        """
+        rng = np.random.default_rng(seed)
+        network = base_network.snapshot()
+        detector = detector.copy() if detector is not None else PercolationDetector(base_network)
+        removed_ids = []
+        metrics = [cls.get_metrics(network, 0.0)]
+
+        while steps is None or len(removed_ids) < steps:
+            element_ids = network.edge_ids if element_type == "edge" else network.node_ids
+            if len(element_ids) == 0:
+                break
+            element_id = element_ids[rng.integers(len(element_ids))].item()
+
+            step_start = time.perf_counter()
+            if element_type == "edge":
+                network = engine.degrade_edge(network, element_id)
+            else:
+                network = engine.degrade_node(network, element_id)
+            seconds = time.perf_counter() - step_start
+
+            removed_ids.append(element_id)
+            metrics.append(cls.get_metrics(network, seconds))
+            if element_type == "edge":
+                detector.observe(network, removed_edge_ids=(element_id,))
+            else:
+                detector.observe(network, removed_node_ids=(element_id,))
+
+        rupture = (detector.rupture_step, detector.remaining_fraction) if detector.ruptured else (-1, np.nan)
+        return np.asarray(removed_ids, dtype=np.int64), np.asarray(metrics, dtype=np.float64), rupture
+
+    @classmethod
+    def get_force_kernel(cls):
+        """Returns the spring engine used to evaluate forces and strains of any network, whatever engine degrades it."""
+        if cls._force_kernel is None:
+            cls._force_kernel = TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics()
+        return cls._force_kernel
+
+    @classmethod
+    def get_metrics(cls, network, seconds):
+        """
+        Returns the METRICS of a NetworkArrays state as a list of floats.
+
+        max_force is the largest net force on a free node, elastic_energy and max_strain
+        come from the force kernel's get_elastic_energy and get_edge_strains, so they
+        match the engine's own metrics.
+        """
+        force_kernel = cls.get_force_kernel()
+        positions, edge_from, edge_to, rest_lengths, is_fixed = force_kernel.get_force_arrays(network)
+        k = network.meta_data.get("spring_stiffness_constant", 1.0)
+
+        free_forces = force_kernel.compute_spring_forces(positions, edge_from, edge_to, rest_lengths, k)[~is_fixed]
+        max_force = np.sqrt((free_forces * free_forces).sum(axis=1)).max() if len(free_forces) else 0.0
+
+        elastic_energy = force_kernel.get_elastic_energy(positions, edge_from, edge_to, rest_lengths, k)
+        strains = force_kernel.get_edge_strains(positions, edge_from, edge_to, rest_lengths)
+        max_strain = strains.max() if len(strains) else 0.0
+
+        return [network.get_node_count(), network.get_edge_count(), max_force, elastic_energy, max_strain, seconds]
+
+    def _aggregate(self, seeds, sequences):
+        """Pads the per-sequence arrays to a common length and splits them by metric."""
+        step_counts = np.array([len(removed_ids) for removed_ids, _, _ in sequences], dtype=np.int64)
+        max_steps = int(step_counts.max()) if len(step_counts) else 0
+
+        removed_ids = np.zeros((len(sequences), max_steps), dtype=np.int64)
+        values = np.full((len(sequences), max_steps + 1, len(self.METRICS)), np.nan)
+        for index, (sequence_ids, sequence_metrics, _) in enumerate(sequences):
+            removed_ids[index, :len(sequence_ids)] = sequence_ids
+            values[index, :len(sequence_metrics)] = sequence_metrics
+
+        metrics = {name: values[:, :, column] for column, name in enumerate(self.METRICS)}
+        rupture_steps = np.array([rupture_step for _, _, (rupture_step, _) in sequences], dtype=np.int64)
+        remaining_fractions = np.array([fraction for _, _, (_, fraction) in sequences], dtype=np.float64)
+        return DegradationEnsembleResult(seeds, metrics, removed_ids, step_counts, rupture_steps, remaining_fractions)
@@ -0,0 +1,49 @@
+class DisjointSet:
+    """
+    Union-find over the integers 0..size-1.
+
+    Union by size and path halving keep every find and union at O(α(n)) amortized.
+    Plain lists are used instead of NumPy arrays because every operation touches only
+    a few scalars.
+    """
+
+    def __init__(self, size):
+        """
+        Initializes size singleton sets.
+
+        Params:
+            size (int): number of items.
+        """
+        self.parent = list(range(size))
+        self.sizes = [1] * size
+        self.count = size
+
+    def find(self, item):
+        """Returns the representative of the set containing item."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first, second):
+        """
+        Merges the sets containing first and second.
+
+        Returns:
+            tuple: (root, absorbed_root) of the merged set, or None if both items were
+            already in the same set.
+        """
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root == second_root:
+            return None
+        if self.sizes[first_root] < self.sizes[second_root]:
+            first_root, second_root = second_root, first_root
+        self.parent[second_root] = first_root
+        self.sizes[first_root] += self.sizes[second_root]
+        self.count -= 1
+        return first_root, second_root
+
+    def get_size(self, item):
+        """Returns the number of items in the set containing item."""
+        return self.sizes[self.find(item)]
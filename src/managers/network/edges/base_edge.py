@@ -35,6 +35,29 @@ class BaseEdge:
 
         Logger.log(f"end Edge __init__(self)")
 
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Creates one edge per row of attribute columns.
+
+        The columns are trusted to match the schema and to be cast to its types, as
+        NetworkFactory does once per table, so no edge is validated on its own.
+
+        Params:
+            columns (dict): Attribute name -> list of values, all of the same length.
+
+        Returns:
+            list: The edges, in row order.
+        """
+        keys = list(columns)
+        edges = []
+        for values in zip(*columns.values()):
+            edge = cls.__new__(cls)
+            edge.attributes = list(keys)
+            edge.__dict__.update(zip(keys, values))
+            edges.append(edge)
+        return edges
+
     def get_id(self):
         """
         Returns the ID of the edge.
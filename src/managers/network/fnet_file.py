@@ -0,0 +1,202 @@
+from utils.logger.logger import Logger
+from .networks.network_arrays import NetworkArrays
+from .network_factory import NetworkFactory
+import io
+import json
+import os
+import struct
+import numpy as np
+
+class FnetFile:
+    """
+    Reads and writes the FibriNet binary network format (.fnet).
+
+    A file holds one NetworkArrays:
+
+    - a fixed header: MAGIC, the format VERSION (uint32) and the length of the JSON
+      header (uint64), little endian.
+    - the JSON header: network, node and edge class names, node and edge counts,
+      meta_data and the dtype, shape and byte offset of every column.
+    - the column blocks, the raw bytes of each NetworkArrays column, each starting at
+      a multiple of ALIGNMENT.
+
+    read memory-maps the column blocks, so opening a file reads only the header and
+    the pages of a column are loaded when they are first touched. Element classes
+    are stored by name and resolved among the classes registered with NetworkFactory.
+    """
+
+    # FIRST BYTES OF EVERY FILE
+    MAGIC = b"FIBRINET"
+    # FORMAT VERSION, INCREASED ON INCOMPATIBLE CHANGES
+    VERSION = 1
+    # MAGIC, VERSION AND JSON HEADER LENGTH
+    HEADER_STRUCT = struct.Struct("<8sIQ")
+    # BYTE ALIGNMENT OF THE COLUMN BLOCKS
+    ALIGNMENT = 64
+    # FILE EXTENSION
+    FILE_EXTENSION = ".fnet"
+
+    @classmethod
+    def write(cls, network, file):
+        """
+        Writes a network.
+
+        Params:
+            network: Network2D or NetworkArrays. Object networks are converted to columns.
+            file: path or binary file object to write to.
+
+        Raises:
+            ValueError: If the network cannot be stored as columns or its meta_data as JSON.
+        """
+        Logger.log(f"start FnetFile write(cls, {network}, {file})")
+        if isinstance(file, (str, os.PathLike)):
+            # CONVERT FIRST SO A NETWORK THAT CANNOT BE STORED LEAVES NO FILE BEHIND
+            if not isinstance(network, NetworkArrays):
+                network = NetworkArrays.from_network(network)
+            with open(file, "wb") as binary_file:
+                cls.write(network, binary_file)
+            return
+
+        network_arrays = network if isinstance(network, NetworkArrays) else NetworkArrays.from_network(network)
+        columns = {name: np.ascontiguousarray(getattr(network_arrays, name)) for name in NetworkArrays.COLUMNS}
+
+        # LAY OUT THE COLUMN BLOCKS AFTER THE HEADER, WHOSE LENGTH DEPENDS ON THE OFFSETS
+        header = {
+            "network_class": network_arrays.network_class.__name__,
+            "node_types": [node_class.__name__ for node_class in network_arrays.node_types],
+            "edge_types": [edge_class.__name__ for edge_class in network_arrays.edge_types],
+            "node_count": network_arrays.get_node_count(),
+            "edge_count": network_arrays.get_edge_count(),
+            "meta_data": network_arrays.meta_data,
+            "columns": {name: {"dtype": column.dtype.str, "shape": list(column.shape), "offset": 0}
+                        for name, column in columns.items()},
+        }
+        data_start = 0
+        while True:
+            header_bytes = cls._to_json(header)
+            start = cls._align(cls.HEADER_STRUCT.size + len(header_bytes))
+            if start == data_start:
+                break
+            data_start = offset = start
+            for name, column in columns.items():
+                header["columns"][name]["offset"] = offset
+                offset = cls._align(offset + column.nbytes)
+
+        file.write(cls.HEADER_STRUCT.pack(cls.MAGIC, cls.VERSION, len(header_bytes)))
+        file.write(header_bytes)
+        position = cls.HEADER_STRUCT.size + len(header_bytes)
+        for name, column in columns.items():
+            offset = header["columns"][name]["offset"]
+            file.write(b"\0" * (offset - position))
+            file.write(column.tobytes())
+            position = offset + column.nbytes
+        Logger.log("end FnetFile write(cls, network, file)")
+
+    @classmethod
+    def to_bytes(cls, network):
+        """Returns the .fnet file content of a network, see write."""
+        buffer = io.BytesIO()
+        cls.write(network, buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def read(cls, path, as_arrays=True):
+        """
+        Reads a network, memory-mapping its columns.
+
+        Params:
+            path (str): the .fnet file.
+            as_arrays (bool): Return the NetworkArrays, or the object network built from it.
+
+        Returns:
+            NetworkArrays, or the network of its network class if as_arrays is False.
+
+        Raises:
+            ValueError: If the file is not a valid .fnet file or names an unregistered class.
+        """
+        Logger.log(f"start FnetFile read(cls, {path})")
+        header = cls.read_header(path)
+        file_size = os.path.getsize(path)
+
+        columns = {}
+        for name in NetworkArrays.COLUMNS:
+            if name not in header["columns"]:
+                raise ValueError(f"Column '{name}' is missing from {path}.")
+            layout = header["columns"][name]
+            dtype = np.dtype(layout["dtype"])
+            shape = tuple(layout["shape"])
+            if dtype.hasobject or layout["offset"] + dtype.itemsize * int(np.prod(shape)) > file_size:
+                raise ValueError(f"Column '{name}' of {path} is invalid or truncated.")
+            if 0 in shape:
+                columns[name] = np.empty(shape, dtype=dtype)
+            else:
+                columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=layout["offset"], shape=shape)
+
+        for names, count in ((("node_ids", "positions", "is_fixed", "node_type_codes"), header["node_count"]),
+                             (("edge_ids", "edge_from", "edge_to", "rest_length", "edge_type_codes"), header["edge_count"])):
+            if any(len(columns[name]) != count for name in names):
+                raise ValueError(f"The columns of {path} do not match its node and edge counts.")
+
+        network_class = cls._get_class(header["network_class"], 0)
+        network_arrays = NetworkArrays(
+            *(columns[name] for name in ("node_ids", "positions", "is_fixed", "edge_ids",
+                                         "edge_from", "edge_to", "rest_length")),
+            meta_data=header["meta_data"], schema=network_class.schema,
+            node_types=[cls._get_class(name, 1) for name in header["node_types"]], node_type_codes=columns["node_type_codes"],
+            edge_types=[cls._get_class(name, 2) for name in header["edge_types"]], edge_type_codes=columns["edge_type_codes"],
+            network_class=network_class,
+        )
+        Logger.log("end FnetFile read(cls, path)")
+        return network_arrays if as_arrays else network_arrays.to_network()
+
+    @classmethod
+    def read_header(cls, path):
+        """
+        Returns the JSON header of a file.
+
+        Raises:
+            ValueError: If the file is not a .fnet file of a supported version.
+        """
+        with open(path, "rb") as file:
+            fixed_header = file.read(cls.HEADER_STRUCT.size)
+            if len(fixed_header) < cls.HEADER_STRUCT.size:
+                raise ValueError(f"{path} is not a .fnet file.")
+            magic, version, header_length = cls.HEADER_STRUCT.unpack(fixed_header)
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a .fnet file.")
+            if version > cls.VERSION:
+                raise ValueError(f"{path} uses .fnet version {version}, newer than the supported version {cls.VERSION}.")
+            header_bytes = file.read(header_length)
+        if len(header_bytes) < header_length:
+            raise ValueError(f"The header of {path} is truncated.")
+        return json.loads(header_bytes.decode("utf-8"))
+
+    @classmethod
+    def _get_class(cls, class_name, component):
+        """
+        Returns the registered network (component 0), node (1) or edge (2) class with the name.
+
+        Raises:
+            ValueError: If no such class is registered with NetworkFactory.
+        """
+        for registered_class in NetworkFactory.get_all_registered_components()[component]:
+            if registered_class.__name__ == class_name:
+                return registered_class
+        raise ValueError(f"Class '{class_name}' is not registered with NetworkFactory.")
+
+    @staticmethod
+    def _to_json(header):
+        """Encodes the header, converting NumPy scalars in the meta_data to Python values."""
+        def default(value):
+            if isinstance(value, np.generic):
+                return value.item()
+            raise ValueError(f"Meta data value {value!r} cannot be stored in a .fnet file.")
+        try:
+            return json.dumps(header, default=default).encode("utf-8")
+        except TypeError as ex:
+            raise ValueError(f"Meta data cannot be stored in a .fnet file: {ex}")
+
+    @classmethod
+    def _align(cls, offset):
+        """Rounds an offset up to the next multiple of ALIGNMENT."""
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
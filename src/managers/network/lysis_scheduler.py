@@ -0,0 +1,183 @@
+from utils.logger.logger import Logger
+from .network_manager import NetworkManager
+from .networks.network_arrays import NetworkArrays
+from .degradation_ensemble import DegradationEnsemble
+from .propensity_sum_tree import PropensitySumTree
+import time
+import numpy as np
+
+class LysisResult:
+    """
+    Time series of a stochastic lysis run.
+
+    Every cleavage event is listed in event_times and cleaved_edge_ids. The
+    DegradationEnsemble.METRICS of the network are sampled at sample_times, the start
+    of the run and every record_interval-th event.
+    """
+
+    def __init__(self, event_times, cleaved_edge_ids, sample_times, metrics, network):
+        """
+        Initializes the result.
+
+        Params:
+            event_times: (events,) array of the simulated time of every cleavage.
+            cleaved_edge_ids (list): id of the edge cleaved by every event.
+            sample_times: (samples,) array of the simulated times the metrics were sampled at.
+            metrics (dict): metric name -> (samples,) float array.
+            network (NetworkArrays): the network at the end of the run.
+        """
+        self.event_times = event_times
+        self.cleaved_edge_ids = cleaved_edge_ids
+        self.sample_times = sample_times
+        self.metrics = metrics
+        self.network = network
+
+
+class LysisScheduler:
+    """
+    Event driven stochastic lysis (Gillespie direct method) on top of a degradation engine.
+
+    Every edge cleaves with a rate given by its strain. The rates are kept in a
+    PropensitySumTree, so the waiting time to the next cleavage is drawn from the total
+    rate and the cleaved edge in proportion to its rate in O(log E). The selected edge
+    is removed with the engine degrade_edge, and only the rates that the removal and the
+    following relaxation changed are written back to the tree.
+
+    The default rate is base_rate * exp(strain_sensitivity * strain): a positive
+    sensitivity makes stretched fibers cleave faster, a negative one protects them.
+    Any vectorized rate_function(strains) -> rates can be used instead.
+
+    Runs use the NetworkArrays representation, object networks are converted once.
+    """
+
+    def __init__(self, degradation_engine_strategy="twodimensionalspringforcedegradationenginewithoutbiomechanics",
+                 base_rate=1.0, strain_sensitivity=0.0, rate_function=None, seed=None):
+        """
+        Initializes the scheduler.
+
+        Params:
+            degradation_engine_strategy (str): engine name, see NetworkManager.DEGRADATION_ENGINE_STRATEGIES.
+            base_rate (float): cleavage rate of an unstrained edge, per unit of simulated time.
+            strain_sensitivity (float): exponential dependence of the rate on the strain.
+            rate_function: callable mapping an array of edge strains to an array of rates.
+            seed (int): seed of the event times and edge choices.
+
+        Raises:
+            Exception: If the degradation engine strategy is invalid.
+        """
+        Logger.log(f"start LysisScheduler __init__(self, {degradation_engine_strategy}, {base_rate}, {strain_sensitivity})")
+        self.engine = NetworkManager.get_degradation_engine_strategy_class(degradation_engine_strategy)()
+        self.base_rate = base_rate
+        self.strain_sensitivity = strain_sensitivity
+        self.rate_function = rate_function
+        self.rng = np.random.default_rng(seed)
+        Logger.log("end LysisScheduler __init__(self)")
+
+    @property
+    def strain_dependent(self):
+        """Returns True if the rates change when the network relaxes."""
+        return self.rate_function is not None or self.strain_sensitivity != 0
+
+    def get_rates(self, network):
+        """
+        Returns the cleavage rate of every edge row of a NetworkArrays network.
+
+        Strains are computed from the network geometry with the DegradationEnsemble force
+        kernel, so they do not depend on the engine degrading the network.
+        """
+        if not self.strain_dependent:
+            return np.full(network.get_edge_count(), float(self.base_rate))
+        force_kernel = DegradationEnsemble.get_force_kernel()
+        positions, edge_from, edge_to, rest_lengths, _ = force_kernel.get_force_arrays(network)
+        strains = force_kernel.get_edge_strains(positions, edge_from, edge_to, rest_lengths)
+        if self.rate_function is not None:
+            return np.asarray(self.rate_function(strains), dtype=np.float64)
+        return self.base_rate * np.exp(self.strain_sensitivity * strains)
+
+    def run(self, network, max_time=None, max_events=None, record_interval=1, history=None, on_event=None):
+        """
+        Cleaves edges one event at a time until max_time, max_events or no edge is left.
+
+        Params:
+            network: Network2D or NetworkArrays to lyse. It is not modified.
+            max_time (float): simulated time to stop at.
+            max_events (int): number of cleavages to stop after.
+            record_interval (int): sample the metrics every record_interval events.
+            history (NetworkStateHistory): receives the network at every sample if given.
+            on_event: callable(time, edge_id, network) called after every cleavage.
+
+        Returns:
+            LysisResult: The event times, cleaved edges and sampled metrics.
+        """
+        Logger.log(f"start LysisScheduler run(self, network, {max_time}, {max_events})")
+        if not isinstance(network, NetworkArrays):
+            network = NetworkArrays.from_network(network)
+
+        # EVERY EDGE KEEPS ITS TREE SLOT FOR THE WHOLE RUN, ROWS ARE MAPPED TO SLOTS
+        slot_ids = network.edge_ids.copy()
+        slot_order = np.argsort(slot_ids, kind="stable")
+        row_slots = np.arange(len(slot_ids))
+        tree = PropensitySumTree(self.get_rates(network))
+
+        simulated_time = 0.0
+        event_times = []
+        cleaved_edge_ids = []
+        sample_times = [0.0]
+        samples = [DegradationEnsemble.get_metrics(network, 0.0)]
+        if history is not None:
+            history.append(network)
+
+        while max_events is None or len(event_times) < max_events:
+            total = tree.total
+            if total <= 0:
+                break
+
+            # DRAW THE WAITING TIME AND THE EDGE TO CLEAVE
+            waiting_time = self.rng.exponential(1.0 / total)
+            if max_time is not None and simulated_time + waiting_time > max_time:
+                break
+            simulated_time += waiting_time
+            slot = tree.find(self.rng.random() * total)
+            edge_id = slot_ids[slot].item()
+
+            step_start = time.perf_counter()
+            previous_edge_count = network.get_edge_count()
+            previous_row = network.get_edge_row(edge_id)
+            network = self.engine.degrade_edge(network, edge_id)
+            seconds = time.perf_counter() - step_start
+
+            # MAP THE REMAINING EDGE ROWS TO SLOTS, CHEAPLY IF ONLY THE CLEAVED EDGE WENT AWAY
+            if network.get_edge_count() == previous_edge_count - 1:
+                row_slots = np.delete(row_slots, previous_row)
+                tree.update(slot, 0.0)
+            else:
+                row_slots = slot_order[np.searchsorted(slot_ids, network.edge_ids, sorter=slot_order)]
+                gone = np.ones(len(slot_ids), dtype=bool)
+                gone[row_slots] = False
+                gone &= tree.propensities > 0
+                tree.update_many(np.flatnonzero(gone), 0.0)
+
+            # RELAXATION CHANGES THE STRAINS, WRITE BACK ONLY THE RATES THAT CHANGED
+            if self.strain_dependent:
+                rates = self.get_rates(network)
+                changed = rates != tree.propensities[row_slots]
+                tree.update_many(row_slots[changed], rates[changed])
+
+            event_times.append(simulated_time)
+            cleaved_edge_ids.append(edge_id)
+            if len(event_times) % record_interval == 0:
+                sample_times.append(simulated_time)
+                samples.append(DegradationEnsemble.get_metrics(network, seconds))
+                if history is not None:
+                    history.append(network)
+            if on_event is not None:
+                on_event(simulated_time, edge_id, network)
+
+        samples = np.array(samples, dtype=np.float64).reshape(len(samples), len(DegradationEnsemble.METRICS))
+        result = LysisResult(
+            np.array(event_times), cleaved_edge_ids, np.array(sample_times),
+            {name: samples[:, i] for i, name in enumerate(DegradationEnsemble.METRICS)}, network,
+        )
+        Logger.log(f"Lysis run: {len(event_times)} events, simulated time {simulated_time:.6g}")
+        Logger.log("end LysisScheduler run(self, network, max_time, max_events)")
+        return result
@@ -0,0 +1,401 @@
+from utils.logger.logger import Logger
+from .networks.network_arrays import NetworkArrays
+from .disjoint_set import DisjointSet
+import copy
+import numpy as np
+
+class NetworkConnectivity:
+    """
+    Tracks the connected components, node degrees and boundary load path of a network
+    while its edges and nodes are removed.
+
+    Degrees are counters updated in O(1) per removed edge. When an edge is removed, two
+    searches run in turns from its endpoints. They stop as soon as they meet, or when
+    one of them runs out of nodes. In that case the component has split and the nodes
+    the exhausted search visited get a new component label. The cost is bounded by the
+    smaller side of a split, or by the neighbourhood explored before the searches meet.
+
+    The load path is intact while some component contains fixed nodes of both boundary
+    groups (see get_boundary_groups). Per-component boundary counts keep that query O(1).
+
+    For a removal sequence that is known in advance, replay answers the same questions
+    for every step with one reverse pass of union-find, at O(α(n)) per edge.
+    """
+
+    def __init__(self, network, boundary_groups=None):
+        """
+        Builds the component labels of a network.
+
+        Params:
+            network: Network2D or NetworkArrays. It is read once and never modified.
+            boundary_groups (list): two lists of node ids whose connection is the load
+                                    path, get_boundary_groups(network) if None.
+        """
+        Logger.log(f"start NetworkConnectivity __init__(self, {network})")
+        node_ids, edge_ids, edge_from, edge_to, positions, is_fixed = self.get_topology(network)
+        self.node_ids = node_ids
+        self.node_rows = {node_id: row for row, node_id in enumerate(node_ids)}
+        self.edge_ids = edge_ids
+        self.edge_rows = {edge_id: row for row, edge_id in enumerate(edge_ids)}
+        self.edge_from = edge_from
+        self.edge_to = edge_to
+        self.edge_alive = [True] * len(edge_ids)
+        self.node_alive = [True] * len(node_ids)
+        self._edge_count = len(edge_ids)
+
+        # DEGREES AND ADJACENCY LISTS OF (NEIGHBOUR ROW, EDGE ROW)
+        self.degrees = [0] * len(node_ids)
+        self._adjacency = [[] for _ in node_ids]
+        for edge_row, (from_row, to_row) in enumerate(zip(edge_from, edge_to)):
+            self.degrees[from_row] += 1
+            self.degrees[to_row] += 1
+            self._adjacency[from_row].append((to_row, edge_row))
+            self._adjacency[to_row].append((from_row, edge_row))
+
+        # INITIAL COMPONENT LABELS FROM ONE UNION-FIND PASS
+        disjoint_set = DisjointSet(len(node_ids))
+        for from_row, to_row in zip(edge_from, edge_to):
+            disjoint_set.union(from_row, to_row)
+        self.labels = [disjoint_set.find(row) for row in range(len(node_ids))]
+        self._next_label = len(node_ids)
+        self._component_sizes = {}
+        for label in self.labels:
+            self._component_sizes[label] = self._component_sizes.get(label, 0) + 1
+        self._isolated_count = self.degrees.count(0)
+
+        # BOUNDARY MEMBERS PER COMPONENT
+        if boundary_groups is None:
+            self.boundary_groups = self.get_boundary_groups(positions, is_fixed)
+        else:
+            self.boundary_groups = [[self.node_rows[node_id] for node_id in group if node_id in self.node_rows]
+                                    for group in boundary_groups]
+        self._boundary_group_of = {}
+        for group_index, group in enumerate(self.boundary_groups):
+            for row in group:
+                self._boundary_group_of[row] = group_index
+        self._boundary_counts = {}
+        for row, group_index in self._boundary_group_of.items():
+            counts = self._boundary_counts.setdefault(self.labels[row], [0] * len(self.boundary_groups))
+            counts[group_index] += 1
+        self._spanning_count = sum(1 for counts in self._boundary_counts.values() if self._is_spanning(counts))
+
+        self.initial_component_count = self.get_component_count()
+        Logger.log(f"end NetworkConnectivity __init__(self), {self.initial_component_count} components")
+
+    @staticmethod
+    def get_topology(network):
+        """
+        Returns (node_ids, edge_ids, edge_from, edge_to, positions, is_fixed) of a network
+        as lists of ids and endpoint rows plus the position and fixed flag arrays.
+        Edges whose endpoints are not both in the network are left out.
+        """
+        if isinstance(network, NetworkArrays):
+            return (network.node_ids.tolist(), network.edge_ids.tolist(), network.edge_from.tolist(),
+                    network.edge_to.tolist(), network.positions, network.is_fixed)
+
+        nodes = network.get_nodes()
+        node_rows = {node.get_id(): row for row, node in enumerate(nodes)}
+        edge_ids, edge_from, edge_to = [], [], []
+        for edge in network.get_edges():
+            if edge.n_from in node_rows and edge.n_to in node_rows:
+                edge_ids.append(edge.get_id())
+                edge_from.append(node_rows[edge.n_from])
+                edge_to.append(node_rows[edge.n_to])
+        positions = np.array([[getattr(node, "n_x", np.nan), getattr(node, "n_y", np.nan)] for node in nodes],
+                             dtype=np.float64).reshape(len(nodes), 2)
+        is_fixed = np.array([bool(getattr(node, "is_fixed", False)) for node in nodes], dtype=bool)
+        return list(node_rows), edge_ids, edge_from, edge_to, positions, is_fixed
+
+    @staticmethod
+    def get_boundary_groups(positions, is_fixed):
+        """
+        Splits the fixed nodes into the two boundaries the network is clamped between.
+
+        The fixed nodes are split at the middle of their extent along the axis where
+        they are spread the most, e.g. a left and a right clamp.
+
+        Returns:
+            list: two lists of node rows, or an empty list if there are not fixed nodes on both sides.
+        """
+        fixed_rows = np.flatnonzero(is_fixed)
+        if len(fixed_rows) < 2:
+            return []
+        fixed_positions = positions[fixed_rows]
+        axis = int(np.argmax(np.ptp(fixed_positions, axis=0)))
+        coordinates = fixed_positions[:, axis]
+        middle = (coordinates.min() + coordinates.max()) / 2
+        low, high = fixed_rows[coordinates <= middle], fixed_rows[coordinates > middle]
+        if not len(low) or not len(high):
+            return []
+        return [low.tolist(), high.tolist()]
+
+    def remove_edge(self, edge_id):
+        """
+        Removes an edge and updates the degrees and components.
+
+        Params:
+            edge_id: The ID of the edge to remove. Unknown or removed edges are ignored.
+
+        Returns:
+            bool: True if the removal split a component in two.
+        """
+        edge_row = self.edge_rows.get(edge_id)
+        if edge_row is None or not self.edge_alive[edge_row]:
+            return False
+        self.edge_alive[edge_row] = False
+        self._edge_count -= 1
+        from_row, to_row = self.edge_from[edge_row], self.edge_to[edge_row]
+        for row in (from_row, to_row):
+            self.degrees[row] -= 1
+            if self.degrees[row] == 0:
+                self._isolated_count += 1
+
+        split_rows = self._get_split_rows(from_row, to_row)
+        if split_rows is None:
+            return False
+        self._relabel(split_rows)
+        return True
+
+    def remove_node(self, node_id):
+        """
+        Removes a node and every edge connected to it.
+
+        Params:
+            node_id: The ID of the node to remove. Unknown or removed nodes are ignored.
+
+        Returns:
+            bool: True if the nodes that still have edges form more components after the
+                  removal than before it.
+        """
+        row = self.node_rows.get(node_id)
+        if row is None or not self.node_alive[row]:
+            return False
+        component_count = self.get_component_count()
+        for _, edge_row in self._adjacency[row]:
+            if self.edge_alive[edge_row]:
+                self.remove_edge(self.edge_ids[edge_row])
+
+        # THE NODE IS NOW ITS OWN ISOLATED COMPONENT, WHICH DISAPPEARS WITH IT
+        label = self.labels[row]
+        self.node_alive[row] = False
+        self._isolated_count -= 1
+        del self._component_sizes[label]
+        counts = self._boundary_counts.pop(label, None)
+        if counts is not None and self._is_spanning(counts):
+            self._spanning_count -= 1
+        # ISOLATED NODES ARE NOT COUNTED, SO CUTTING OFF A LEAF IS NOT A SPLIT
+        return self.get_component_count() > component_count
+
+    def copy(self):
+        """
+        Returns an independent tracker in the same state.
+
+        The topology is shared, only the per-node and per-edge state is copied, so many
+        runs can start from one tracker without rebuilding the adjacency lists.
+        """
+        tracker = copy.copy(self)
+        tracker.edge_alive = self.edge_alive.copy()
+        tracker.node_alive = self.node_alive.copy()
+        tracker.degrees = self.degrees.copy()
+        tracker.labels = self.labels.copy()
+        tracker._component_sizes = self._component_sizes.copy()
+        tracker._boundary_counts = {label: counts.copy() for label, counts in self._boundary_counts.items()}
+        return tracker
+
+    def get_edge_count(self):
+        """Returns the number of remaining edges."""
+        return self._edge_count
+
+    def get_edge_ids(self):
+        """Returns the ids of the remaining edges."""
+        return [edge_id for edge_id, alive in zip(self.edge_ids, self.edge_alive) if alive]
+
+    def get_degree(self, node_id):
+        """Returns the number of remaining edges connected to a node."""
+        return self.degrees[self.node_rows[node_id]]
+
+    def get_isolated_node_ids(self):
+        """Returns the ids of the remaining nodes without any edge."""
+        return [self.node_ids[row] for row, degree in enumerate(self.degrees) if degree == 0 and self.node_alive[row]]
+
+    def get_component_count(self, include_isolated=False):
+        """
+        Returns the number of connected components.
+
+        Params:
+            include_isolated (bool): count nodes without edges as components of their own.
+        """
+        return len(self._component_sizes) - (0 if include_isolated else self._isolated_count)
+
+    def get_component_sizes(self, include_isolated=False):
+        """Returns the node count of every component, largest first."""
+        sizes = sorted(self._component_sizes.values(), reverse=True)
+        return sizes if include_isolated else [size for size in sizes if size > 1]
+
+    def get_largest_component_size(self):
+        """Returns the node count of the largest component."""
+        return max(self._component_sizes.values(), default=0)
+
+    def has_split(self):
+        """Returns True if the nodes that still have edges form more components than at the start."""
+        return self.get_component_count() > self.initial_component_count
+
+    def is_connected(self, first_node_id, second_node_id):
+        """Returns True if a path of remaining edges connects the two nodes."""
+        return self.labels[self.node_rows[first_node_id]] == self.labels[self.node_rows[second_node_id]]
+
+    def is_load_path_intact(self):
+        """Returns True if a path of remaining edges connects the two boundary groups."""
+        return self._spanning_count > 0
+
+    @classmethod
+    def replay(cls, network, removed_ids, element_type="edge", boundary_groups=None):
+        """
+        Returns the connectivity after every step of a removal sequence.
+
+        The sequence is processed backwards: union-find starts from the network left after
+        the last step and puts the removed elements back one step at a time, so every
+        step costs O(α(n)) per edge instead of a search.
+
+        Params:
+            network: the network before the first removal.
+            removed_ids (list): id of the edge or node removed at every step.
+            element_type (str): "edge" or "node".
+            boundary_groups (list): see __init__.
+
+        Returns:
+            dict: "edge_count", "component_count", "largest_component" and "load_path_intact"
+            arrays with one entry per state, the first for the network before any removal.
+        """
+        node_ids, edge_ids, edge_from, edge_to, positions, is_fixed = cls.get_topology(network)
+        step_count = len(removed_ids)
+        never = step_count + 1
+
+        # STEP AT WHICH EVERY NODE AND EDGE IS REMOVED, never IF IT SURVIVES
+        node_step = np.full(len(node_ids), never, dtype=np.int64)
+        edge_step = np.full(len(edge_ids), never, dtype=np.int64)
+        edge_from_rows = np.asarray(edge_from, dtype=np.intp)
+        edge_to_rows = np.asarray(edge_to, dtype=np.intp)
+        if element_type == "edge":
+            edge_rows = {edge_id: row for row, edge_id in enumerate(edge_ids)}
+            for step, edge_id in enumerate(removed_ids, start=1):
+                edge_step[edge_rows[edge_id]] = min(edge_step[edge_rows[edge_id]], step)
+        else:
+            node_rows = {node_id: row for row, node_id in enumerate(node_ids)}
+            for step, node_id in enumerate(removed_ids, start=1):
+                node_step[node_rows[node_id]] = min(node_step[node_rows[node_id]], step)
+            edge_step = np.minimum(node_step[edge_from_rows], node_step[edge_to_rows])
+
+        # BOUNDARY GROUP BIT OF EVERY NODE
+        if boundary_groups is None:
+            boundary_groups = cls.get_boundary_groups(positions, is_fixed)
+        else:
+            node_rows = {node_id: row for row, node_id in enumerate(node_ids)}
+            boundary_groups = [[node_rows[node_id] for node_id in group if node_id in node_rows] for group in boundary_groups]
+        masks = [0] * len(node_ids)
+        for group_index, group in enumerate(boundary_groups):
+            for row in group:
+                masks[row] |= 1 << group_index
+        full_mask = (1 << len(boundary_groups)) - 1 if len(boundary_groups) >= 2 else -1
+
+        disjoint_set = DisjointSet(len(node_ids))
+        degrees = [0] * len(node_ids)
+        present = int((node_step > step_count).sum())
+        present_edges = 0
+        isolated = present
+        largest = 1 if present else 0
+        spanning = False
+        edge_count = np.zeros(step_count + 1, dtype=np.int64)
+        component_count = np.zeros(step_count + 1, dtype=np.int64)
+        largest_component = np.zeros(step_count + 1, dtype=np.int64)
+        load_path_intact = np.zeros(step_count + 1, dtype=bool)
+
+        edge_order = np.argsort(edge_step, kind="stable")[::-1]
+        node_order = np.argsort(node_step, kind="stable")[::-1]
+        edge_position = node_position = 0
+        for step in range(step_count + 1, 0, -1):
+            # PUT BACK THE NODES, THEN THE EDGES, REMOVED AT THIS STEP
+            while node_position < len(node_order) and node_step[node_order[node_position]] == step and step <= step_count:
+                present += 1
+                isolated += 1
+                largest = max(largest, 1)
+                node_position += 1
+            while edge_position < len(edge_order) and edge_step[edge_order[edge_position]] >= step:
+                edge_row = edge_order[edge_position]
+                edge_position += 1
+                present_edges += 1
+                from_row, to_row = int(edge_from_rows[edge_row]), int(edge_to_rows[edge_row])
+                for row in (from_row, to_row):
+                    if degrees[row] == 0:
+                        isolated -= 1
+                    degrees[row] += 1
+                merged = disjoint_set.union(from_row, to_row)
+                if merged is not None:
+                    root, absorbed = merged
+                    masks[root] |= masks[absorbed]
+                    largest = max(largest, disjoint_set.sizes[root])
+                    spanning = spanning or masks[root] == full_mask
+
+            # STATE AFTER step - 1 REMOVALS
+            edge_count[step - 1] = present_edges
+            component_count[step - 1] = (present - (len(node_ids) - disjoint_set.count)) - isolated
+            largest_component[step - 1] = largest
+            load_path_intact[step - 1] = spanning
+
+        return {"edge_count": edge_count, "component_count": component_count, "largest_component": largest_component,
+                "load_path_intact": load_path_intact}
+
+    def _get_split_rows(self, from_row, to_row):
+        """
+        Searches from both endpoints of a removed edge in turns.
+
+        Returns:
+            list: the rows of the side that got cut off, or None if the endpoints are still connected.
+        """
+        if from_row == to_row:
+            return None
+        adjacency, edge_alive = self._adjacency, self.edge_alive
+        visited = ({from_row}, {to_row})
+        frontiers = ([from_row], [to_row])
+        cursors = [0, 0]
+        while True:
+            for side in (0, 1):
+                frontier = frontiers[side]
+                if cursors[side] == len(frontier):
+                    # THIS SEARCH RAN OUT OF NODES WITHOUT MEETING THE OTHER ONE
+                    return frontier
+                row = frontier[cursors[side]]
+                cursors[side] += 1
+                own, other = visited[side], visited[1 - side]
+                for neighbour, edge_row in adjacency[row]:
+                    if not edge_alive[edge_row] or neighbour in own:
+                        continue
+                    if neighbour in other:
+                        return None
+                    own.add(neighbour)
+                    frontier.append(neighbour)
+
+    def _relabel(self, rows):
+        """Moves the given rows of one component into a new component."""
+        old_label = self.labels[rows[0]]
+        new_label = self._next_label
+        self._next_label += 1
+        old_counts = self._boundary_counts.get(old_label)
+        was_spanning = old_counts is not None and self._is_spanning(old_counts)
+        new_counts = None
+        for row in rows:
+            self.labels[row] = new_label
+            group_index = self._boundary_group_of.get(row)
+            if group_index is not None:
+                if new_counts is None:
+                    new_counts = self._boundary_counts[new_label] = [0] * len(self.boundary_groups)
+                new_counts[group_index] += 1
+                old_counts[group_index] -= 1
+        self._component_sizes[old_label] -= len(rows)
+        self._component_sizes[new_label] = len(rows)
+        if was_spanning:
+            self._spanning_count += int(self._is_spanning(old_counts)) + int(self._is_spanning(new_counts)) - 1
+
+    def _is_spanning(self, counts):
+        """Returns True if boundary counts include members of every group (at least two groups)."""
+        return counts is not None and len(counts) >= 2 and all(counts)
@@ -1,9 +1,12 @@
 from collections import defaultdict
 from utils.logger.logger import Logger
+import hashlib
+import numpy as np
 
 # TYPES OF NETWORKS
 from .networks.base_network import BaseNetwork
 from .networks.network_2d import Network2D
+from .networks.network_arrays import NetworkArrays
 
 # TYPES OF NODES
 from .nodes.base_node import BaseNode
@@ -19,6 +22,9 @@ class NetworkFactory:
     A factory class that creates networks, nodes, and edges based on the provided data.
     It registers network types, node types, and edge types, and is responsible for creating networks
     with the appropriate nodes and edges by matching the data schema.
+
+    Node and edge data are column oriented, attribute name -> values. Classes are matched
+    against the column headers once per table, never per row.
     """
     # DICTIONARY TO STORE REGISTERED NETWORK TYPES
     _network_types = {}
@@ -66,15 +72,20 @@ class NetworkFactory:
         cls._edge_types[network_class].append(edge_class)
 
     @classmethod
-    def create_network(cls, data: dict):
+    def create_network(cls, data: dict, as_arrays=False):
         """
         Creates a network based on the provided data and matches the schema to the registered types.
 
+        Nodes and edges are given as columns, attribute name -> sequence of values. The
+        node and edge classes depend only on the column headers, so they are resolved once
+        per table, and every column is cast to the type in the class schema in one pass.
+
         :param data: The data containing information about nodes, edges, and schema for the network.
+        :param as_arrays: Build a NetworkArrays instead of node and edge objects.
         :return: The created network object based on the data and schema.
         :raises ValueError: If no matching network type is found or schema mismatch occurs.
         """
-        Logger.log(f"start create_network(self, {data})")
+        Logger.log(f"start create_network(self, {len(data.get('nodes', {}))} node columns, {len(data.get('edges', {}))} edge columns)")
 
         # ITERATE THROUGH REGISTERED NETWORK TYPES TO FIND A MATCHING ONE
         for network_type, network_class in cls._network_types.items():
@@ -82,82 +93,156 @@ class NetworkFactory:
                 # LOGGING MATCHING NETWORK TYPE FOUND
                 Logger.log(f"Found matching network type '{network_type}'")
 
-                nodes = []
+                # RESOLVE THE ELEMENT CLASSES FROM THE HEADERS AND CAST THE COLUMNS TO THEIR SCHEMAS
                 node_data = data.get("nodes", {})
+                node_class = cls._resolve_element_class(
+                    node_data, cls._node_types.get(network_class, []) + cls._node_types.get(BaseNetwork, []), "node")
+                node_columns = cls._cast_columns(node_data, node_class.get_schema(), "node") if node_class else {}
 
-                if node_data:
-                    # LOGGING PROCESSING NODE DATA
-                    Logger.log("Processing node data...")
-                    node_list = []
-                    keys = list(node_data.keys())
-                    for i in range(len(node_data[keys[0]])):
-                        node_dict = {key: node_data[key][i] for key in keys}
-                        node_list.append(node_dict)
-                    
-                    for node in node_list:
-                        node_classes = (
-                            cls._node_types.get(network_class, []) +
-                            cls._node_types.get(BaseNetwork, [])  # fallback
-                        )
-                        for node_class in node_classes:
-                            try:
-                                nodes.append(node_class(node))  # try creating it
-                                break
-                            except Exception as e:
-                                Logger.log(f"Node class {node_class} failed: {e}")
-                        else:
-                            raise ValueError(f"No matching node class for node: {node}")
-
-                data["nodes"] = nodes  # REPLACE ORIGINAL DATA WITH Node2D OBJECTS
-
-                edges = []
                 edge_data = data.get("edges", {})
-                
-                if edge_data:
-                    # LOGGING PROCESSING EDGE DATA
-                    Logger.log("Processing edge data...")
-                    edge_list = []
-                    keys = list(edge_data.keys())
-                    for i in range(len(edge_data[keys[0]])):
-                        edge_dict = {key: edge_data[key][i] for key in keys}
-                        edge_list.append(edge_dict)
-                    
-                    for edge in edge_list:
-                        edge_classes = (
-                            cls._edge_types.get(network_class, []) +
-                            cls._edge_types.get(BaseNetwork, [])  # fallback
-                        )
-                        for edge_class in edge_classes:
-                            try:
-                                edges.append(edge_class(edge))  # Try creating edge
-                                break
-                            except Exception as e:
-                                Logger.log(f"Edge class {edge_class} failed: {e}")
-                        else:
-                            raise ValueError(f"No matching edge class for edge: {edge}")
-
-
-                data["edges"] = edges  # REPLACE ORIGINAL DATA WITH Edge2D OBJECTS
-
-                # CREATE THE NETWORK USING THE CLASS FOUND
-                network = network_class(data) 
+                edge_class = cls._resolve_element_class(
+                    edge_data, cls._edge_types.get(network_class, []) + cls._edge_types.get(BaseNetwork, []), "edge")
+                edge_columns = cls._cast_columns(edge_data, edge_class.get_schema(), "edge") if edge_class else {}
+
+                if as_arrays:
+                    network = cls._create_network_arrays(network_class, node_class, node_columns,
+                                                         edge_class, edge_columns, data.get("meta_data", {}))
+                else:
+                    # REPLACE ORIGINAL DATA WITH NODE AND EDGE OBJECTS
+                    data["nodes"] = node_class.from_columns(cls._to_lists(node_columns)) if node_class else []
+                    data["edges"] = edge_class.from_columns(cls._to_lists(edge_columns)) if edge_class else []
+
+                    # CREATE THE NETWORK USING THE CLASS FOUND
+                    network = network_class(data)
                 Logger.log(f"Network created successfully: {network}")
-                Logger.log("start create_network(self, data)")
+                Logger.log("end create_network(self, data)")
 
                 return network
 
         raise ValueError("No matching network type found.")
 
+    @classmethod
+    def _resolve_element_class(cls, columns, element_classes, element_name):
+        """
+        Returns the first of the classes whose schema has every column header, the class
+        every row of the table would be created with. Returns None for an empty table.
+
+        :raises ValueError: If no class accepts the headers.
+        """
+        if not columns or len(next(iter(columns.values()))) == 0:
+            return None
+        headers = set(columns)
+        for element_class in element_classes:
+            if headers <= set(element_class.get_schema()):
+                Logger.log(f"Resolved {element_name} class {element_class} for headers {sorted(headers, key=str)}")
+                return element_class
+            Logger.log(f"{element_name.capitalize()} class {element_class} does not accept headers {sorted(headers, key=str)}")
+        raise ValueError(f"No matching {element_name} class for attributes: {list(columns)}")
+
+    @classmethod
+    def _cast_columns(cls, columns, schema, element_name):
+        """
+        Casts every column to the type of its attribute in the schema, as safe_cast would
+        cast each value.
+
+        Bool columns accept booleans, numbers (non zero is True) and the strings "true",
+        "1" and "yes" in any case.
+
+        :return: attribute name -> NumPy array.
+        :raises ValueError: If the columns differ in length or a value cannot be cast.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"The {element_name} columns differ in length: {sorted(lengths)}")
+
+        cast_columns = {}
+        for name, values in columns.items():
+            expected_type = schema.get(name, str)
+            values = np.asarray(values)
+            try:
+                if expected_type == bool:
+                    cast_columns[name] = cls._cast_bool_column(values)
+                elif expected_type == int:
+                    cast_columns[name] = values.astype(np.int64)
+                elif expected_type == float:
+                    cast_columns[name] = values.astype(np.float64)
+                else:
+                    cast_columns[name] = np.array([expected_type(value) for value in values.tolist()], dtype=object)
+            except (ValueError, TypeError, OverflowError) as e:
+                raise ValueError(f"Invalid {element_name} column '{name}': values are not all of type {expected_type.__name__} ({e})")
+        return cast_columns
+
+    @staticmethod
+    def _cast_bool_column(values):
+        """Casts a column to bool, see _cast_columns."""
+        if values.dtype.kind == "b":
+            return values
+        try:
+            numbers = values.astype(np.float64)
+            return (numbers != 0) & ~np.isnan(numbers)
+        except (ValueError, TypeError):
+            text = np.char.lower(np.char.strip(values.astype(str)))
+            return np.isin(text, ["true", "1", "yes"])
+
+    @staticmethod
+    def _to_lists(columns):
+        """Converts NumPy columns to lists of Python values for the element objects."""
+        return {name: values.tolist() for name, values in columns.items()}
+
+    @classmethod
+    def _create_network_arrays(cls, network_class, node_class, node_columns, edge_class, edge_columns, meta_data):
+        """
+        Builds a NetworkArrays straight from cast columns, without node or edge objects.
+
+        :raises ValueError: If the element classes cannot be stored in NetworkArrays, ids
+                            repeat or an edge references a node that is not in the network.
+        """
+        for element_class, attributes in ((node_class, NetworkArrays.NODE_ATTRIBUTES), (edge_class, NetworkArrays.EDGE_ATTRIBUTES)):
+            if element_class:
+                NetworkArrays._get_schema_attributes(element_class, attributes)
+
+        node_ids = node_columns.get("n_id", np.empty(0, dtype=np.int64))
+        node_count = len(node_ids)
+        edge_ids = edge_columns.get("e_id", np.empty(0, dtype=np.int64))
+        edge_count = len(edge_ids)
+        if len(np.unique(node_ids)) != node_count:
+            raise ValueError("Node IDs are not unique.")
+        if len(np.unique(edge_ids)) != edge_count:
+            raise ValueError("Edge IDs are not unique.")
+
+        # MAP EDGE ENDPOINT IDS TO NODE ROWS WITH ONE SORTED SEARCH
+        order = np.argsort(node_ids, kind="stable")
+        sorted_ids = node_ids[order]
+        endpoint_rows = []
+        for name in ("n_from", "n_to"):
+            endpoint_ids = edge_columns.get(name, np.empty(0, dtype=np.int64))
+            positions = np.minimum(np.searchsorted(sorted_ids, endpoint_ids), max(node_count - 1, 0))
+            if edge_count and (node_count == 0 or (sorted_ids[positions] != endpoint_ids).any()):
+                raise ValueError(f"An edge '{name}' references a node that is not in the network.")
+            endpoint_rows.append(order[positions] if node_count else positions)
+
+        positions = np.column_stack([node_columns.get("n_x", np.zeros(node_count)), node_columns.get("n_y", np.zeros(node_count))])
+        return NetworkArrays(
+            node_ids, positions, node_columns.get("is_fixed", np.zeros(node_count, dtype=bool)),
+            edge_ids, endpoint_rows[0], endpoint_rows[1], edge_columns.get("rest_length", np.full(edge_count, np.nan)),
+            meta_data=dict(meta_data), schema=network_class.schema,
+            node_types=[node_class] if node_class else None, edge_types=[edge_class] if edge_class else None,
+            network_class=network_class,
+        )
+
     @classmethod
     def _matches_schema(cls, data:dict, schema):
         """
         Matches the provided data with the schema.
 
+        Only the meta_data keys and the node and edge column headers are checked, every
+        row of a table has the same attributes.
+
         :param data: The data to be validated against the schema.
         :param schema: The schema to match the data against.
         :return: True if the data matches the schema, False otherwise.
         """
-        Logger.log(f"start _matches_schema(self, {data})")
+        Logger.log(f"start _matches_schema(self, {schema})")
 
         meta_data = data.get("meta_data", {})
         nodes = data.get("nodes", {})
@@ -176,51 +261,45 @@ class NetworkFactory:
         # LOGGING META_DATA CHECK COMPLETE
         Logger.log("meta_data check complete.")
 
-        # CHECKING NODES
-        if nodes:
-            Logger.log("Checking nodes...")
-            keys = list(nodes.keys())
-            for i in range(len(nodes[keys[0]])):
-                node = {key: nodes[key][i] for key in keys}
-                for attr in schema.get("node_attributes", []):
-                    if attr not in node:
-                        # LOGGING MISSING NODE ATTRIBUTE
-                        Logger.log(f"nodes: Attribute '{attr}' not found in node {node}. Schema mismatch.")
-                        return False
-                    else:
-                        # LOGGING FOUND NODE ATTRIBUTE
-                        Logger.log(f"nodes: Attribute '{attr}' found in node {node}.")
-            # LOGGING NODES CHECK COMPLETE
-            Logger.log("nodes check complete.")
-        else:
-            # LOGGING NO NODES FOUND
-            Logger.log("No nodes found in data.")
-
-        # CHECKING EDGES
-        if edges:
-            Logger.log("Checking edges...")
-            keys = list(edges.keys())
-            for i in range(len(edges[keys[0]])):
-                edge = {key: edges[key][i] for key in keys}
-                for attr in schema.get("edge_attributes", []):
-                    if attr not in edge:
-                        # LOGGING MISSING EDGE ATTRIBUTE
-                        Logger.log(f"edges: Attribute '{attr}' not found in edge {edge}. Schema mismatch.")
-                        return False
-                    else:
-                        # LOGGING FOUND EDGE ATTRIBUTE
-                        Logger.log(f"edges: Attribute '{attr}' found in edge {edge}.")
-            # LOGGING EDGES CHECK COMPLETE
-            Logger.log("edges check complete.")
-        else:
-            # LOGGING NO EDGES FOUND
-            Logger.log("No edges found in data.")
+        # CHECKING NODE AND EDGE HEADERS
+        for table_name, columns, attributes in (("nodes", nodes, schema.get("node_attributes", [])),
+                                                ("edges", edges, schema.get("edge_attributes", []))):
+            if not columns or len(next(iter(columns.values()))) == 0:
+                # LOGGING NO ROWS FOUND
+                Logger.log(f"No {table_name} found in data.")
+                continue
+            Logger.log(f"Checking {table_name}...")
+            for attr in attributes:
+                if attr not in columns:
+                    # LOGGING MISSING ATTRIBUTE
+                    Logger.log(f"{table_name}: Attribute '{attr}' not found in columns {list(columns)}. Schema mismatch.")
+                    return False
+            # LOGGING CHECK COMPLETE
+            Logger.log(f"{table_name} check complete.")
 
         # LOGGING SCHEMA MATCH SUCCESSFUL
         Logger.log("Schema matching successful.")
         Logger.log("end _matches_schema(self, data)")
         return True
     
+    @classmethod
+    def get_schema_fingerprint(cls):
+        """
+        Returns a hash of the registered network, node and edge classes, in registration
+        order, and of their schemas. It changes whenever a registration or schema changes,
+        so data derived from a parse can be invalidated.
+
+        :return: The SHA-256 hex digest.
+        """
+        registrations = [
+            [[network_class.__qualname__, repr(network_class.schema)] for network_class in cls._network_types.values()],
+            [[network_class.__qualname__, [[element_class.__qualname__, repr(element_class.get_schema())]
+                                           for element_class in element_classes]]
+             for element_types in (cls._node_types, cls._edge_types)
+             for network_class, element_classes in element_types.items()],
+        ]
+        return hashlib.sha256(repr(registrations).encode("utf-8")).hexdigest()
+
     @classmethod
     def get_all_registered_components(cls):
         """
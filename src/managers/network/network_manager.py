@@ -1,6 +1,8 @@
 from utils.logger.logger import Logger
 from .degradation_engine.no_physics import NoPhysics
 from .degradation_engine.two_dimensional_spring_force_degradation_engine_without_biomechanics import TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
+from .degradation_engine.sparse_newton_spring_degradation_engine import SparseNewtonSpringDegradationEngine
+from .degradation_engine.strain_rupture_spring_degradation_engine import StrainRuptureSpringDegradationEngine
 from .degradation_engine.degradation_engine_strategy import DegradationEngineStrategy
 from .network_state_manager import NetworkStateManager
 
@@ -8,6 +10,15 @@ class NetworkManager:
     """
     Manages network operations and handles logging related to network events.
     """
+
+    # DEGRADATION ENGINE STRATEGIES BY LOWERCASE CLASS NAME
+    DEGRADATION_ENGINE_STRATEGIES = {
+        "nophysics": NoPhysics,
+        "twodimensionalspringforcedegradationenginewithoutbiomechanics": TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics,
+        "sparsenewtonspringdegradationengine": SparseNewtonSpringDegradationEngine,
+        "strainrupturespringdegradationengine": StrainRuptureSpringDegradationEngine
+    }
+
     # NETWORKMANAGER INITIALIZATION
     def __init__(self):
         """
@@ -99,6 +110,26 @@ class NetworkManager:
         self.state_manager.add_new_network_state(self.network)
         Logger.log(f"end degrade_node(self, node_id)")
 
+    # DEGRADE EDGES
+    def degrade_edges(self, edge_ids):
+        """
+        Degrades several edges with a single relaxation and a single new network state.
+        """
+        Logger.log("start degrade_edges(self, %s)", edge_ids)
+        self.network = self.degradation_engine_strategy.degrade_edges(self.network, edge_ids)
+        self.state_manager.add_new_network_state(self.network)
+        Logger.log(f"end degrade_edges(self, edge_ids)")
+
+    # DEGRADE NODES
+    def degrade_nodes(self, node_ids):
+        """
+        Degrades several nodes with a single relaxation and a single new network state.
+        """
+        Logger.log("start degrade_nodes(self, %s)", node_ids)
+        self.network = self.degradation_engine_strategy.degrade_nodes(self.network, node_ids)
+        self.state_manager.add_new_network_state(self.network)
+        Logger.log(f"end degrade_nodes(self, node_ids)")
+
     # UNDO DEGRADATION
     def undo_degradation(self):
         """ 
@@ -130,22 +161,25 @@ class NetworkManager:
         """
         Logger.log(f"start set_degradation_engine_strategy(self, {degradation_engine_strategy})")
 
-        degradation_engine_strategies = {
-            "nophysics": NoPhysics,
-            "twodimensionalspringforcedegradationenginewithoutbiomechanics": TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics
-        }
+        self.degradation_engine_strategy = self.get_degradation_engine_strategy_class(degradation_engine_strategy)()
+
+        Logger.log("end set_degradation_engine_strategy(self, degradation_engine_strategy)")
 
+    # LOOK UP DEGRADATION ENGINE STRATEGY
+    @classmethod
+    def get_degradation_engine_strategy_class(cls, degradation_engine_strategy):
+        """
+        Returns the degradation engine strategy class for a name (case-insensitive).
+        """
         if not degradation_engine_strategy:
             raise Exception("Invalid Degradation Engine Strategy")
 
         strategy_key = degradation_engine_strategy.lower()
 
-        if strategy_key not in degradation_engine_strategies:
+        if strategy_key not in cls.DEGRADATION_ENGINE_STRATEGIES:
             raise Exception(f"Invalid Degradation Engine Strategy: '{degradation_engine_strategy}'")
 
-        self.degradation_engine_strategy = degradation_engine_strategies[strategy_key]() 
-
-        Logger.log("end set_degradation_engine_strategy(self, degradation_engine_strategy)")
+        return cls.DEGRADATION_ENGINE_STRATEGIES[strategy_key]
 
     # RESET NETWORK STATE
     def reset_network_state_manager(self):
@@ -0,0 +1,412 @@
+from utils.logger.logger import Logger
+from .networks.network_arrays import NetworkArrays
+from .network_state_spill_store import NetworkStateSpillStore
+import numpy as np
+import copy
+
+class NetworkStateDelta:
+    """
+    Changes between two consecutive network states.
+
+    A delta records removed node and edge ids, node and edge objects that were added,
+    the new coordinates of nodes that moved and the metadata if it changed. A state in
+    which the is_fixed flag of an existing node or the rest_length of an existing edge
+    changed cannot be stored as a delta, from_signatures returns None for it and the
+    history stores a full checkpoint instead.
+    """
+
+    def __init__(self, removed_node_ids, removed_edge_ids, added_nodes, added_edges,
+                 moved_node_ids, moved_positions, meta_data=None):
+        """
+        Initializes the delta.
+
+        Params:
+            removed_node_ids: array of ids of nodes that were removed.
+            removed_edge_ids: array of ids of edges that were removed.
+            added_nodes (list): node objects that were added.
+            added_edges (list): edge objects that were added.
+            moved_node_ids: array of ids of nodes whose coordinates changed.
+            moved_positions: (M, 2) float array with the new coordinates of the moved nodes.
+            meta_data (dict): new metadata, or None if it did not change.
+        """
+        self.removed_node_ids = removed_node_ids
+        self.removed_edge_ids = removed_edge_ids
+        self.added_nodes = added_nodes
+        self.added_edges = added_edges
+        self.moved_node_ids = moved_node_ids
+        self.moved_positions = moved_positions
+        self.meta_data = meta_data
+
+    @property
+    def nbytes(self):
+        """Returns the number of bytes held by the delta arrays."""
+        return (self.removed_node_ids.nbytes + self.removed_edge_ids.nbytes
+                + self.moved_node_ids.nbytes + self.moved_positions.nbytes)
+
+    @staticmethod
+    def get_signature(network):
+        """
+        Returns the parts of a network state that deltas are computed from.
+
+        Params:
+            network: Network2D or NetworkArrays state.
+
+        Returns:
+            dict: network_class, node_ids, positions, is_fixed, edge_ids, rest_length and a
+                  copy of meta_data.
+        """
+        if isinstance(network, NetworkArrays):
+            return {
+                "network_class": NetworkArrays,
+                "node_ids": network.node_ids.copy(),
+                "positions": network.positions.copy(),
+                "is_fixed": network.is_fixed.copy(),
+                "edge_ids": network.edge_ids.copy(),
+                "rest_length": network.rest_length.copy(),
+                "meta_data": copy.deepcopy(network.meta_data),
+            }
+
+        nodes = network.get_nodes()
+        positions = np.empty((len(nodes), 2), dtype=np.float64)
+        for i, node in enumerate(nodes):
+            positions[i, 0] = getattr(node, "n_x", np.nan)
+            positions[i, 1] = getattr(node, "n_y", np.nan)
+        edges = network.get_edges()
+        return {
+            "network_class": type(network),
+            "node_ids": np.array([node.get_id() for node in nodes]),
+            "positions": positions,
+            "is_fixed": np.array([getattr(node, "is_fixed", None) for node in nodes], dtype=object),
+            "edge_ids": np.array([edge.get_id() for edge in edges]),
+            "rest_length": np.array([getattr(edge, "rest_length", None) for edge in edges], dtype=object),
+            "meta_data": copy.deepcopy(network.get_meta_data()),
+        }
+
+    @classmethod
+    def from_signatures(cls, previous, network, current):
+        """
+        Computes the delta that turns the previous state into the current one.
+
+        Params:
+            previous (dict): signature of the previous state.
+            network: the current network state.
+            current (dict): signature of the current state.
+
+        Returns:
+            NetworkStateDelta, or None if the change cannot be stored as a delta.
+        """
+        # A CHANGE OF REPRESENTATION OR NETWORK TYPE NEEDS A FULL CHECKPOINT
+        if previous["network_class"] is not current["network_class"]:
+            return None
+
+        removed_node_ids = previous["node_ids"][~np.isin(previous["node_ids"], current["node_ids"])]
+        removed_edge_ids = previous["edge_ids"][~np.isin(previous["edge_ids"], current["edge_ids"])]
+        added_node_ids = current["node_ids"][~np.isin(current["node_ids"], previous["node_ids"])]
+        added_edge_ids = current["edge_ids"][~np.isin(current["edge_ids"], previous["edge_ids"])]
+
+        # ARRAY BACKED NETWORKS CANNOT GROW, SO ADDITIONS ALWAYS START A CHECKPOINT
+        if isinstance(network, NetworkArrays) and (len(added_node_ids) or len(added_edge_ids)):
+            return None
+
+        added_nodes = [copy.deepcopy(network.get_node_by_id(node_id)) for node_id in added_node_ids.tolist()]
+        added_edges = [copy.deepcopy(network.get_edge_by_id(edge_id)) for edge_id in added_edge_ids.tolist()]
+
+        # DELTAS DO NOT RECORD ATTRIBUTE EDITS, SO EDITED FLAGS OR REST LENGTHS NEED A CHECKPOINT
+        common_ids, previous_rows, current_rows = np.intersect1d(
+            previous["node_ids"], current["node_ids"], assume_unique=True, return_indices=True)
+        if not cls._is_unchanged(previous["is_fixed"][previous_rows], current["is_fixed"][current_rows]).all():
+            return None
+        _, previous_edge_rows, current_edge_rows = np.intersect1d(
+            previous["edge_ids"], current["edge_ids"], assume_unique=True, return_indices=True)
+        if not cls._is_unchanged(previous["rest_length"][previous_edge_rows],
+                                 current["rest_length"][current_edge_rows]).all():
+            return None
+
+        # COMPARE COORDINATES OF NODES THAT EXIST IN BOTH STATES
+        previous_positions = previous["positions"][previous_rows]
+        current_positions = current["positions"][current_rows]
+        moved = ~cls._is_unchanged(previous_positions, current_positions).all(axis=1)
+
+        meta_data = None if previous["meta_data"] == current["meta_data"] else copy.deepcopy(current["meta_data"])
+
+        return cls(removed_node_ids, removed_edge_ids, added_nodes, added_edges,
+                   common_ids[moved], current_positions[moved], meta_data)
+
+    @staticmethod
+    def _is_unchanged(previous, current):
+        """Returns the elementwise mask of equal values, NaN counting as equal to NaN."""
+        return (previous == current) | ((previous != previous) & (current != current))
+
+    def apply(self, network):
+        """
+        Applies the delta to a network in place.
+
+        Params:
+            network: the network state the delta was computed from.
+        """
+        if isinstance(network, NetworkArrays):
+            network.remove_edges(self.removed_edge_ids.tolist())
+            network.remove_nodes(self.removed_node_ids.tolist())
+            rows = [network.node_index[node_id] for node_id in self.moved_node_ids.tolist()]
+            network.get_writable_positions()[rows] = self.moved_positions
+        else:
+            for edge_id in self.removed_edge_ids.tolist():
+                network.remove_edge(edge_id)
+            for node_id in self.removed_node_ids.tolist():
+                network.remove_node(node_id)
+            # COPY ADDED ELEMENTS SO RECONSTRUCTED STATES NEVER SHARE OBJECTS WITH THE HISTORY
+            for node in self.added_nodes:
+                network.add_node(copy.deepcopy(node))
+            for edge in self.added_edges:
+                network.add_edge(copy.deepcopy(edge))
+            for node_id, (x, y) in zip(self.moved_node_ids.tolist(), self.moved_positions.tolist()):
+                node = network.get_writable_node(node_id)
+                node.n_x = x
+                node.n_y = y
+
+        if self.meta_data is not None:
+            network.meta_data = copy.deepcopy(self.meta_data)
+
+
+class NetworkStateHistory:
+    """
+    Sequence of network states stored as periodic full checkpoints plus deltas.
+
+    With a checkpoint_interval of 1 every state is stored as a full copy. With a larger
+    interval only every checkpoint_interval-th state is copied and the states between
+    them are stored as NetworkStateDelta objects, which bounds the number of deltas
+    applied when a state is rebuilt. Checkpoints are copy-on-write snapshots, so they
+    share unchanged nodes, edges and columns with the network they were taken from.
+
+    If a memory_budget is set, the oldest entries are written to a NetworkStateSpillStore
+    once the estimated size of the entries kept in memory exceeds it. The newest entry
+    always stays in memory.
+    """
+
+    CHECKPOINT = "checkpoint"
+    DELTA = "delta"
+
+    # ESTIMATED BYTES HELD BY ONE NODE OR EDGE OBJECT IN AN OBJECT NETWORK
+    OBJECT_ELEMENT_BYTES = 500
+
+    def __init__(self, checkpoint_interval=1, memory_budget=None, spill_directory=None):
+        """
+        Initializes an empty history.
+
+        Params:
+            checkpoint_interval (int): number of states between full checkpoints.
+            memory_budget (int): bytes of history to keep in memory, unbounded if None.
+            spill_directory (str): folder for spilled states, a temporary folder if None.
+
+        Raises:
+            ValueError: If checkpoint_interval is smaller than 1 or memory_budget is negative.
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1.")
+        if memory_budget is not None and memory_budget < 0:
+            raise ValueError("memory_budget cannot be negative.")
+        self.checkpoint_interval = checkpoint_interval
+        self.memory_budget = memory_budget
+        self._spill_store = NetworkStateSpillStore(spill_directory)
+        self._memory_bytes = 0
+        self._entries = []          # LIST OF [KIND, CHECKPOINT NETWORK OR DELTA, SUMMARY, SIZE, SPILL KEY]
+        self._signature = None      # (INDEX, SIGNATURE) OF THE STATE THE NEXT DELTA IS COMPUTED FROM
+        self._cached_state = None   # (INDEX, NETWORK) OF THE LAST REBUILT STATE
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        """
+        Returns the network state at index, rebuilding it from the nearest checkpoint
+        if needed. Rebuilt states are cached until another state is requested.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._entries)))]
+        index = self._normalize_index(index)
+
+        # IN FULL COPY MODE EVERY STATE IS STORED AS IS UNLESS IT WAS SPILLED TO DISK
+        if self.checkpoint_interval == 1 and self._entries[index][1] is not None:
+            return self._entries[index][1]
+
+        if self._cached_state is None or self._cached_state[0] != index:
+            network = self._rebuild(index)
+            # RECORD THE SIGNATURE BEFORE CALLERS CAN MODIFY THE REBUILT STATE
+            self._signature = (index, NetworkStateDelta.get_signature(network))
+            self._cached_state = (index, network)
+        return self._cached_state[1]
+
+    def __iter__(self):
+        """
+        Streams every state in order, applying each delta once instead of rebuilding
+        every state from its checkpoint. Each yielded network is an independent copy.
+        """
+        if self.checkpoint_interval == 1:
+            for position in range(len(self._entries)):
+                network = self._entries[position][1]
+                yield network if network is not None else self._load_state(position)
+            return
+
+        working = None
+        for position in range(len(self._entries)):
+            payload = self._load_payload(position)
+            if self._entries[position][0] == self.CHECKPOINT:
+                working = self._load_state(position)
+            else:
+                payload.apply(working)
+            yield working.snapshot()
+
+    def append(self, network):
+        """
+        Appends a network state to the end of the history.
+
+        Params:
+            network: the network state to store. It is copied or diffed, never kept.
+        """
+        index = len(self._entries)
+        summary = self._get_summary(network)
+
+        if self.checkpoint_interval == 1:
+            self._add_entry(self.CHECKPOINT, network.snapshot(), summary)
+            return
+
+        signature = NetworkStateDelta.get_signature(network)
+        delta = None
+        if index % self.checkpoint_interval != 0:
+            delta = NetworkStateDelta.from_signatures(self._get_signature(index - 1), network, signature)
+
+        if delta is None:
+            self._add_entry(self.CHECKPOINT, network.snapshot(), summary)
+        else:
+            self._add_entry(self.DELTA, delta, summary)
+
+        self._signature = (index, signature)
+        self._cached_state = None
+        Logger.log(f"History state {index} stored as {self._entries[-1][0]}")
+
+    def truncate(self, length):
+        """
+        Drops every state at or after position length.
+
+        Params:
+            length (int): number of states to keep.
+        """
+        for entry in self._entries[length:]:
+            self._release_entry(entry)
+        del self._entries[length:]
+        if self._signature is not None and self._signature[0] >= length:
+            self._signature = None
+        if self._cached_state is not None and self._cached_state[0] >= length:
+            self._cached_state = None
+
+    def close(self):
+        """Drops every state and deletes the states spilled to disk."""
+        self.truncate(0)
+        self._spill_store.close()
+
+    def get_memory_usage(self):
+        """Returns the estimated number of bytes of history held in memory."""
+        return self._memory_bytes
+
+    def get_summary(self, index):
+        """
+        Returns node count, edge count, metadata and schema of a state without rebuilding it.
+
+        Params:
+            index (int): position of the state in the history.
+        """
+        return self._entries[self._normalize_index(index)][2]
+
+    def describe_state(self, index):
+        """Returns a short description of how a state is stored."""
+        kind, _, summary, _, spill_key = self._entries[self._normalize_index(index)]
+        location = "on disk" if spill_key is not None else "in memory"
+        return (f"{kind} {summary['network_class']} "
+                f"({summary['node_count']} nodes, {summary['edge_count']} edges) {location}")
+
+    def _add_entry(self, kind, payload, summary):
+        """Stores an entry in memory and spills older entries if the memory budget is exceeded."""
+        size = self._estimate_size(kind, payload)
+        self._entries.append([kind, payload, summary, size, None])
+        self._memory_bytes += size
+        if self.memory_budget is None:
+            return
+
+        # SPILL THE OLDEST ENTRIES FIRST, THEY ARE THE LEAST LIKELY TO BE REVISITED
+        for entry in self._entries[:-1]:
+            if self._memory_bytes <= self.memory_budget:
+                break
+            if entry[4] is None:
+                entry[4] = self._spill_store.write(entry[0], entry[1])
+                entry[1] = None
+                self._memory_bytes -= entry[3]
+
+    def _release_entry(self, entry):
+        """Frees the memory or the disk space used by an entry."""
+        if entry[4] is None:
+            self._memory_bytes -= entry[3]
+        else:
+            self._spill_store.delete(entry[4])
+
+    def _load_payload(self, index):
+        """Returns the checkpoint network or delta of an entry, reading it from disk if it was spilled."""
+        kind, payload, _, _, spill_key = self._entries[index]
+        if payload is None:
+            payload = self._spill_store.read(spill_key)
+        return payload
+
+    def _load_state(self, index):
+        """
+        Returns an independent copy of a checkpoint network. Checkpoints held in memory
+        are snapshotted, spilled checkpoints are copied so no state keeps the spill files mapped.
+        """
+        if self._entries[index][1] is not None:
+            return self._entries[index][1].snapshot()
+        return copy.deepcopy(self._load_payload(index))
+
+    def _estimate_size(self, kind, payload):
+        """Returns the estimated number of bytes held by an entry."""
+        if kind == self.DELTA:
+            added_count = len(payload.added_nodes) + len(payload.added_edges)
+            return payload.nbytes + added_count * self.OBJECT_ELEMENT_BYTES
+        if isinstance(payload, NetworkArrays):
+            return payload.nbytes
+        return (len(payload.get_nodes()) + len(payload.get_edges())) * self.OBJECT_ELEMENT_BYTES
+
+    def _get_signature(self, index):
+        """Returns the signature of a state, rebuilding the state if it is not the last one seen."""
+        if self._signature is None or self._signature[0] != index:
+            self._signature = (index, NetworkStateDelta.get_signature(self._rebuild(index)))
+        return self._signature[1]
+
+    def _rebuild(self, index):
+        """Rebuilds a state from the nearest checkpoint at or before it."""
+        start = index
+        while self._entries[start][0] != self.CHECKPOINT:
+            start -= 1
+        network = self._load_state(start)
+        for position in range(start + 1, index + 1):
+            self._load_payload(position).apply(network)
+        return network
+
+    def _normalize_index(self, index):
+        if index < 0:
+            index += len(self._entries)
+        if not 0 <= index < len(self._entries):
+            raise IndexError("network state history index out of range")
+        return index
+
+    @staticmethod
+    def _get_summary(network):
+        """Returns the parts of a state needed to check export conditions."""
+        if isinstance(network, NetworkArrays):
+            node_count, edge_count = network.get_node_count(), network.get_edge_count()
+        else:
+            node_count, edge_count = len(network.get_nodes()), len(network.get_edges())
+        return {
+            "network_class": type(network).__name__,
+            "node_count": node_count,
+            "edge_count": edge_count,
+            "meta_data": copy.deepcopy(network.get_meta_data()),
+            "schema": network.schema,
+        }
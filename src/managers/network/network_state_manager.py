@@ -1,18 +1,37 @@
 from utils.logger.logger import Logger
 from .networks.base_network import BaseNetwork
+from .network_state_history import NetworkStateHistory
 
 class NetworkStateManager:
     """
     Manages network state history, allowing for undo and redo functionality.
     """
+    # HISTORY MODES AND THE NUMBER OF STATES BETWEEN FULL CHECKPOINTS THEY USE
+    FULL_HISTORY_MODE = "full"
+    DELTA_HISTORY_MODE = "delta"
+
     # INITIALIZES THE NETWORKSTATEMANAGER
-    def __init__(self):
+    def __init__(self, history_mode=DELTA_HISTORY_MODE, checkpoint_interval=20, memory_budget=None,
+                 spill_directory=None):
         """
         Initializes the NetworkStateManager with an empty network state history and default settings.
+
+        :param history_mode: "full" stores a complete copy of every state, "delta" stores periodic
+                             full checkpoints and only the changes between the states in between.
+        :param checkpoint_interval: number of states between full checkpoints in "delta" mode.
+        :param memory_budget: bytes of history to keep in memory before the oldest states are
+                              spilled to disk, unbounded if None.
+        :param spill_directory: folder for spilled states, a temporary folder if None.
+        :raises ValueError: If history_mode is not a known mode.
         """
         Logger.log(f"start NetworkStateManager__init__")
-        self.network_state_history = []       # LIST TO STORE NETWORK STATE HISTORY
-        self.current_state = None             # CURRENT ACTIVE NETWORK STATE
+        if history_mode not in (self.FULL_HISTORY_MODE, self.DELTA_HISTORY_MODE):
+            raise ValueError(f"Invalid history mode: '{history_mode}'")
+        self.history_mode = history_mode
+        self.checkpoint_interval = 1 if history_mode == self.FULL_HISTORY_MODE else checkpoint_interval
+        self.memory_budget = memory_budget
+        self.spill_directory = spill_directory
+        self.network_state_history = self._create_history()  # NETWORK STATE HISTORY
         self.current_network_state_index = 0  # INDEX OF THE CURRENT NETWORK STATE IN HISTORY
         self.undo_disabled = True             # FLAG TO ENABLE/DISABLE UNDO
         self.redo_disabled = True             # FLAG TO ENABLE/DISABLE REDO
@@ -20,6 +39,16 @@ class NetworkStateManager:
         self.is_new_network = False           # FLAG TO INDICATE IF A NEW NETWORK IS BEING BUILT
         Logger.log(f"end NetworkStateManager__init__")
 
+    # CURRENT ACTIVE NETWORK STATE
+    @property
+    def current_state(self):
+        """
+        Returns the current network state, rebuilding it from the history if needed.
+        """
+        if not self.network_state_history:
+            return None
+        return self.network_state_history[self.current_network_state_index]
+
     # LOGS THE NETWORKS IN STATE HISTORY
     def log_network_history(self):
         """
@@ -44,7 +73,8 @@ class NetworkStateManager:
     def log_network_state_manager_attributes(self):
         Logger.log("Logging NetworkStateManager attributes:")
         Logger.log(f"  network_state_history (length): {len(self.network_state_history)}")
-        Logger.log(f"  current_state: {self.current_state}")
+        if self.network_state_history:
+            Logger.log(f"  current_state: {self.network_state_history.describe_state(self.current_network_state_index)}")
         Logger.log(f"  current_network_state_index: {self.current_network_state_index}")
         Logger.log(f"  undo_disabled: {self.undo_disabled}")
         Logger.log(f"  redo_disabled: {self.redo_disabled}")
@@ -68,24 +98,27 @@ class NetworkStateManager:
         Logger.log("start _check_export_condition()")
 
         # Export is disabled if no current state
-        if not self.current_state:
+        if not self.network_state_history:
             Logger.log("No current state — disabling export.")
             return True
 
+        # The summary avoids rebuilding the current state from deltas
+        summary = self.network_state_history.get_summary(self.current_network_state_index)
+
         # Check node and edge count only if building a new network
         if getattr(self, "is_new_network", False):  # fallback to False if attribute is missing
-            if len(self.current_state.get_nodes()) < 2:
+            if summary["node_count"] < 2:
                 Logger.log("New network: Not enough nodes — disabling export.")
                 return True
-            if len(self.current_state.get_edges()) < 1:
+            if summary["edge_count"] < 1:
                 Logger.log("New network: Not enough edges — disabling export.")
                 return True
 
         # Check all required meta_data fields
         has_all_meta_data = True
-        if self.current_state.schema and "meta_data" in self.current_state.schema:
-            for key in self.current_state.schema["meta_data"]:
-                if key not in self.current_state.meta_data or self.current_state.meta_data[key] is None:
+        if summary["schema"] and "meta_data" in summary["schema"]:
+            for key in summary["schema"]["meta_data"]:
+                if key not in summary["meta_data"] or summary["meta_data"][key] is None:
                     Logger.log(f"Missing or None meta_data key: {key} — disabling export.")
                     has_all_meta_data = False
                     break
@@ -105,20 +138,13 @@ class NetworkStateManager:
         """
         Logger.log(f"start add_new_state({network_state})")
         
-        # SLICE THE NETWORK STATE HISTORY TO INCLUDE ITEMS FROM CURRENT NETWORK STATE INDEX AND BACK
-        self.network_state_history = self.network_state_history[:self.current_network_state_index + 1]
-
-        import copy
-
-        cloned_state = copy.deepcopy(network_state)
-
-        # ADD NEW NETWORK STATE TO HISTORY
-        self.network_state_history.append(cloned_state)
+        # TRUNCATE THE NETWORK STATE HISTORY TO INCLUDE ITEMS FROM CURRENT NETWORK STATE INDEX AND BACK
+        self.network_state_history.truncate(self.current_network_state_index + 1)
 
-        # SET NEW NETWORK STATE AS CURRENT NETWORK STATE
-        self.current_state = cloned_state
+        # ADD NEW NETWORK STATE TO HISTORY (COPIED AS A CHECKPOINT OR STORED AS A DELTA)
+        self.network_state_history.append(network_state)
 
-        # UPDATE CURRENT NETWORK STATE INDEX TO LAST INDEX OF HISTORY
+        # UPDATE CURRENT NETWORK STATE INDEX TO LAST INDEX OF HISTORY, WHICH BECOMES THE CURRENT STATE
         self.current_network_state_index = len(self.network_state_history) - 1
 
         # ENABLE UNDO FUNCTIONALITY
@@ -143,9 +169,8 @@ class NetworkStateManager:
         if self.undo_disabled or self.current_network_state_index == 0:
             return
         
-        # MOVE TO PREVIOUS NETWORK STATE
+        # MOVE TO PREVIOUS NETWORK STATE (current_state IS REBUILT LAZILY)
         self.current_network_state_index -= 1
-        self.current_state = self.network_state_history[self.current_network_state_index]
 
         # ENABLE REDO FUNCTIONALITY
         self.redo_disabled = False
@@ -173,9 +198,8 @@ class NetworkStateManager:
         if self.redo_disabled or self.current_network_state_index >= len(self.network_state_history) - 1:
             return
         
-        # MOVE TO NEXT NETWORK STATE
+        # MOVE TO NEXT NETWORK STATE (current_state IS REBUILT LAZILY)
         self.current_network_state_index += 1
-        self.current_state = self.network_state_history[self.current_network_state_index]
 
         # ENABLE UNDO FUNCTIONALITY
         self.undo_disabled = False
@@ -205,17 +229,23 @@ class NetworkStateManager:
         Logger.log("end get_base_network_state - no states in history")
         return None  # Return None if there are no states in history
     
+    def _create_history(self):
+        """
+        Creates an empty network state history with the configured storage settings.
+        """
+        return NetworkStateHistory(self.checkpoint_interval, self.memory_budget, self.spill_directory)
+
     def reset_network_state(self):
         """
         Resets the network state manager, clearing the history and setting the current state to None.
         """
         Logger.log("start reset_network_state()")
         
-        # Clear the network state history
-        self.network_state_history = []
+        # Clear the network state history and the states spilled to disk
+        self.network_state_history.close()
+        self.network_state_history = self._create_history()
         
         # Reset the current state and network state index
-        self.current_state = None
         self.current_network_state_index = 0
         
         # Re-enable or disable flags based on reset state
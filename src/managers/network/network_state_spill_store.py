@@ -0,0 +1,178 @@
+from utils.logger.logger import Logger
+from .networks.network_arrays import NetworkArrays
+import numpy as np
+import itertools
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+
+class NetworkStateSpillStore:
+    """
+    On-disk store for network history entries that do not fit in the memory budget.
+
+    Every entry is written to its own folder. Numeric columns are saved as .npy files
+    and memory-mapped back when the entry is read, so only the pages that are touched
+    are loaded. Everything else (metadata, element classes, added elements) is pickled.
+    """
+
+    # COLUMNS OF A NETWORKARRAYS CHECKPOINT
+    NETWORK_COLUMNS = ("node_ids", "positions", "is_fixed", "node_type_codes",
+                       "edge_ids", "edge_from", "edge_to", "rest_length", "edge_type_codes")
+    # COLUMNS OF A NETWORKSTATEDELTA
+    DELTA_COLUMNS = ("removed_node_ids", "removed_edge_ids", "moved_node_ids", "moved_positions")
+
+    def __init__(self, directory=None):
+        """
+        Initializes the store.
+
+        Params:
+            directory (str): Folder to write entries to. A temporary folder that is removed
+                             when the store is closed is used if not provided.
+        """
+        self.directory = directory
+        self._owns_directory = directory is None
+        self._keys = itertools.count()
+        self._written_keys = set()
+        self._finalizer = None
+
+    def write(self, kind, payload):
+        """
+        Writes a checkpoint network or a NetworkStateDelta to disk.
+
+        Params:
+            kind (str): "checkpoint" or "delta".
+            payload: the network or delta to write.
+
+        Returns:
+            str: The key used to read or delete the entry.
+        """
+        entry_folder = os.path.join(self._get_directory(), f"state_{next(self._keys)}")
+        os.makedirs(entry_folder)
+
+        if kind == "delta":
+            columns = {name: getattr(payload, name) for name in self.DELTA_COLUMNS}
+            objects = {"added_nodes": payload.added_nodes, "added_edges": payload.added_edges,
+                       "meta_data": payload.meta_data}
+            layout = "delta"
+        else:
+            network_arrays, layout = self._to_network_arrays(payload)
+            if network_arrays is None:
+                columns = {}
+                objects = {"network": payload}
+            else:
+                columns = {name: getattr(network_arrays, name) for name in self.NETWORK_COLUMNS}
+                objects = {
+                    "meta_data": network_arrays.meta_data, "schema": network_arrays.schema,
+                    "node_types": network_arrays.node_types, "edge_types": network_arrays.edge_types,
+                    "network_class": network_arrays.network_class,
+                }
+
+        # OBJECT COLUMNS CANNOT BE MEMORY-MAPPED SO THEY ARE PICKLED WITH THE REST
+        for name, column in columns.items():
+            column = np.asarray(column)
+            if column.dtype.hasobject:
+                objects[name] = column
+            else:
+                np.save(os.path.join(entry_folder, f"{name}.npy"), column, allow_pickle=False)
+
+        with open(os.path.join(entry_folder, "objects.pkl"), "wb") as objects_file:
+            pickle.dump({"layout": layout, **objects}, objects_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._written_keys.add(entry_folder)
+        Logger.log(f"Spilled {kind} to {entry_folder}")
+        return entry_folder
+
+    def read(self, key):
+        """
+        Reads an entry written by write, memory-mapping its numeric columns.
+
+        Params:
+            key (str): The key returned by write.
+
+        Returns:
+            The checkpoint network or NetworkStateDelta.
+        """
+        from .network_state_history import NetworkStateDelta
+
+        with open(os.path.join(key, "objects.pkl"), "rb") as objects_file:
+            objects = pickle.load(objects_file)
+        layout = objects.pop("layout")
+
+        def column(name):
+            if name in objects:
+                return objects[name]
+            return np.load(os.path.join(key, f"{name}.npy"), mmap_mode="r")
+
+        if layout == "delta":
+            return NetworkStateDelta(
+                column("removed_node_ids"), column("removed_edge_ids"),
+                objects["added_nodes"], objects["added_edges"],
+                column("moved_node_ids"), column("moved_positions"), objects["meta_data"],
+            )
+        if layout == "pickle":
+            return objects["network"]
+
+        network_arrays = NetworkArrays(
+            *(column(name) for name in ("node_ids", "positions", "is_fixed", "edge_ids",
+                                        "edge_from", "edge_to", "rest_length")),
+            meta_data=objects["meta_data"], schema=objects["schema"],
+            node_types=objects["node_types"], node_type_codes=column("node_type_codes"),
+            edge_types=objects["edge_types"], edge_type_codes=column("edge_type_codes"),
+            network_class=objects["network_class"],
+        )
+        # OBJECT NETWORKS WERE STORED AS COLUMNS AND ARE CONVERTED BACK
+        return network_arrays if layout == "arrays" else network_arrays.to_network()
+
+    def delete(self, key):
+        """
+        Deletes an entry from disk.
+
+        Params:
+            key (str): The key returned by write.
+        """
+        shutil.rmtree(key, ignore_errors=True)
+        self._written_keys.discard(key)
+
+    def close(self):
+        """Deletes every entry and the temporary folder if the store created it."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+
+    def _get_directory(self):
+        """Returns the store folder, creating it on first use."""
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="fibrinet_history_")
+        elif not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        if self._finalizer is None:
+            # REMOVE SPILLED FILES WHEN THE STORE IS GARBAGE COLLECTED OR THE PROCESS EXITS
+            owned_directory = self.directory if self._owns_directory else None
+            self._finalizer = weakref.finalize(self, NetworkStateSpillStore._remove_entries,
+                                               owned_directory, self._written_keys)
+        return self.directory
+
+    @staticmethod
+    def _remove_entries(owned_directory, written_keys):
+        for key in list(written_keys):
+            shutil.rmtree(key, ignore_errors=True)
+        written_keys.clear()
+        if owned_directory is not None:
+            shutil.rmtree(owned_directory, ignore_errors=True)
+
+    @staticmethod
+    def _to_network_arrays(network):
+        """
+        Returns (NetworkArrays, layout) for a checkpoint network, or (None, "pickle") if the
+        network cannot be stored as columns and converted back without losing attributes.
+        """
+        if isinstance(network, NetworkArrays):
+            return network, "arrays"
+        try:
+            # from_network REJECTS ELEMENT TYPES THAT COULD NOT BE REBUILT FROM THE COLUMNS
+            return NetworkArrays.from_network(network), "objects"
+        except (AttributeError, TypeError, ValueError) as ex:
+            Logger.log(f"Network cannot be stored as columns, pickling it instead: {ex}")
+            return None, "pickle"
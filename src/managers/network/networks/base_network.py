@@ -1,10 +1,31 @@
 from utils.logger.logger import Logger
 from ..nodes.base_node import BaseNode 
 from ..edges.base_edge import BaseEdge 
+import copy
+
+def next_topology_version():
+    """
+    Returns a topology version that no network has used before.
+
+    Versions are opaque tokens compared by identity rather than counters, so they stay
+    unique across processes: a pickled or deep copied network gets a new version.
+    """
+    return object()
 
 class BaseNetwork:
     """
     Represents a network containing nodes, edges, and metadata.
+
+    snapshot() returns a copy-on-write copy that shares the id indexes and the node
+    and edge objects with the original. Whichever network is changed first copies the
+    index or element it writes to, so element attributes must be changed through
+    get_writable_node and get_writable_edge once a network has been snapshotted.
+
+    topology_version changes whenever nodes or edges are added or removed and whenever
+    an edge is handed out by get_writable_edge, so solvers can cache what they derive
+    from the topology. Snapshots share the version until either network is changed.
+    Code that changes other solver inputs in place, such as is_fixed, must call
+    mark_topology_changed.
     """
 
     allowed_node_type = BaseNode
@@ -20,9 +41,11 @@ class BaseNetwork:
             meta_data (dict): Metadata dictionary (default: empty dict).
             schema (dict): Schema dict defining allowed keys and types (default: empty dict).
         """
-        Logger.log(f"start BaseNetwork __init__(self, {nodes}, {edges}, {meta_data}, {schema})")
+        Logger.log("start BaseNetwork __init__(self, %d nodes, %d edges, %s, schema)",
+                   len(nodes or []), len(edges or []), meta_data)
 
-        # INITIALIZE NETWORK PROPERTIES
+        # INITIALIZE NETWORK PROPERTIES (THE nodes AND edges SETTERS BUILD THE ID INDEXES)
+        self._owned_containers = set()
         self.nodes = nodes or []
         self.edges = edges or []
         self.meta_data = meta_data or {}
@@ -33,14 +56,11 @@ class BaseNetwork:
             "edge_attributes": self.allowed_edge_type.get_schema(),
         }
 
-        # LOG NETWORK CONTENTS
+        # LOG NETWORK CONTENTS, PER ELEMENT DUMPS ONLY AT TRACE LEVEL
         Logger.log("===== Network Properties =====")
-        Logger.log("Nodes:")
-        for node in self.nodes:
-            Logger.log(f"{node.__dict__}")
-        Logger.log("Edges:")
-        for edge in self.edges:
-            Logger.log(f"{edge.__dict__}")
+        Logger.log("Nodes: %d", len(self._nodes_by_id))
+        Logger.log("Edges: %d", len(self._edges_by_id))
+        self._log_elements()
         Logger.log("Meta Properties:")
         for key, value in self.meta_data.items():
             Logger.log(f"{key}: {value}")
@@ -69,12 +89,71 @@ class BaseNetwork:
         except (ValueError, TypeError):
             raise ValueError(f"Invalid value: '{value}' is not of type {expected_type.__name__}")
 
+    @property
+    def nodes(self):
+        """
+        Returns the nodes in the network, in insertion order, as a read-only tuple.
+        Use add_node and remove_node, or assign a new list, to change the nodes.
+        """
+        return tuple(self._nodes_by_id.values())
+
+    @nodes.setter
+    def nodes(self, nodes):
+        """
+        Replaces all nodes in the network and rebuilds the node index.
+
+        Params:
+            nodes (list): List of node objects.
+
+        Raises:
+            ValueError: If two nodes share the same ID.
+        """
+        nodes_by_id = {}
+        for node in nodes:
+            if node.get_id() in nodes_by_id:
+                raise ValueError(f"Node with ID '{node.get_id()}' already exists in the network.")
+            nodes_by_id[node.get_id()] = node
+        self._nodes_by_id = nodes_by_id
+        self._owned_containers.add("_nodes_by_id")
+        self._owned_node_ids = None
+        self.mark_topology_changed()
+
+    @property
+    def edges(self):
+        """
+        Returns the edges in the network, in insertion order, as a read-only tuple.
+        Use add_edge and remove_edge, or assign a new list, to change the edges.
+        """
+        return tuple(self._edges_by_id.values())
+
+    @edges.setter
+    def edges(self, edges):
+        """
+        Replaces all edges in the network and rebuilds the edge and adjacency indexes.
+
+        Params:
+            edges (list): List of edge objects.
+
+        Raises:
+            ValueError: If two edges share the same ID.
+        """
+        self._edges_by_id = {}
+        self._edge_ids_by_node_id = {}
+        self._owned_containers.update(("_edges_by_id", "_edge_ids_by_node_id"))
+        self._owned_edge_ids = None
+        self._owned_adjacency_ids = None
+        self.mark_topology_changed()
+        for edge in edges:
+            if edge.get_id() in self._edges_by_id:
+                raise ValueError(f"Edge with ID '{edge.get_id()}' already exists in the network.")
+            self._index_edge(edge)
+
     def get_nodes(self):
-        """Returns the list of nodes in the network."""
+        """Returns the nodes in the network as a read-only tuple, see nodes."""
         return self.nodes
 
     def get_edges(self):
-        """Returns the list of edges in the network."""
+        """Returns the edges in the network as a read-only tuple, see edges."""
         return self.edges
 
     def get_meta_data(self):
@@ -162,7 +241,10 @@ class BaseNetwork:
         if self.get_node_by_id(node.get_id()) is not None:
             raise ValueError(f"Node with ID '{node.get_id()}' already exists in the network.")
         # ADD NODE TO NETWORK
-        self.nodes.append(node)
+        self._get_writable_container("_nodes_by_id")[node.get_id()] = node
+        if self._owned_node_ids is not None:
+            self._owned_node_ids.add(node.get_id())
+        self.mark_topology_changed()
         Logger.log("end network add_node(self, node)")
 
     def remove_node(self, node_id):
@@ -172,8 +254,10 @@ class BaseNetwork:
         Params:
             node_id: The ID of the node to remove.
         """
-        # FILTER OUT NODE BY ID
-        self.nodes = [node for node in self.nodes if node.get_id() != node_id]
+        # REMOVE NODE FROM THE INDEX (CONNECTED EDGES ARE LEFT IN PLACE)
+        if node_id in self._nodes_by_id:
+            del self._get_writable_container("_nodes_by_id")[node_id]
+            self.mark_topology_changed()
 
     def add_edge(self, edge):
         """
@@ -212,7 +296,7 @@ class BaseNetwork:
             raise ValueError(f"'n_to' value {edge.n_to} does not exist in network.")
 
         # ADD EDGE TO NETWORK
-        self.edges.append(edge)
+        self._index_edge(edge)
         Logger.log(f"Edge successfully added: {edge.n_from} -> {edge.n_to}")
         Logger.log("end add_edge()")
 
@@ -225,8 +309,17 @@ class BaseNetwork:
         Params:
             edge_id: The ID of the edge to remove.
         """
-        # FILTER OUT EDGE BY ID
-        self.edges = [edge for edge in self.edges if edge.get_id() != edge_id]
+        # REMOVE EDGE FROM THE EDGE INDEX AND FROM THE ADJACENCY OF BOTH ENDPOINTS
+        if edge_id not in self._edges_by_id:
+            return
+        edge = self._get_writable_container("_edges_by_id").pop(edge_id)
+        self.mark_topology_changed()
+        for node_id in (getattr(edge, "n_from", None), getattr(edge, "n_to", None)):
+            if node_id in self._edge_ids_by_node_id:
+                edge_ids = self._get_writable_edge_ids(node_id)
+                edge_ids.pop(edge_id, None)
+                if not edge_ids:
+                    del self._edge_ids_by_node_id[node_id]
 
     def get_node_by_id(self, node_id):
         """
@@ -238,10 +331,7 @@ class BaseNetwork:
         Returns:
             BaseNode or None: Found node or None if not found.
         """
-        for node in self.nodes:
-            if node.get_id() == node_id:
-                return node
-        return None
+        return self._nodes_by_id.get(node_id)
 
     def get_edge_by_id(self, edge_id):
         """
@@ -253,22 +343,153 @@ class BaseNetwork:
         Returns:
             BaseEdge or None: Found edge or None if not found.
         """
-        for edge in self.edges:
-            if edge.get_id() == edge_id:
-                return edge
-        return None
+        return self._edges_by_id.get(edge_id)
+
+    def get_edges_by_node_id(self, node_id):
+        """
+        Retrieves the edges connected to a node.
+
+        Params:
+            node_id: The ID of the node.
+
+        Returns:
+            list: Edges whose 'n_from' or 'n_to' is the node ID.
+        """
+        edge_ids = self._edge_ids_by_node_id.get(node_id, {})
+        return [self._edges_by_id[edge_id] for edge_id in edge_ids]
+
+    def get_node_degree(self, node_id):
+        """
+        Returns the number of edges connected to a node.
+
+        Params:
+            node_id: The ID of the node.
+        """
+        return len(self._edge_ids_by_node_id.get(node_id, ()))
+
+    def get_isolated_node_count(self):
+        """
+        Returns the number of nodes without any edge connected to them, in O(1).
+        Assumes every edge endpoint is a node of the network.
+        """
+        return len(self._nodes_by_id) - len(self._edge_ids_by_node_id)
+
+    def _index_edge(self, edge):
+        """
+        Adds an edge to the edge index and to the adjacency of both endpoints.
+        Edge endpoints must not be changed while the edge is in the network.
+        """
+        edge_id = edge.get_id()
+        self._get_writable_container("_edges_by_id")[edge_id] = edge
+        self.mark_topology_changed()
+        if self._owned_edge_ids is not None:
+            self._owned_edge_ids.add(edge_id)
+        for node_id in (getattr(edge, "n_from", None), getattr(edge, "n_to", None)):
+            # A DICT IS USED AS AN INSERTION ORDERED SET OF EDGE IDS
+            self._get_writable_edge_ids(node_id)[edge_id] = None
+
+    def snapshot(self):
+        """
+        Returns a copy-on-write copy of the network.
+
+        The copy shares the id indexes and the node and edge objects with this network,
+        only the metadata dict is copied. Afterwards neither network owns the shared
+        storage: the first write to an index copies that index and the first write to an
+        element through get_writable_node or get_writable_edge copies that element.
+
+        Returns:
+            BaseNetwork: A network of the same class with the same nodes, edges and metadata.
+        """
+        clone = copy.copy(self)
+        clone.meta_data = dict(self.meta_data)
+        for network in (self, clone):
+            network._owned_containers = set()
+            network._owned_node_ids = set()
+            network._owned_edge_ids = set()
+            network._owned_adjacency_ids = set()
+        return clone
+
+    def get_writable_node(self, node_id):
+        """
+        Retrieves a node that can be changed in place without changing any snapshot.
+
+        Params:
+            node_id: The ID of the node to find.
+
+        Returns:
+            BaseNode or None: The node, copied first if it is shared, or None if not found.
+        """
+        node = self._nodes_by_id.get(node_id)
+        if node is None or self._owned_node_ids is None or node_id in self._owned_node_ids:
+            return node
+        node = self._copy_element(node)
+        self._get_writable_container("_nodes_by_id")[node_id] = node
+        self._owned_node_ids.add(node_id)
+        return node
+
+    def get_writable_edge(self, edge_id):
+        """
+        Retrieves an edge that can be changed in place without changing any snapshot.
+        The edge endpoints must still not be changed while the edge is in the network.
+        Edge attributes such as rest_length are solver inputs, so the topology version changes.
+
+        Params:
+            edge_id: The ID of the edge to find.
+
+        Returns:
+            BaseEdge or None: The edge, copied first if it is shared, or None if not found.
+        """
+        edge = self._edges_by_id.get(edge_id)
+        if edge is not None:
+            self.mark_topology_changed()
+        if edge is None or self._owned_edge_ids is None or edge_id in self._owned_edge_ids:
+            return edge
+        edge = self._copy_element(edge)
+        self._get_writable_container("_edges_by_id")[edge_id] = edge
+        self._owned_edge_ids.add(edge_id)
+        return edge
+
+    @property
+    def topology_version(self):
+        """Returns the version of the nodes, edges and their solver attributes, see mark_topology_changed."""
+        return self._topology_version
+
+    def mark_topology_changed(self):
+        """Gives the network a new topology version, invalidating solver data cached for the old one."""
+        self._topology_version = next_topology_version()
+
+    def _get_writable_container(self, name):
+        """Returns the named id index, copying it first if it is shared with a snapshot."""
+        if name not in self._owned_containers:
+            setattr(self, name, dict(getattr(self, name)))
+            self._owned_containers.add(name)
+        return getattr(self, name)
+
+    def _get_writable_edge_ids(self, node_id):
+        """Returns the adjacency set of a node, creating it or copying it first if it is shared."""
+        adjacency = self._get_writable_container("_edge_ids_by_node_id")
+        edge_ids = adjacency.get(node_id)
+        if edge_ids is None or (self._owned_adjacency_ids is not None and node_id not in self._owned_adjacency_ids):
+            edge_ids = adjacency[node_id] = dict(edge_ids or {})
+            if self._owned_adjacency_ids is not None:
+                self._owned_adjacency_ids.add(node_id)
+        return edge_ids
+
+    @staticmethod
+    def _copy_element(element):
+        """Returns a shallow copy of a node or edge with its own attribute name list."""
+        element = copy.copy(element)
+        if isinstance(getattr(element, "attributes", None), list):
+            element.attributes = list(element.attributes)
+        return element
     
     def log_network(self):
         """Logs the current state of the network: nodes, edges, and metadata."""
         Logger.log("===== Network State =====")
         
-        Logger.log("Nodes:")
-        for node in self.nodes:
-            Logger.log(f"{node.__dict__}")
-        
-        Logger.log("Edges:")
-        for edge in self.edges:
-            Logger.log(f"{edge.__dict__}")
+        Logger.log("Nodes: %d", len(self._nodes_by_id))
+        Logger.log("Edges: %d", len(self._edges_by_id))
+        self._log_elements()
         
         Logger.log("Meta Data:")
         for key, value in self.meta_data.items():
@@ -276,3 +497,14 @@ class BaseNetwork:
         
         Logger.log("=========================")
 
+    def _log_elements(self):
+        """Logs the attributes of every node and edge at TRACE level."""
+        if not Logger.is_enabled_for(Logger.LogPriority.TRACE):
+            return
+        Logger.log("Node attributes:", priority=Logger.LogPriority.TRACE)
+        for node in self._nodes_by_id.values():
+            Logger.log("%s", node.__dict__, priority=Logger.LogPriority.TRACE)
+        Logger.log("Edge attributes:", priority=Logger.LogPriority.TRACE)
+        for edge in self._edges_by_id.values():
+            Logger.log("%s", edge.__dict__, priority=Logger.LogPriority.TRACE)
+
@@ -16,9 +16,9 @@ class Network2D(BaseNetwork):
     }
 
     def __init__(self, data):
-        Logger.log(f"start Network2D __init__(self, {data})")
         meta_data = data.get("meta_data", {})
         nodes = data.get("nodes", []) 
         edges = data.get("edges", [])
+        Logger.log("start Network2D __init__(self, %d nodes, %d edges)", len(nodes), len(edges))
         super().__init__(nodes=nodes, edges=edges, meta_data=meta_data, schema=Network2D.schema)
-        Logger.log(f"end Network2D __init__(self, {data})")
\ No newline at end of file
+        Logger.log("end Network2D __init__(self, data)")
\ No newline at end of file
@@ -0,0 +1,448 @@
+from utils.logger.logger import Logger
+from .network_2d import Network2D
+from .base_network import next_topology_version
+from ..nodes.fixable_node_2d import FixableNode2D
+from ..edges.edge_with_rest_length import EdgeWithRestLength
+import numpy as np
+import copy
+
+class NetworkArrays:
+    """
+    Struct-of-arrays representation of a 2D network.
+
+    Nodes and edges are stored as typed NumPy columns instead of one Python object per
+    element. Edge endpoints are stored as row indices into the node columns, and the
+    original element classes are kept as small per-row type codes so the network can
+    be converted back to a Network2D without loss.
+
+    Columns are never resized in place: removing rows replaces them. snapshot() can
+    therefore share every column between two networks, marking them read only, and
+    get_writable_positions copies the positions before the first in place write.
+
+    topology_version changes whenever rows are removed, see BaseNetwork.
+    """
+
+    # COLUMNS THAT CAN BE MAPPED BACK ONTO NODE AND EDGE SCHEMA ATTRIBUTES
+    NODE_ATTRIBUTES = ("n_id", "n_x", "n_y", "is_fixed")
+    EDGE_ATTRIBUTES = ("e_id", "n_from", "n_to", "rest_length")
+
+    # NUMPY COLUMNS OF THE NODE AND EDGE TABLES
+    COLUMNS = ("node_ids", "positions", "is_fixed", "node_type_codes",
+               "edge_ids", "edge_from", "edge_to", "rest_length", "edge_type_codes")
+
+    def __init__(self, node_ids, positions, is_fixed, edge_ids, edge_from, edge_to, rest_length,
+                 meta_data=None, schema=None, node_types=None, node_type_codes=None,
+                 edge_types=None, edge_type_codes=None, network_class=Network2D):
+        """
+        Initializes the network columns.
+
+        Params:
+            node_ids: node id of each node row.
+            positions: (N, 2) array of node x and y coordinates.
+            is_fixed: boolean fixed flag of each node row.
+            edge_ids: edge id of each edge row.
+            edge_from: node row index of the n_from node of each edge.
+            edge_to: node row index of the n_to node of each edge.
+            rest_length: rest length of each edge (NaN if the edge has none).
+            meta_data (dict): Metadata dictionary (default: empty dict).
+            schema (dict): Schema dict of the network (default: network_class.schema).
+            node_types (list): Node classes referenced by node_type_codes (default: [FixableNode2D]).
+            node_type_codes: index into node_types for each node row (default: all 0).
+            edge_types (list): Edge classes referenced by edge_type_codes (default: [EdgeWithRestLength]).
+            edge_type_codes: index into edge_types for each edge row (default: all 0).
+            network_class: Network class used by to_network (default: Network2D).
+        """
+        Logger.log(f"start NetworkArrays __init__(self, {len(node_ids)} nodes, {len(edge_ids)} edges)")
+        self.node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(len(self.node_ids), 2)
+        self.is_fixed = np.asarray(is_fixed, dtype=bool)
+        self.edge_ids = np.asarray(edge_ids, dtype=np.int64)
+        self.edge_from = np.asarray(edge_from, dtype=np.int32)
+        self.edge_to = np.asarray(edge_to, dtype=np.int32)
+        self.rest_length = np.asarray(rest_length, dtype=np.float64)
+
+        self.node_types = list(node_types or [FixableNode2D])
+        self.edge_types = list(edge_types or [EdgeWithRestLength])
+        self.node_type_codes = (np.zeros(len(self.node_ids), dtype=np.uint8) if node_type_codes is None
+                                else np.asarray(node_type_codes, dtype=np.uint8))
+        self.edge_type_codes = (np.zeros(len(self.edge_ids), dtype=np.uint8) if edge_type_codes is None
+                                else np.asarray(edge_type_codes, dtype=np.uint8))
+
+        self.network_class = network_class
+        self.meta_data = meta_data or {}
+        self.schema = schema or network_class.schema
+
+        # ID -> ROW INDEXES, BUILT ON FIRST USE
+        self._node_index = None
+        self._edge_index = None
+        self.mark_topology_changed()
+        Logger.log("end NetworkArrays __init__(self)")
+
+    @property
+    def n_x(self):
+        """Returns the x coordinate column (a view into positions)."""
+        return self.positions[:, 0]
+
+    @property
+    def n_y(self):
+        """Returns the y coordinate column (a view into positions)."""
+        return self.positions[:, 1]
+
+    @property
+    def node_index(self):
+        """Returns the node id -> row dict, built on first use after the node rows change."""
+        if self._node_index is None:
+            self._node_index = {node_id: i for i, node_id in enumerate(self.node_ids.tolist())}
+        return self._node_index
+
+    @property
+    def edge_index(self):
+        """Returns the edge id -> row dict, built on first use after the edge rows change."""
+        if self._edge_index is None:
+            self._edge_index = {edge_id: i for i, edge_id in enumerate(self.edge_ids.tolist())}
+        return self._edge_index
+
+    @property
+    def nbytes(self):
+        """Returns the number of bytes held by the node and edge columns."""
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
+
+    @classmethod
+    def from_network(cls, network):
+        """
+        Builds the array representation of an object based network.
+
+        Params:
+            network (Network2D): Network to convert.
+
+        Returns:
+            NetworkArrays: The converted network.
+
+        Raises:
+            ValueError: If an edge references a node that is not in the network, or a node
+                        or edge class has schema attributes without a column, so the
+                        conversion could not be undone without loss.
+        """
+        Logger.log(f"start from_network(cls, {network})")
+        nodes = network.get_nodes()
+        edges = network.get_edges()
+
+        # NODE COLUMNS
+        node_types = []
+        node_type_lookup = {}
+        node_type_codes = np.empty(len(nodes), dtype=np.uint8)
+        node_ids = np.empty(len(nodes), dtype=np.int64)
+        positions = np.empty((len(nodes), 2), dtype=np.float64)
+        is_fixed = np.zeros(len(nodes), dtype=bool)
+        for i, node in enumerate(nodes):
+            node_class = type(node)
+            if node_class not in node_type_lookup:
+                cls._get_schema_attributes(node_class, cls.NODE_ATTRIBUTES)
+                node_type_lookup[node_class] = len(node_types)
+                node_types.append(node_class)
+            node_type_codes[i] = node_type_lookup[node_class]
+            node_ids[i] = node.get_id()
+            positions[i, 0] = node.n_x
+            positions[i, 1] = node.n_y
+            is_fixed[i] = bool(getattr(node, "is_fixed", False))
+
+        # EDGE COLUMNS
+        node_index = {node_id: i for i, node_id in enumerate(node_ids.tolist())}
+        edge_types = []
+        edge_type_lookup = {}
+        edge_type_codes = np.empty(len(edges), dtype=np.uint8)
+        edge_ids = np.empty(len(edges), dtype=np.int64)
+        edge_from = np.empty(len(edges), dtype=np.int32)
+        edge_to = np.empty(len(edges), dtype=np.int32)
+        rest_length = np.empty(len(edges), dtype=np.float64)
+        for i, edge in enumerate(edges):
+            edge_class = type(edge)
+            if edge_class not in edge_type_lookup:
+                cls._get_schema_attributes(edge_class, cls.EDGE_ATTRIBUTES)
+                edge_type_lookup[edge_class] = len(edge_types)
+                edge_types.append(edge_class)
+            edge_type_codes[i] = edge_type_lookup[edge_class]
+            edge_ids[i] = edge.get_id()
+            if edge.n_from not in node_index or edge.n_to not in node_index:
+                raise ValueError(f"Edge '{edge.get_id()}' references a node that is not in the network.")
+            edge_from[i] = node_index[edge.n_from]
+            edge_to[i] = node_index[edge.n_to]
+            rest_length[i] = getattr(edge, "rest_length", np.nan)
+
+        network_arrays = cls(
+            node_ids, positions, is_fixed, edge_ids, edge_from, edge_to, rest_length,
+            meta_data=dict(network.get_meta_data()), schema=network.schema,
+            node_types=node_types, node_type_codes=node_type_codes,
+            edge_types=edge_types, edge_type_codes=edge_type_codes,
+            network_class=type(network),
+        )
+        Logger.log("end from_network(cls, network)")
+        return network_arrays
+
+    def to_network(self):
+        """
+        Builds the object based network represented by these columns.
+
+        Returns:
+            Network2D: A network of node and edge objects of the original classes.
+        """
+        Logger.log("start to_network(self)")
+        node_columns = self.get_node_columns(all_attributes=True)
+        edge_columns = self.get_edge_columns(all_attributes=True)
+
+        nodes = []
+        node_type_codes = self.node_type_codes.tolist()
+        node_attributes = [self._get_schema_attributes(node_class, self.NODE_ATTRIBUTES) for node_class in self.node_types]
+        for i, code in enumerate(node_type_codes):
+            nodes.append(self.node_types[code]({key: node_columns[key][i] for key in node_attributes[code]}))
+
+        edges = []
+        edge_type_codes = self.edge_type_codes.tolist()
+        edge_attributes = [self._get_schema_attributes(edge_class, self.EDGE_ATTRIBUTES) for edge_class in self.edge_types]
+        for i, code in enumerate(edge_type_codes):
+            edges.append(self.edge_types[code]({key: edge_columns[key][i] for key in edge_attributes[code]}))
+
+        network = self.network_class({"nodes": nodes, "edges": edges, "meta_data": dict(self.meta_data)})
+        Logger.log("end to_network(self)")
+        return network
+
+    def get_node_columns(self, all_attributes=False):
+        """
+        Returns the node table as a dict of attribute name -> list of values.
+
+        Params:
+            all_attributes (bool): Include columns that no node class in the network uses.
+        """
+        columns = {
+            "n_id": self.node_ids.tolist(),
+            "n_x": self.positions[:, 0].tolist(),
+            "n_y": self.positions[:, 1].tolist(),
+            "is_fixed": self.is_fixed.tolist(),
+        }
+        if not all_attributes:
+            used = set()
+            for node_class in self.node_types:
+                used.update(node_class.get_schema())
+            columns = {key: value for key, value in columns.items() if key in used}
+        return columns
+
+    def get_edge_columns(self, all_attributes=False):
+        """
+        Returns the edge table as a dict of attribute name -> list of values.
+        Endpoints are returned as node ids, not row indices.
+
+        Params:
+            all_attributes (bool): Include columns that no edge class in the network uses.
+        """
+        columns = {
+            "e_id": self.edge_ids.tolist(),
+            "n_from": self.node_ids[self.edge_from].tolist(),
+            "n_to": self.node_ids[self.edge_to].tolist(),
+            "rest_length": self.rest_length.tolist(),
+        }
+        if not all_attributes:
+            used = set()
+            for edge_class in self.edge_types:
+                used.update(edge_class.get_schema())
+            columns = {key: value for key, value in columns.items() if key in used}
+        return columns
+
+    def snapshot(self):
+        """
+        Returns a copy-on-write copy of the network.
+
+        Both networks keep referencing the same columns, which are marked read only, and
+        the id indexes. Only the metadata dict is copied.
+
+        Returns:
+            NetworkArrays: A network with the same nodes, edges and metadata.
+        """
+        for name in self.COLUMNS:
+            getattr(self, name).flags.writeable = False
+        clone = copy.copy(self)
+        clone.meta_data = dict(self.meta_data)
+        return clone
+
+    def get_writable_positions(self):
+        """Returns the positions column, copying it first if it is shared or read only."""
+        if not self.positions.flags.writeable:
+            self.positions = self.positions.copy()
+        return self.positions
+
+    @property
+    def topology_version(self):
+        """Returns the version of the node and edge columns other than positions, see mark_topology_changed."""
+        return self._topology_version
+
+    def mark_topology_changed(self):
+        """Gives the network a new topology version, invalidating solver data cached for the old one."""
+        self._topology_version = next_topology_version()
+
+    def get_meta_data(self):
+        """Returns the metadata dictionary of the network."""
+        return self.meta_data
+
+    def get_node_count(self):
+        """Returns the number of nodes in the network."""
+        return len(self.node_ids)
+
+    def get_edge_count(self):
+        """Returns the number of edges in the network."""
+        return len(self.edge_ids)
+
+    def get_node_row(self, node_id):
+        """
+        Returns the row index of a node, or None if the node is not in the network.
+
+        Params:
+            node_id: The ID of the node to find.
+        """
+        return self._get_row(node_id, self.node_ids, self._node_index, "node_index")
+
+    def get_edge_row(self, edge_id):
+        """
+        Returns the row index of an edge, or None if the edge is not in the network.
+
+        Params:
+            edge_id: The ID of the edge to find.
+        """
+        return self._get_row(edge_id, self.edge_ids, self._edge_index, "edge_index")
+
+    def remove_edge(self, edge_id):
+        """
+        Removes an edge by ID.
+
+        Params:
+            edge_id: The ID of the edge to remove.
+        """
+        self.remove_edges([edge_id])
+
+    def remove_edges(self, edge_ids):
+        """
+        Removes every listed edge in one compaction of the edge columns.
+        IDs that are not in the network are ignored.
+
+        Params:
+            edge_ids: The IDs of the edges to remove.
+        """
+        rows = self._get_rows(edge_ids, self.edge_ids, self._edge_index, "edge_index")
+        if not len(rows):
+            return
+        keep = np.ones(len(self.edge_ids), dtype=bool)
+        keep[rows] = False
+        self._keep_edge_rows(keep)
+
+    def remove_node(self, node_id):
+        """
+        Removes a node by ID.
+
+        Edges store their endpoints as node rows, so every edge connected to the node
+        is removed as well.
+
+        Params:
+            node_id: The ID of the node to remove.
+        """
+        self.remove_nodes([node_id])
+
+    def remove_nodes(self, node_ids):
+        """
+        Removes every listed node and the edges connected to them.
+        IDs that are not in the network are ignored.
+
+        Params:
+            node_ids: The IDs of the nodes to remove.
+        """
+        rows = self._get_rows(node_ids, self.node_ids, self._node_index, "node_index")
+        if not len(rows):
+            return
+        keep = np.ones(len(self.node_ids), dtype=bool)
+        keep[rows] = False
+        self._keep_node_rows(keep)
+
+    def remove_orphan_nodes(self):
+        """
+        Removes every node that is not connected to any edge.
+        """
+        degree = self.get_node_degrees()
+        if degree.all():
+            return
+        self._keep_node_rows(degree > 0)
+
+    def get_node_degrees(self):
+        """Returns the number of edges connected to each node row."""
+        node_count = len(self.node_ids)
+        return (np.bincount(self.edge_from, minlength=node_count)
+                + np.bincount(self.edge_to, minlength=node_count))
+
+    def log_network(self):
+        """Logs a summary of the network columns and metadata."""
+        Logger.log("===== Network Arrays State =====")
+        Logger.log(f"Nodes: {self.get_node_count()}")
+        Logger.log(f"Edges: {self.get_edge_count()}")
+        Logger.log(f"Column bytes: {self.nbytes}")
+        Logger.log("Meta Data:")
+        for key, value in self.meta_data.items():
+            Logger.log(f"{key}: {value}")
+        Logger.log("================================")
+
+    def _keep_edge_rows(self, keep):
+        """Compacts the edge columns down to the rows where keep is True."""
+        self.edge_ids = self.edge_ids[keep]
+        self.edge_from = self.edge_from[keep]
+        self.edge_to = self.edge_to[keep]
+        self.rest_length = self.rest_length[keep]
+        self.edge_type_codes = self.edge_type_codes[keep]
+        self._edge_index = None
+        self.mark_topology_changed()
+
+    def _keep_node_rows(self, keep):
+        """Compacts the node columns down to the rows where keep is True and remaps edge endpoints."""
+        # DROP EDGES THAT TOUCH A REMOVED NODE
+        edge_keep = keep[self.edge_from] & keep[self.edge_to]
+        if not edge_keep.all():
+            self._keep_edge_rows(edge_keep)
+
+        # MAP OLD NODE ROWS TO NEW NODE ROWS
+        new_rows = np.cumsum(keep, dtype=np.int64) - 1
+        self.edge_from = new_rows[self.edge_from].astype(np.int32)
+        self.edge_to = new_rows[self.edge_to].astype(np.int32)
+
+        self.node_ids = self.node_ids[keep]
+        self.positions = self.positions[keep]
+        self.is_fixed = self.is_fixed[keep]
+        self.node_type_codes = self.node_type_codes[keep]
+        self._node_index = None
+        self.mark_topology_changed()
+
+    def _get_row(self, element_id, ids, index, index_name):
+        """
+        Returns the row of an id. Until the id index is needed again, an integer id is
+        found with one vectorized scan, which is cheaper than rebuilding the index after
+        every removal.
+        """
+        if index is None and isinstance(element_id, (int, np.integer)):
+            rows = np.flatnonzero(ids == element_id)
+            return int(rows[0]) if len(rows) else None
+        return getattr(self, index_name).get(element_id)
+
+    def _get_rows(self, element_ids, ids, index, index_name):
+        """Returns the rows of the ids that are in the network, see _get_row."""
+        element_ids = list(element_ids)
+        if index is None and all(isinstance(element_id, (int, np.integer)) for element_id in element_ids):
+            return np.flatnonzero(np.isin(ids, np.array(element_ids, dtype=np.int64)))
+        index = getattr(self, index_name)
+        return [index[element_id] for element_id in element_ids if element_id in index]
+
+    @staticmethod
+    def _get_schema_attributes(element_class, supported_attributes):
+        """
+        Returns the schema attributes of an element class that the columns can provide.
+
+        Raises:
+            ValueError: If the class needs an attribute that has no column.
+        """
+        attributes = list(element_class.get_schema())
+        unsupported = [attr for attr in attributes if attr not in supported_attributes]
+        if unsupported:
+            raise ValueError(f"{element_class.__name__} attributes {unsupported} cannot be stored in NetworkArrays.")
+        return attributes
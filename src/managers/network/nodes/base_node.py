@@ -34,6 +34,29 @@ class BaseNode:
 
         Logger.log(f"end Node __init__(self)")
 
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Creates one node per row of attribute columns.
+
+        The columns are trusted to match the schema and to be cast to its types, as
+        NetworkFactory does once per table, so no node is validated on its own.
+
+        Params:
+            columns (dict): Attribute name -> list of values, all of the same length.
+
+        Returns:
+            list: The nodes, in row order.
+        """
+        keys = list(columns)
+        nodes = []
+        for values in zip(*columns.values()):
+            node = cls.__new__(cls)
+            node.attributes = list(keys)
+            node.__dict__.update(zip(keys, values))
+            nodes.append(node)
+        return nodes
+
     def get_id(self):
         """
         Returns the ID of the node.
@@ -0,0 +1,119 @@
+from utils.logger.logger import Logger
+from .networks.network_arrays import NetworkArrays
+from .network_connectivity import NetworkConnectivity
+import numpy as np
+
+class PercolationDetector:
+    """
+    Finds the step at which a degrading network stops spanning between its fixed
+    boundaries, the point where it fails mechanically.
+
+    The boundary groups are the fixed nodes (FixableNode2D is_fixed) on either side of
+    the network, see NetworkConnectivity.get_boundary_groups. After every degradation
+    step observe updates a NetworkConnectivity tracker with the removed elements only,
+    so no step runs a search over the whole network. rupture_step is the first step
+    without a load path and remaining_fraction the fraction of the initial fibers left
+    at that step.
+
+    For a removal sequence recorded beforehand, detect answers the same question with
+    one reverse union-find pass.
+    """
+
+    def __init__(self, network, boundary_groups=None):
+        """
+        Initializes the detector on the network before the first degradation.
+
+        Params:
+            network: Network2D or NetworkArrays.
+            boundary_groups (list): two lists of node ids, the fixed nodes of each side if None.
+        """
+        Logger.log(f"start PercolationDetector __init__(self, {network})")
+        self.connectivity = NetworkConnectivity(network, boundary_groups)
+        self.initial_edge_count = self.connectivity.get_edge_count()
+        self.spanning = self.connectivity.is_load_path_intact()
+        self.step = 0
+        self.rupture_step = None
+        self.remaining_fraction = None
+        if not self.spanning:
+            Logger.log("The network does not span between its boundaries, no rupture can be detected.")
+        Logger.log("end PercolationDetector __init__(self)")
+
+    def copy(self):
+        """Returns an independent detector in the same state, sharing the network topology."""
+        detector = PercolationDetector.__new__(PercolationDetector)
+        detector.__dict__.update(self.__dict__)
+        detector.connectivity = self.connectivity.copy()
+        return detector
+
+    @property
+    def ruptured(self):
+        """Returns True once the load path between the boundaries is broken."""
+        return self.rupture_step is not None
+
+    def observe(self, network, removed_edge_ids=(), removed_node_ids=()):
+        """
+        Records one degradation step.
+
+        The given ids are removed from the tracker. If the network then still has fewer
+        edges than the tracker, e.g. after a rupture cascade, the missing edges are found
+        by comparing ids.
+
+        Params:
+            network: the network after the step.
+            removed_edge_ids: ids of the edges degraded at this step, if known.
+            removed_node_ids: ids of the nodes degraded at this step, if known.
+
+        Returns:
+            bool: True if the load path is broken after this step.
+        """
+        self.step += 1
+        if not self.spanning or self.ruptured:
+            return self.ruptured
+
+        connectivity = self.connectivity
+        for node_id in removed_node_ids:
+            connectivity.remove_node(node_id)
+        for edge_id in removed_edge_ids:
+            connectivity.remove_edge(edge_id)
+
+        # RECONCILE EDGES THE ENGINE REMOVED ON ITS OWN
+        edge_count = network.get_edge_count() if isinstance(network, NetworkArrays) else len(network.get_edges())
+        if edge_count < connectivity.get_edge_count():
+            if isinstance(network, NetworkArrays):
+                network_edge_ids = network.edge_ids
+            else:
+                network_edge_ids = np.array([edge.get_id() for edge in network.get_edges()])
+            tracked_edge_ids = np.array(connectivity.get_edge_ids())
+            for edge_id in tracked_edge_ids[~np.isin(tracked_edge_ids, network_edge_ids)].tolist():
+                connectivity.remove_edge(edge_id)
+
+        if not connectivity.is_load_path_intact():
+            self.rupture_step = self.step
+            self.remaining_fraction = connectivity.get_edge_count() / self.initial_edge_count
+            Logger.log(f"Load path broken at step {self.rupture_step}, {self.remaining_fraction:.3f} of the fibers remaining")
+        return self.ruptured
+
+    @staticmethod
+    def detect(network, removed_ids, element_type="edge", boundary_groups=None):
+        """
+        Returns the rupture step of a recorded removal sequence.
+
+        Only the listed elements (and the edges of removed nodes) are taken as removed, so
+        this matches observe for engines that remove nothing else.
+
+        Params:
+            network: the network before the first removal.
+            removed_ids (list): id of the edge or node removed at every step.
+            element_type (str): "edge" or "node".
+            boundary_groups (list): see __init__.
+
+        Returns:
+            tuple: (rupture_step, remaining_fraction), (None, None) if the load path never broke.
+        """
+        states = NetworkConnectivity.replay(network, removed_ids, element_type, boundary_groups)
+        intact = states["load_path_intact"]
+        if not intact[0] or intact.all():
+            return None, None
+        rupture_step = int(np.argmin(intact))
+        edge_counts = states["edge_count"]
+        return rupture_step, float(edge_counts[rupture_step] / edge_counts[0])
@@ -0,0 +1,107 @@
+import numpy as np
+
+class PropensitySumTree:
+    """
+    Binary sum tree over non-negative propensities.
+
+    Leaf i holds the propensity of element i and every inner node the sum of its two
+    children, so the total is read from the root. Changing a propensity and drawing an
+    element with probability proportional to its propensity both take O(log n). Parents
+    are recomputed from their children instead of adding differences, so repeated
+    updates do not accumulate rounding errors.
+    """
+
+    def __init__(self, propensities):
+        """
+        Builds the tree in O(n).
+
+        Params:
+            propensities: non-negative propensity of every element.
+        """
+        propensities = np.asarray(propensities, dtype=np.float64)
+        self.size = len(propensities)
+        self.capacity = 1 << max(self.size - 1, 0).bit_length()
+        self.tree = np.zeros(2 * self.capacity, dtype=np.float64)
+        self.tree[self.capacity:self.capacity + self.size] = propensities
+
+        # FILL THE INNER NODES ONE LEVEL AT A TIME
+        level = self.capacity
+        while level > 1:
+            self.tree[level // 2:level] = self.tree[level:2 * level:2] + self.tree[level + 1:2 * level:2]
+            level //= 2
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def total(self):
+        """Returns the sum of all propensities."""
+        return float(self.tree[1]) if self.size else 0.0
+
+    @property
+    def propensities(self):
+        """Returns a read only view of the leaf propensities."""
+        leaves = self.tree[self.capacity:self.capacity + self.size]
+        leaves.flags.writeable = False
+        return leaves
+
+    def get(self, index):
+        """Returns the propensity of an element."""
+        return float(self.tree[self.capacity + index])
+
+    def update(self, index, propensity):
+        """
+        Sets the propensity of one element in O(log n).
+
+        Params:
+            index (int): element index.
+            propensity (float): new non-negative propensity.
+        """
+        position = self.capacity + index
+        tree = self.tree
+        tree[position] = propensity
+        position //= 2
+        while position:
+            tree[position] = tree[2 * position] + tree[2 * position + 1]
+            position //= 2
+
+    def update_many(self, indices, propensities):
+        """
+        Sets the propensities of several elements, recomputing each affected inner node once.
+
+        Params:
+            indices: element indices.
+            propensities: new non-negative propensities, one per index.
+        """
+        positions = np.asarray(indices, dtype=np.intp) + self.capacity
+        if not len(positions):
+            return
+        self.tree[positions] = propensities
+        positions = np.unique(positions // 2)
+        while positions[0] >= 1:
+            self.tree[positions] = self.tree[2 * positions] + self.tree[2 * positions + 1]
+            if positions[0] == 1:
+                break
+            positions = np.unique(positions // 2)
+
+    def find(self, target):
+        """
+        Returns the element whose cumulative propensity interval contains target.
+
+        Drawing target uniformly from [0, total) selects every element with probability
+        proportional to its propensity. Elements with a propensity of 0 are never returned.
+
+        Params:
+            target (float): value in [0, total).
+        """
+        tree = self.tree
+        position = 1
+        while position < self.capacity:
+            left = tree[2 * position]
+            # ROUNDING CAN LEAVE target JUST ABOVE THE LAST POSITIVE LEAF, NEVER STEP INTO AN EMPTY SUBTREE
+            if target < left or tree[2 * position + 1] <= 0:
+                position = 2 * position
+            else:
+                target -= left
+                position = 2 * position + 1
+        return position - self.capacity
@@ -20,13 +20,14 @@ class ViewManager:
         Logger.log(f"end ViewManager __init__(self, controller)")
 
     # HANDLES INCOMING VIEW REQUESTS
-    def initiate_view_strategy(self, view, controller):
+    def initiate_view_strategy(self, view, controller, **view_options):
         """
         Processes a view request by selecting and managing the appropriate view strategy.
 
         Args:
-            view (str): The type of view requested (e.g., "CLI" or "Tkinter").
+            view (str): The type of view requested (e.g., "CLI", "Tkinter" or "Batch").
             controller: The controller instance that interacts with the selected view.
+            view_options: Keyword arguments passed to the selected view.
 
         Raises:
             ValueError: If the view request is invalid.
@@ -35,7 +36,7 @@ class ViewManager:
         
         try: 
             # SELECTS A NEW VIEW STRATEGY
-            new_view_strategy = self.view_request_interpreter.get_view_strategy(view, controller)
+            new_view_strategy = self.view_request_interpreter.get_view_strategy(view, controller, **view_options)
             Logger.log(f"Selected view strategy: {new_view_strategy}")
         except ValueError:
             raise
@@ -1,5 +1,4 @@
 from src.views.cli_view.cli_view import CommandLineView
-from src.views.tkinter_view.tkinter_view import TkinterView
 from utils.logger.logger import Logger
 
 # INTERPRETS VIEW REQUESTS AND RETURNS APPROPRIATE VIEW STRATEGY
@@ -17,15 +16,17 @@ class ViewRequestInterpreter:
         Logger.log(f"end ViewRequestInterpreter __init__(self)")
 
    # RETURNS THE APPROPRIATE VIEW STRATEGY BASED ON REQUEST
-    def get_view_strategy(self, view_request, controller):
+    def get_view_strategy(self, view_request, controller, **view_options):
         """
         Determines and returns the appropriate view strategy based on the provided request.
+        Views are imported on request so that headless runs never import tkinter.
 
         Args:
-            view_request (str): The type of view requested ("CLI" or "Tkinter").
+            view_request (str): The type of view requested ("CLI", "Tkinter" or "Batch").
+            view_options: Keyword arguments passed to the batch view.
 
         Returns:
-            CommandLineView or TkinterView: An instance of the selected view class.
+            CommandLineView, TkinterView or BatchView: An instance of the selected view class.
 
         Raises:
             ValueError: If the provided view request is invalid.
@@ -39,10 +40,17 @@ class ViewRequestInterpreter:
             return CommandLineView(controller)
         
         elif view_request.lower() == "tkinter":
+            from src.views.tkinter_view.tkinter_view import TkinterView
             Logger.log("Tkinter view strategy selected.")
             Logger.log(f"end get_view_strategy(self, view_request, controller)")
             return TkinterView(controller)
+
+        elif view_request.lower() == "batch":
+            from src.views.batch_view.batch_view import BatchView
+            Logger.log("Batch view strategy selected.")
+            Logger.log(f"end get_view_strategy(self, view_request, controller)")
+            return BatchView(controller, **view_options)
         
         else:
-            Logger.log("ValueError: Invalid view request. Choose 'CLI' or 'Tkinter'.", Logger.LogPriority.ERROR)
-            raise ValueError("Invalid view request. Choose 'CLI' or 'Tkinter'.")
\ No newline at end of file
+            Logger.log("ValueError: Invalid view request. Choose 'CLI', 'Tkinter' or 'Batch'.", priority=Logger.LogPriority.ERROR)
+            raise ValueError("Invalid view request. Choose 'CLI', 'Tkinter' or 'Batch'.")
\ No newline at end of file
@@ -0,0 +1,256 @@
+from src.managers.view.view_strategy import ViewStrategy
+from src.managers.input.input_data_interpreter import InputDataInterpreter
+from src.managers.network.networks.network_arrays import NetworkArrays
+from utils.logger.logger import Logger
+import csv
+import os
+import random
+import time
+
+class BatchView(ViewStrategy):
+    """
+    A non-interactive view that runs a degradation script on one network or on every
+    network in a folder, exports the results and reports how long every step took.
+
+    Script commands use the CLI command names:
+        degrade_edge <id>, degrade_node <id>, undo_degradation, redo_degradation, relax_network,
+        random_edges <count> [seed], random_nodes <count> [seed]
+    and, to remove several elements as one step with a single relaxation,
+        degrade_edges <id>,<id>,..., degrade_nodes <id>,<id>,...
+    """
+
+    REPORT_COLUMNS = ("network", "step", "command", "element_id", "seconds", "node_count", "edge_count", "status")
+
+    def __init__(self, controller, input_path, script=None, engine=None, exports=None, export_folder=None,
+                 report_path=None):
+        """
+        Initializes the batch view.
+
+        Args:
+            controller: The SystemController that runs every request.
+            input_path (str): A network file or a folder of network files.
+            script (list): Script commands applied to every network, in order.
+            engine (str): Degradation engine strategy name, the controller default if None.
+            exports (list): (data_export_strategy, image_export_strategy) pairs, "none" to skip one.
+            export_folder (str): Folder that receives one export folder per network.
+            report_path (str): CSV file the step timings are written to.
+
+        Raises:
+            ValueError: If exports are requested without an export_folder.
+        """
+        Logger.log(f"start BatchView __init__(self, controller, {input_path})")
+        super().__init__(controller)
+        self.input_path = input_path
+        self.script = list(script or [])
+        self.engine = engine
+        self.exports = list(exports or [])
+        self.export_folder = export_folder
+        self.report_path = report_path
+        self.running = True
+        self.results = []           # ONE ROW PER STEP, SEE REPORT_COLUMNS
+        self.failed_networks = []
+        if self.exports and not self.export_folder:
+            raise ValueError("export_folder must be provided when exports are requested.")
+        Logger.log(f"end BatchView __init__(self, controller, input_path)")
+
+    # START THE BATCH RUN
+    def start_view(self):
+        """
+        Runs the script on every input network and writes the timing report.
+        """
+        Logger.log("start start_view()")
+        input_files = self.get_input_files(self.input_path)
+        print(f">>> Batch run started: {len(input_files)} network(s)")
+
+        batch_start = time.perf_counter()
+        for input_file in input_files:
+            if not self.running:
+                break
+            self.run_network(input_file)
+
+        if self.report_path:
+            self.write_report(self.report_path)
+            print(f">>> Timing report written to: {self.report_path}")
+        print(f">>> Batch run finished in {time.perf_counter() - batch_start:.3f}s, "
+              f"{len(input_files) - len(self.failed_networks)} succeeded, {len(self.failed_networks)} failed")
+        Logger.log("end start_view()")
+
+    # STOP THE BATCH RUN
+    def stop_view(self):
+        """
+        Stops the batch run after the current network.
+        """
+        Logger.log("start stop_view()")
+        self.running = False
+        Logger.log("end stop_view()")
+
+    # RUN THE SCRIPT ON ONE NETWORK
+    def run_network(self, input_file):
+        """
+        Loads a network, applies the script and the exports, and records the step timings.
+        A failing step stops the current network only.
+
+        Args:
+            input_file (str): The network file to process.
+        """
+        Logger.log(f"start run_network(self, {input_file})")
+        network_name = os.path.splitext(os.path.basename(input_file))[0]
+        print(f">>> Network: {input_file}")
+        try:
+            self._run_step(network_name, "input_network", input_file, self.controller.input_network, input_file)
+            if self.engine:
+                self._run_step(network_name, "set_degradation_engine_strategy", self.engine,
+                               self.controller.set_degradation_engine_strategy, self.engine)
+
+            for command in self.script:
+                self._run_command(network_name, command)
+
+            for data_export_strategy, image_export_strategy in self.exports:
+                folder_location = os.path.join(self.export_folder, network_name)
+                os.makedirs(folder_location, exist_ok=True)
+                export_request = f"export_request {data_export_strategy} {image_export_strategy} {folder_location}"
+                self._run_step(network_name, "export_data", f"{data_export_strategy} {image_export_strategy}",
+                               self.controller.export_data, export_request)
+        except Exception as ex:
+            Logger.log(f"Batch run failed for {input_file}: {ex}", priority=Logger.LogPriority.ERROR)
+            print(f">>> Failed: {input_file}: {ex}")
+            self.failed_networks.append(input_file)
+        Logger.log(f"end run_network(self, input_file)")
+
+    # WRITE STEP TIMINGS
+    def write_report(self, report_path):
+        """
+        Writes the recorded step timings to a CSV file.
+
+        Args:
+            report_path (str): The CSV file to write.
+        """
+        Logger.log(f"start write_report(self, {report_path})")
+        report_folder = os.path.dirname(os.path.abspath(report_path))
+        os.makedirs(report_folder, exist_ok=True)
+        with open(report_path, "w", newline="") as report_file:
+            writer = csv.DictWriter(report_file, fieldnames=self.REPORT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.results)
+        Logger.log(f"end write_report(self, report_path)")
+
+    # LIST INPUT NETWORK FILES
+    @staticmethod
+    def get_input_files(input_path):
+        """
+        Returns the network files to process.
+
+        Args:
+            input_path (str): A network file or a folder of network files.
+
+        Returns:
+            list: The input file, or every supported file in the folder sorted by name.
+
+        Raises:
+            FileNotFoundError: If input_path does not exist or the folder holds no supported file.
+        """
+        if os.path.isfile(input_path):
+            return [input_path]
+        if not os.path.isdir(input_path):
+            raise FileNotFoundError(f"File ({input_path}) Not Found")
+
+        input_files = [
+            os.path.join(input_path, file_name) for file_name in sorted(os.listdir(input_path))
+            if InputDataInterpreter.is_network_file(file_name)
+        ]
+        if not input_files:
+            raise FileNotFoundError(f"No supported network files found in ({input_path})")
+        return input_files
+
+    def _run_command(self, network_name, command):
+        """Runs one script command, expanding random policies into single degradations."""
+        parts = command.split()
+        if not parts:
+            return
+        name, args = parts[0], parts[1:]
+
+        if name in ("degrade_edge", "degrade_node") and len(args) == 1:
+            element_ids = self._get_element_ids(name)
+            element_id = self._resolve_id(args[0], element_ids)
+            degrade = self.controller.degrade_edge if name == "degrade_edge" else self.controller.degrade_node
+            self._run_step(network_name, name, element_id, degrade, element_id)
+
+        elif name in ("degrade_edges", "degrade_nodes") and len(args) == 1:
+            element_ids = {str(element_id): element_id for element_id in self._get_element_ids(name[:-1])}
+            batch_ids = [element_ids.get(token, token) for token in args[0].split(",") if token]
+            degrade = self.controller.degrade_edges if name == "degrade_edges" else self.controller.degrade_nodes
+            self._run_step(network_name, name, args[0], degrade, batch_ids)
+
+        elif name in ("random_edges", "random_nodes") and len(args) in (1, 2):
+            count = int(args[0])
+            rng = random.Random(args[1] if len(args) == 2 else None)
+            step_name = "degrade_edge" if name == "random_edges" else "degrade_node"
+            degrade = self.controller.degrade_edge if name == "random_edges" else self.controller.degrade_node
+            for _ in range(count):
+                element_ids = self._get_element_ids(step_name)
+                if not element_ids:
+                    break
+                element_id = rng.choice(element_ids)
+                self._run_step(network_name, step_name, element_id, degrade, element_id)
+
+        elif name == "undo_degradation" and not args:
+            self._run_step(network_name, name, "", self.controller.undo_degradation)
+
+        elif name == "redo_degradation" and not args:
+            self._run_step(network_name, name, "", self.controller.redo_degradation)
+
+        elif name == "relax_network" and not args:
+            self._run_step(network_name, name, "", self.controller.network_manager.relax_network)
+            # RELAXING SWITCHES THE ENGINE, SO THE REQUESTED ONE IS SET AGAIN
+            if self.engine:
+                self.controller.set_degradation_engine_strategy(self.engine)
+
+        else:
+            raise ValueError(f"Invalid batch command: '{command}'")
+
+    def _run_step(self, network_name, command, element_id, action, *args):
+        """Runs one controller request, records its duration and re-raises any failure."""
+        step_start = time.perf_counter()
+        status = "ok"
+        try:
+            action(*args)
+        except Exception as ex:
+            status = f"error: {ex}"
+            raise
+        finally:
+            seconds = time.perf_counter() - step_start
+            node_count, edge_count = self._get_counts()
+            self.results.append({
+                "network": network_name, "step": len(self.results), "command": command,
+                "element_id": element_id, "seconds": f"{seconds:.6f}",
+                "node_count": node_count, "edge_count": edge_count, "status": status,
+            })
+            print(f"    {command} {element_id}: {seconds * 1000:.2f} ms ({node_count} nodes, {edge_count} edges)")
+
+    def _get_element_ids(self, command):
+        """Returns the ids of the current network edges or nodes."""
+        network = self.controller.network_manager.get_network()
+        if network is None:
+            return []
+        if isinstance(network, NetworkArrays):
+            ids = network.edge_ids if command == "degrade_edge" else network.node_ids
+            return ids.tolist()
+        elements = network.get_edges() if command == "degrade_edge" else network.get_nodes()
+        return [element.get_id() for element in elements]
+
+    def _get_counts(self):
+        """Returns the node and edge counts of the current network."""
+        network = self.controller.network_manager.get_network()
+        if network is None:
+            return 0, 0
+        if isinstance(network, NetworkArrays):
+            return network.get_node_count(), network.get_edge_count()
+        return len(network.get_nodes()), len(network.get_edges())
+
+    @staticmethod
+    def _resolve_id(token, element_ids):
+        """Matches a script id to the network id with the same text, e.g. "3" to the integer 3."""
+        for element_id in element_ids:
+            if str(element_id) == token:
+                return element_id
+        return token
@@ -187,4 +187,7 @@ class CommandLineView(ViewStrategy):
         print("       - tkinter")
         print("   - set_degradation_engine_strategy <arg>: Set Degradation Engine Strategy")
         print("       - NoPhysics")
+        print("       - TwoDimensionalSpringForceDegradationEngineWithoutBiomechanics")
+        print("       - SparseNewtonSpringDegradationEngine")
+        print("       - StrainRuptureSpringDegradationEngine")
         Logger.log("end show_help()")
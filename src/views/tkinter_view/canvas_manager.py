@@ -1,15 +1,16 @@
 import tkinter as tk
 from utils.logger.logger import Logger  # Importing the logger
 from ...managers.network.networks.network_2d import Network2D
+from ...managers.network.networks.network_arrays import NetworkArrays
 
 class CanvasManager:
     def __init__(self, containing_page):
         """Initialize CanvasManager with a reference to the page containing the canvas and create the canvas."""
         self.containing_page = containing_page
         self.canvas = None
-        self.node_drawings = {}  # Maps node ID to canvas object
+        self.node_drawings = {}  # Maps canvas object to node ID
         self.node_labels = {}
-        self.edge_drawings = {}  # Maps edge ID to canvas object
+        self.edge_drawings = {}  # Maps canvas object to edge ID
         self.current_network = None  # Store the last drawn network
         self.selected_element = None  # Store selected node or edge
         self.CANVAS_BG_COLOR = "grey90"
@@ -48,20 +49,19 @@ class CanvasManager:
         Logger.log(f"--------------")
         network.log_network()
 
-        if not network.nodes:
+        # Rows of (id, x, y, is_fixed) for nodes and (id, from_x, from_y, to_x, to_y) for edges
+        node_rows, edge_rows = self.get_drawing_rows(network)
+        if not node_rows:
             return
 
-        nodes = {node.n_id: node for node in network.nodes}
-        edges = {edge.e_id: edge for edge in network.edges}
-
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         if width == 1 or height == 1:
             return  # Avoid drawing before fully rendered
 
         # Compute bounds, ensuring only first quadrant
-        max_x = max(node.n_x for node in nodes.values())
-        max_y = max(node.n_y for node in nodes.values())
+        max_x = max(row[1] for row in node_rows)
+        max_y = max(row[2] for row in node_rows)
 
         # Add space for labels
         label_padding = 30
@@ -76,21 +76,19 @@ class CanvasManager:
         offset_y = 10 + label_padding  # Adjusted padding for labels
 
         # Draw edges
-        for edge in edges.values():
-            node_from = nodes[edge.n_from]
-            node_to = nodes[edge.n_to]
-            x1, y1 = node_from.n_x * scale + offset_x, height - (node_from.n_y * scale + offset_y)
-            x2, y2 = node_to.n_x * scale + offset_x, height - (node_to.n_y * scale + offset_y)
+        for e_id, from_x, from_y, to_x, to_y in edge_rows:
+            x1, y1 = from_x * scale + offset_x, height - (from_y * scale + offset_y)
+            x2, y2 = to_x * scale + offset_x, height - (to_y * scale + offset_y)
             edge_id = self.canvas.create_line(x1, y1, x2, y2, fill=self.EDGE_COLOR, width=self.EDGE_WIDTH)
-            self.edge_drawings[edge_id] = edge
+            self.edge_drawings[edge_id] = e_id
 
        # Draw nodes with a constant radius
-        for node in nodes.values():
-            x = node.n_x * scale + offset_x
-            y = height - (node.n_y * scale + offset_y)
+        for n_id, node_x, node_y, is_fixed in node_rows:
+            x = node_x * scale + offset_x
+            y = height - (node_y * scale + offset_y)
 
             # Determine radius based on whether node is fixed
-            if getattr(node, "is_fixed", False):  # Use getattr to safely check attribute
+            if is_fixed:
                 radius = self.NODE_RADIUS + 2  # Make fixed nodes slightly bigger
             else:
                 radius = self.NODE_RADIUS
@@ -101,7 +99,7 @@ class CanvasManager:
                 fill=self.NODE_COLOR, outline=self.NODE_COLOR
             )
 
-            self.node_drawings[node_id] = node
+            self.node_drawings[node_id] = n_id
 
 
         #     # Add label at the center of the node
@@ -113,6 +111,28 @@ class CanvasManager:
         # self.draw_axes(width, height, scale, offset_x, offset_y, max_x, max_y)
         Logger.log("end draw_2d_network(self, network)")
 
+    def get_drawing_rows(self, network):
+        """Returns the node and edge rows needed to draw a Network2D or NetworkArrays."""
+        if isinstance(network, NetworkArrays):
+            positions = network.positions
+            node_rows = list(zip(network.node_ids.tolist(), positions[:, 0].tolist(),
+                                 positions[:, 1].tolist(), network.is_fixed.tolist()))
+            from_points = positions[network.edge_from]
+            to_points = positions[network.edge_to]
+            edge_rows = list(zip(network.edge_ids.tolist(), from_points[:, 0].tolist(), from_points[:, 1].tolist(),
+                                 to_points[:, 0].tolist(), to_points[:, 1].tolist()))
+            return node_rows, edge_rows
+
+        # Use getattr to safely check the fixed attribute
+        nodes = {node.n_id: node for node in network.nodes}
+        node_rows = [(node.n_id, node.n_x, node.n_y, getattr(node, "is_fixed", False)) for node in nodes.values()]
+        edge_rows = []
+        for edge in {edge.e_id: edge for edge in network.edges}.values():
+            node_from = nodes[edge.n_from]
+            node_to = nodes[edge.n_to]
+            edge_rows.append((edge.e_id, node_from.n_x, node_from.n_y, node_to.n_x, node_to.n_y))
+        return node_rows, edge_rows
+
     def draw_axes(self, width, height, scale, offset_x, offset_y, max_x, max_y):
         """Draws X and Y axes starting from (0,0) in the bottom-left corner with number scale."""
         Logger.log("Drawing axes...")
@@ -181,11 +201,9 @@ class CanvasManager:
 
     def convert_element_id_to_input_id(self, element_id):
         if element_id in self.node_drawings:
-            node = self.node_drawings[element_id]
-            return node.n_id  # Send N_ID instead
+            return self.node_drawings[element_id]  # Send N_ID instead
         elif element_id in self.edge_drawings:
-            edge = self.edge_drawings[element_id]
-            return edge.e_id  # Send E_ID instead
+            return self.edge_drawings[element_id]  # Send E_ID instead
     
     def get_element_type(self, element_id):
         if element_id in self.node_drawings: return "node"
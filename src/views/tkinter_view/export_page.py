@@ -51,6 +51,7 @@ class ExportPage(TkinterView):
             self.network_type_var,
             "Do not export",
             "EXCEL (.xlsx)",
+            "FIBRINET (.fnet)",
             command=self.validate_submit
         )
         # Set the same font as headings
@@ -134,6 +135,8 @@ class ExportPage(TkinterView):
         data_export_strategy = None
         if network_type == "EXCEL (.xlsx)":
             data_export_strategy = "excel_data_export_strategy"
+        elif network_type == "FIBRINET (.fnet)":
+            data_export_strategy = "fnet_data_export_strategy"
 
         image_export_strategy = None
         if photo_format == "PNG (.png)":
@@ -129,14 +129,15 @@ class InputPage(TkinterView):
     # ON UPLOAD FILE ICON BUTTON CLICK
     def on_upload_file_icon_button_click(self):
         """
-        Opens the file explorer for the user to select a network data file (.xlsx).
+        Opens the file explorer for the user to select a network data file (.xlsx, .csv or .fnet).
         If a file is selected, stores the file path and transitions to the confirmation page.
         If no file is selected, logs a message indicating that no file was chosen.
         """
         Logger.log(f"start on_upload_file_icon_button_click") 
         file_path = filedialog.askopenfilename(
             title="Select a Network Data File",
-            filetypes=[("Excel Files", "*.xlsx")]
+            filetypes=[("Network Files", "*.xlsx *.csv *.fnet"), ("Excel Files", "*.xlsx"), ("CSV Files", "*.csv"),
+                       ("FibriNet Files", "*.fnet")]
         )
         if file_path: 
             Logger.log(f"File selected: {file_path}")
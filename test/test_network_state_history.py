@@ -0,0 +1,44 @@
+import unittest
+from src.managers.input.input_manager import InputManager
+from src.managers.network.network_state_history import NetworkStateHistory
+from src.managers.network.networks.network_arrays import NetworkArrays
+
+TEST_NETWORK = "test/input_data/INPUT TESTS/TestNetwork.xlsx"
+
+class TestNetworkStateHistory(unittest.TestCase):
+    """
+    Regression checks for states rebuilt from checkpoints and deltas.
+    """
+
+    def setUp(self):
+        self.network = InputManager(use_parse_cache=False).get_network(TEST_NETWORK)
+
+    def test_attribute_edits_are_kept(self):
+        history = NetworkStateHistory(checkpoint_interval=20)
+        history.append(self.network)
+        edited = self.network.snapshot()
+        edge_id = edited.get_edges()[0].get_id()
+        node_id = next(node.get_id() for node in edited.get_nodes() if not node.is_fixed)
+        edited.get_writable_edge(edge_id).rest_length = 5.0
+        edited.get_writable_node(node_id).is_fixed = True
+        history.append(edited)
+
+        history[0]
+        rebuilt = history[1]
+        self.assertEqual(rebuilt.get_edge_by_id(edge_id).rest_length, 5.0)
+        self.assertTrue(rebuilt.get_node_by_id(node_id).is_fixed)
+
+    def test_array_attribute_edits_are_kept(self):
+        history = NetworkStateHistory(checkpoint_interval=20)
+        network = NetworkArrays.from_network(self.network)
+        history.append(network)
+        edited = network.snapshot()
+        edited.rest_length = edited.rest_length.copy()
+        edited.rest_length[0] = 5.0
+        history.append(edited)
+
+        history[0]
+        self.assertEqual(history[1].rest_length[0], 5.0)
+
+if __name__ == "__main__":
+    unittest.main()
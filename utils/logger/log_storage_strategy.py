@@ -3,6 +3,9 @@ class LogStorageStrategy:
     Abstract base class for log storage strategies.
     This class defines the interface for storing and flushing logs.
     """
+    # TRUE IF store_log CAN BE CALLED FROM SEVERAL THREADS AT ONCE WITHOUT THE LOGGER LOCK
+    THREAD_SAFE = False
+
     # STORE LOG WITH MESSAGE PRIORITY AND TIMESTAMP
     def store_log(self, message, priority, timestamp):
         """
@@ -29,3 +32,11 @@ class LogStorageStrategy:
         """
         # MUST BE IMPLEMENTED IN A SUBCLASS TO DEFINE FLUSH BEHAVIOR
         raise NotImplementedError()
+
+    # RELEASES RESOURCES HELD BY THE STRATEGY
+    def close(self):
+        """
+        Writes any pending logs and releases resources held by the strategy.
+        Strategies that write every log immediately do not need to override this.
+        """
+        pass
@@ -1,8 +1,8 @@
 import threading
-from datetime import datetime
+import time
 from enum import Enum
 import os
-from .local_file_strategy import LocalFileStrategy 
+from .queued_file_strategy import QueuedFileStrategy
 
 class Logger:
     """
@@ -11,6 +11,7 @@ class Logger:
     """
 
     class LogPriority(Enum):
+        TRACE = 0
         DEBUG = 1
         INFO = 2
         WARNING = 3
@@ -21,12 +22,15 @@ class Logger:
 
     is_logging_enabled = True
     log_storage_strategy = None
+    minimum_priority = LogPriority.DEBUG
+    _minimum_priority_value = LogPriority.DEBUG.value
     _log_lock = threading.Lock()
     _strategy_lock = threading.Lock()
     _initialize_lock = threading.Lock()
     _disable_lock = threading.Lock()
     _enable_lock = threading.Lock()
     _flush_lock = threading.Lock()
+    _timestamp = (None, None)
 
     # INITIALIZE LOGGER
     @classmethod
@@ -34,40 +38,101 @@ class Logger:
         """
         Initializes the Logger with a default storage strategy.
         Should be called before using the logger to ensure a storage strategy is set.
+        The default strategy writes to a file from a background thread.
         """
         with cls._initialize_lock:
             if cls.log_storage_strategy is None:
                 file_location = os.path.join(os.path.dirname(__file__), '..', '..', 'utils', 'logs.txt')
-                cls.set_log_storage_strategy(LocalFileStrategy(file_location))
+                cls.set_log_storage_strategy(QueuedFileStrategy(file_location))
                 cls.log(f"Logger initialized with default file storage at {file_location}.")
 
     # LOG WITH MESSAGE AND PRIORITY
     @classmethod
-    def log(cls, message, priority=LogPriority.DEBUG):
+    def log(cls, message, *args, priority=LogPriority.DEBUG):
         """
         Logs a message with a given priority and stores it using the defined storage strategy.
+        Messages below the minimum priority, or logged while logging is disabled, are
+        discarded before they are formatted. Thread-safe strategies (THREAD_SAFE) are
+        called without taking _log_lock, so a strategy waiting for room never blocks
+        other threads.
         
         Parameters:
-        message (str): The log message to be stored.
-        priority (LogPriority): The priority level of the log (default is DEBUG).
+        message (str | callable): The log message to be stored, a %-style format string if
+                                  args are given, or a callable returning the message.
+        args: Values formatted into message with the % operator, e.g. log("%d nodes", count).
+        priority (LogPriority): The priority level of the log (default is DEBUG), keyword only.
         """
+        if priority.value < cls._minimum_priority_value or not cls.is_logging_enabled:
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        log_storage_strategy = cls.log_storage_strategy
+        if log_storage_strategy is not None and log_storage_strategy.THREAD_SAFE:
+            log_storage_strategy.store_log(message, priority.name, cls._get_timestamp())
+            return
         with cls._log_lock:
             if cls.is_logging_enabled and cls.log_storage_strategy:
-                cls.log_storage_strategy.store_log(
-                    message, priority.name, datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                )
+                cls.log_storage_strategy.store_log(message, priority.name, cls._get_timestamp())
+
+    # CHECK IF A PRIORITY WOULD BE LOGGED
+    @classmethod
+    def is_enabled_for(cls, priority):
+        """
+        Returns True if logging is enabled and priority is at or above the minimum priority.
+        Used to skip loops that only build log messages.
+        
+        Parameters:
+        priority (LogPriority): The priority level to check.
+        """
+        return cls.is_logging_enabled and priority.value >= cls._minimum_priority_value
+
+    # SET MINIMUM PRIORITY
+    @classmethod
+    def set_minimum_priority(cls, priority):
+        """
+        Sets the lowest priority that is logged. TRACE messages are only logged if the
+        minimum priority is set to TRACE.
+        
+        Parameters:
+        priority (LogPriority): The lowest priority level to log.
+        """
+        with cls._log_lock:
+            cls.minimum_priority = priority
+            cls._minimum_priority_value = priority.value
+
+    # FORMATTED TIMESTAMP OF THE CURRENT SECOND
+    @classmethod
+    def _get_timestamp(cls):
+        """
+        Returns the current time formatted to the second, formatting it at most once per second.
+        The second and its text are cached as one tuple, so no lock is needed.
+        """
+        now = time.time()
+        second = int(now)
+        cached_second, timestamp = cls._timestamp
+        if second != cached_second:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            cls._timestamp = (second, timestamp)
+        return timestamp
 
     # SET LOG STORAGE STRATEGY
     @classmethod
     def set_log_storage_strategy(cls, log_storage_strategy):
         """
-        Sets the log storage strategy for the logger.
+        Sets the log storage strategy for the logger. The previous strategy is closed
+        so that any logs it still holds are written.
         
         Parameters:
         log_storage_strategy: The storage strategy to be used for storing logs.
         """
         with cls._strategy_lock:
-            cls.log_storage_strategy = log_storage_strategy
+            with cls._log_lock:
+                previous_strategy = cls.log_storage_strategy
+                cls.log_storage_strategy = log_storage_strategy
+            if previous_strategy is not None and previous_strategy is not log_storage_strategy:
+                previous_strategy.close()
 
     # FLUSH LOGS
     @classmethod
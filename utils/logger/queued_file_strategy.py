@@ -0,0 +1,207 @@
+from .local_file_strategy import LocalFileStrategy
+from collections import deque
+from datetime import datetime
+import atexit
+import threading
+
+class QueuedFileStrategy(LocalFileStrategy):
+    """
+    Handles log storage using a local file written by a background thread.
+
+    store_log only appends the record to an in-memory queue. A writer thread drains the
+    queue in batches through one long-lived buffered file handle, so callers never wait
+    on file I/O. The queue is flushed to disk when the strategy is closed or the
+    interpreter exits.
+
+    deque appends are atomic, so store_log is THREAD_SAFE and Logger calls it without
+    its global lock. Only the writer taking a batch and the drop_oldest overflow path
+    share the queue lock. Flush and stop records are never dropped. With the block
+    policy callers wait on a condition of the queue lock that the writer notifies
+    after every batch it takes.
+    """
+
+    THREAD_SAFE = True
+
+    BLOCK = "block"                 # WAIT FOR THE WRITER WHEN THE QUEUE IS FULL
+    DROP_NEWEST = "drop_newest"     # DISCARD THE INCOMING RECORD WHEN THE QUEUE IS FULL
+    DROP_OLDEST = "drop_oldest"     # DISCARD THE OLDEST QUEUED RECORD WHEN THE QUEUE IS FULL
+    OVERFLOW_POLICIES = (BLOCK, DROP_NEWEST, DROP_OLDEST)
+
+    # CONTROL RECORDS HANDLED BY THE WRITER IN QUEUE ORDER
+    _FLUSH = object()
+    _STOP = object()
+
+    # INITIALIZE LOG STORAGE STRATEGY
+    def __init__(self, file_location, max_queue_size=100000, overflow_policy=BLOCK,
+                 batch_size=1000, flush_interval=0.1):
+        """
+        Initializes the queued file strategy and starts the writer thread.
+
+        Args:
+            file_location (str): The location of the log file.
+            max_queue_size (int): Maximum number of records waiting to be written.
+            overflow_policy (str): "block", "drop_newest" or "drop_oldest".
+            batch_size (int): Number of queued records that wakes the writer early.
+            flush_interval (float): Maximum seconds a record waits before it is written.
+
+        Raises:
+            ValueError: If overflow_policy is unknown or max_queue_size is smaller than 1.
+        """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: '{overflow_policy}'")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1.")
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped_count = 0
+        self._reported_dropped_count = 0
+        self._queue = deque()
+        self._queue_lock = threading.Lock()
+        self._room = threading.Condition(self._queue_lock)
+        self._wake = threading.Event()
+        self._writer = None
+        self._closed = False
+
+        super().__init__(file_location)
+
+        self._log_file = open(self.file_location, 'a', buffering=1 << 16)
+        self._writer = threading.Thread(target=self._write_records, name="QueuedFileStrategyWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    # QUEUE A LOG ENTRY FOR THE WRITER THREAD
+    def store_log(self, message, priority, timestamp):
+        """
+        Queues a log entry to be appended to the log file.
+
+        Args:
+            message (str): The log message.
+            priority (str): The priority level of the log.
+            timestamp (str): The timestamp of the log entry.
+        """
+        if self._closed:
+            super().store_log(message, priority, timestamp)
+            return
+
+        if len(self._queue) >= self.max_queue_size:
+            if self.overflow_policy == self.DROP_NEWEST:
+                with self._queue_lock:
+                    self.dropped_count += 1
+                return
+            if self.overflow_policy == self.DROP_OLDEST:
+                self._drop_oldest_record()
+            else:
+                # BACK-PRESSURE: WAIT UNTIL THE WRITER HAS MADE ROOM
+                with self._room:
+                    while len(self._queue) >= self.max_queue_size and self._writer.is_alive():
+                        self._wake.set()
+                        # THE TIMEOUT ONLY GUARDS AGAINST A WRITER THAT STOPPED WITHOUT NOTIFYING
+                        self._room.wait(self.flush_interval)
+
+        self._queue.append((timestamp, priority, message))
+        if len(self._queue) >= self.batch_size and not self._wake.is_set():
+            self._wake.set()
+
+    # CLEAR ALL LOG ENTRIES FROM THE FILE
+    def flush_logs(self):
+        """
+        Clears all contents from the log file once the records queued before the call are written.
+        """
+        if self._writer is None or self._closed:
+            super().flush_logs()
+            return
+        self._queue.append(self._FLUSH)
+        self._wake.set()
+
+    # WRITE QUEUED ENTRIES AND STOP THE WRITER THREAD
+    def close(self):
+        """
+        Writes every queued log entry, stops the writer thread and closes the log file.
+        Entries stored after closing are appended to the file directly.
+        """
+        if self._closed or self._writer is None:
+            return
+        self._queue.append(self._STOP)
+        self._wake.set()
+        self._writer.join()
+        self._closed = True
+        atexit.unregister(self.close)
+
+        # RECORDS QUEUED BY OTHER THREADS WHILE THE WRITER WAS STOPPING
+        while self._queue:
+            record = self._queue.popleft()
+            if isinstance(record, tuple):
+                timestamp, priority, message = record
+                super().store_log(message, priority, timestamp)
+
+    # MAKE ROOM BY DROPPING THE OLDEST LOG ENTRY
+    def _drop_oldest_record(self):
+        """
+        Drops the oldest queued log entry. Flush and stop records in front of it are put back in order.
+        """
+        with self._queue_lock:
+            # THE WRITER ONLY TAKES RECORDS UNDER THE SAME LOCK, SO THE LEFT END IS OURS
+            control_records = []
+            while self._queue:
+                record = self._queue.popleft()
+                if record is self._FLUSH or record is self._STOP:
+                    control_records.append(record)
+                    continue
+                self.dropped_count += 1
+                break
+            self._queue.extendleft(reversed(control_records))
+
+    # WRITER THREAD LOOP
+    def _write_records(self):
+        """
+        Drains the queue in batches until a stop record is read.
+        """
+        while True:
+            if not self._queue:
+                self._wake.wait(self.flush_interval)
+            self._wake.clear()
+
+            with self._room:
+                records = [self._queue.popleft() for _ in range(min(len(self._queue), self.batch_size))]
+                if records:
+                    self._room.notify_all()
+
+            lines = []
+            stop = False
+            for position, record in enumerate(records):
+                if record is self._FLUSH:
+                    self._write_lines(lines)
+                    lines = []
+                    self._log_file.seek(0)
+                    self._log_file.truncate(0)
+                    self._log_file.write(f"LOG FLUSHED: {datetime.now()}\n")
+                elif record is self._STOP:
+                    # KEEP RECORDS QUEUED AFTER THE STOP FOR close TO WRITE
+                    self._queue.extendleft(reversed(records[position + 1:]))
+                    stop = True
+                    break
+                else:
+                    lines.append("[%s] [%s] %s\n" % record)
+
+            if self.dropped_count != self._reported_dropped_count:
+                dropped = self.dropped_count - self._reported_dropped_count
+                self._reported_dropped_count = self.dropped_count
+                lines.append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [WARNING] "
+                             f"{dropped} log records dropped, the log queue was full\n")
+            self._write_lines(lines)
+
+            # PUSH BUFFERED LINES TO THE FILE WHENEVER THE WRITER CATCHES UP
+            if stop or not self._queue:
+                self._log_file.flush()
+            if stop:
+                self._log_file.close()
+                # RELEASE CALLERS STILL WAITING FOR ROOM, close WRITES WHAT THEY QUEUE
+                with self._room:
+                    self._room.notify_all()
+                return
+
+    def _write_lines(self, lines):
+        if lines:
+            self._log_file.write("".join(lines))